@@ -0,0 +1,118 @@
+"""A local stand-in for Postgres that plugs into the real ``Database`` class.
+
+Only the connection is replaced, so ``Database.execute`` (including its
+per-call ping and commit) and all the worker branches run unmodified.
+``SELECT * FROM <table>`` returns seeded rows; everything else is recorded.
+"""
+from __future__ import annotations
+
+import re
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from Utilities.Database import Database
+
+if TYPE_CHECKING:
+    from Classes import StaffPartyBot
+################################################################################
+
+__all__ = ("StandInDatabase", )
+
+Row = Tuple[Any, ...]
+
+_SELECT_ALL = re.compile(r"^\s*SELECT \* FROM (\w+)", re.IGNORECASE)
+
+################################################################################
+class _StandInCursor:
+
+    def __init__(self, owner: StandInDatabase) -> None:
+
+        self._owner: StandInDatabase = owner
+        self._result: List[Row] = []
+
+    def execute(self, query: str, args: Tuple[Any, ...] = ()) -> None:
+
+        owner = self._owner
+        op = query.lstrip().split(" ", 1)[0].upper()
+        owner.statements[op] += 1
+
+        if owner.latency:
+            # psycopg2 blocks the event loop, so this does too.
+            time.sleep(owner.latency)
+
+        match = _SELECT_ALL.match(query)
+        if match:
+            self._result = list(owner.tables.get(match.group(1), []))
+        elif op == "SELECT":
+            self._result = [(1,)]
+        else:
+            self._result = []
+
+    def fetchall(self) -> List[Row]:
+
+        return self._result
+
+    def fetchone(self) -> Optional[Row]:
+
+        return self._result[0] if self._result else None
+
+    def close(self) -> None:
+
+        pass
+
+################################################################################
+class _StandInConnection:
+
+    def __init__(self, owner: StandInDatabase) -> None:
+
+        self._owner: StandInDatabase = owner
+
+    def cursor(self) -> _StandInCursor:
+
+        return _StandInCursor(self._owner)
+
+    def commit(self) -> None:
+
+        self._owner.statements["COMMIT"] += 1
+
+    def rollback(self) -> None:
+
+        self._owner.statements["ROLLBACK"] += 1
+
+    def close(self) -> None:
+
+        pass
+
+################################################################################
+class StandInDatabase(Database):
+
+    __slots__ = (
+        "tables",
+        "latency",
+        "statements",
+    )
+
+################################################################################
+    def __init__(
+        self,
+        bot: StaffPartyBot,
+        tables: Optional[Dict[str, List[Row]]] = None,
+        latency: float = 0.0
+    ) -> None:
+
+        super().__init__(bot)
+
+        self.tables: Dict[str, List[Row]] = tables or {}
+        self.latency: float = latency
+        self.statements: Counter = Counter()
+
+################################################################################
+    def _connect(self) -> None:
+
+        self._reset_connection()
+
+        self._connection = _StandInConnection(self)  # type: ignore
+        self._cursor = self._connection.cursor()  # type: ignore
+
+################################################################################
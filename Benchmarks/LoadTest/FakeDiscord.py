@@ -0,0 +1,560 @@
+"""In-memory stand-ins for the parts of the Discord API the managers touch.
+
+Every call that would hit Discord's REST API goes through ``FakeREST``, which
+counts it per route and applies per-bucket and global rate limits. Waits are
+reported through pycord's own ``discord.http`` warning so the bot's metrics
+hook sees them exactly as it would in production.
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import pytz
+from discord import HTTPException, NotFound
+from discord.ui import View
+################################################################################
+
+__all__ = (
+    "FakeREST",
+    "FakeUser",
+    "FakeMember",
+    "FakeRole",
+    "FakeMessage",
+    "FakeChannel",
+    "FakeThread",
+    "FakeForumChannel",
+    "FakeGuild",
+    "FakeInteraction",
+    "snowflakes",
+)
+
+# A shared ID source so nothing ever collides.
+snowflakes = itertools.count(10 ** 17)
+
+_http_log = logging.getLogger("discord.http")
+
+################################################################################
+class _FakeResponse:
+    """Just enough of aiohttp's response for ``NotFound`` to be raised."""
+
+    status = 404
+    reason = "Not Found"
+
+################################################################################
+class _FakeBadRequest:
+
+    status = 400
+    reason = "Bad Request"
+
+################################################################################
+def not_found(what: str) -> NotFound:
+
+    return NotFound(_FakeResponse(), {"code": 10003, "message": f"Unknown {what}"})  # type: ignore
+
+################################################################################
+def thread_archived() -> HTTPException:
+
+    return HTTPException(_FakeBadRequest(), {"code": 50083, "message": "Thread is archived"})  # type: ignore
+
+################################################################################
+class FakeREST:
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        time_scale: float = 0.01,
+        bucket_size: int = 5,
+        bucket_window: float = 5.0,
+        global_limit: int = 50,
+    ) -> None:
+
+        self.latency: float = latency
+        self.time_scale: float = time_scale
+        self.bucket_size: int = bucket_size
+        self.bucket_window: float = bucket_window
+        self.global_limit: int = global_limit
+
+        self.calls: Counter = Counter()
+        self.rate_limited: int = 0
+        self.rate_limit_wait: float = 0.0
+
+        # bucket -> (remaining, reset_at)
+        self._buckets: Dict[str, Tuple[int, float]] = {}
+
+################################################################################
+    def reset_counters(self) -> None:
+
+        self.calls.clear()
+        self.rate_limited = 0
+        self.rate_limit_wait = 0.0
+
+################################################################################
+    def _take(self, bucket: str, size: int, window: float) -> float:
+        """Takes a token from ``bucket``; returns how long to wait if empty."""
+
+        now = asyncio.get_running_loop().time()
+        remaining, reset_at = self._buckets.get(bucket, (size, now + window))
+        if now >= reset_at:
+            remaining, reset_at = size, now + window
+
+        if remaining <= 0:
+            return reset_at - now
+
+        self._buckets[bucket] = (remaining - 1, reset_at)
+        return 0.0
+
+################################################################################
+    async def request(self, route: str, bucket: Optional[str] = None) -> None:
+
+        self.calls[route] += 1
+
+        while True:
+            wait = self._take("global", self.global_limit, self.time_scale)
+            if not wait and bucket is not None:
+                wait = self._take(bucket, self.bucket_size, self.bucket_window * self.time_scale)
+            if not wait:
+                break
+
+            self.rate_limited += 1
+            self.rate_limit_wait += wait / self.time_scale
+            _http_log.warning(
+                "We are being rate limited. Retrying in %.2f seconds."
+                ' Handled under the bucket "%s"',
+                wait / self.time_scale,
+                bucket or "global",
+            )
+            await asyncio.sleep(wait)
+
+        if self.latency:
+            await asyncio.sleep(self.latency * self.time_scale)
+
+################################################################################
+class _Asset:
+
+    def __init__(self, url: str) -> None:
+
+        self.url: str = url
+
+################################################################################
+class FakeUser:
+
+    def __init__(self, rest: FakeREST, user_id: Optional[int] = None, name: Optional[str] = None):
+
+        self._rest: FakeREST = rest
+
+        self.id: int = user_id or next(snowflakes)
+        self.name: str = name or f"user{self.id % 100000}"
+        self.global_name: str = self.name
+        self.display_name: str = self.name
+        self.bot: bool = False
+        self.display_avatar: _Asset = _Asset(f"https://cdn.example/avatars/{self.id}.png")
+        self.avatar: _Asset = self.display_avatar
+
+    def __eq__(self, other: Any) -> bool:
+        return getattr(other, "id", None) == self.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    @property
+    def mention(self) -> str:
+        return f"<@{self.id}>"
+
+    async def send(self, *args, **kwargs) -> FakeMessage:
+        await self._rest.request("POST /users/@me/channels", f"dm:{self.id}")
+        await self._rest.request("POST /channels/{dm}/messages", f"dm:{self.id}")
+        return FakeMessage(self._rest, FakeChannel(self._rest, name="dm"), author=None)
+
+################################################################################
+class FakeRole:
+
+    def __init__(self, guild: FakeGuild, name: str) -> None:
+
+        self.id: int = next(snowflakes)
+        self.guild: FakeGuild = guild
+        self.name: str = name
+
+    @property
+    def mention(self) -> str:
+        return f"<@&{self.id}>"
+
+################################################################################
+class FakeMember(FakeUser):
+
+    def __init__(self, rest: FakeREST, guild: FakeGuild, **kwargs) -> None:
+
+        super().__init__(rest, **kwargs)
+
+        self.guild: FakeGuild = guild
+        self.roles: List[FakeRole] = []
+
+    async def add_roles(self, *roles: FakeRole, **_) -> None:
+        for role in roles:
+            await self._rest.request("PUT /guilds/{g}/members/{m}/roles/{r}", f"roles:{self.guild.id}")
+            if role not in self.roles:
+                self.roles.append(role)
+
+    async def remove_roles(self, *roles: FakeRole, **_) -> None:
+        for role in roles:
+            await self._rest.request("DELETE /guilds/{g}/members/{m}/roles/{r}", f"roles:{self.guild.id}")
+            if role in self.roles:
+                self.roles.remove(role)
+
+################################################################################
+class FakeMessage:
+
+    def __init__(
+        self,
+        rest: FakeREST,
+        channel: FakeChannel,
+        author: Optional[FakeUser],
+        **kwargs
+    ) -> None:
+
+        self._rest: FakeREST = rest
+
+        self.id: int = next(snowflakes)
+        self.channel: FakeChannel = channel
+        self.author: Optional[FakeUser] = author
+        self.content: Optional[str] = kwargs.get("content")
+        self.embeds: List[Any] = list(kwargs.get("embeds") or ([kwargs["embed"]] if kwargs.get("embed") else []))
+        self.attachments: List[Any] = []
+        self.components: Any = self._render(kwargs.get("view"))
+        self.deleted: bool = False
+
+    @staticmethod
+    def _render(view: Optional[View]) -> Any:
+        return view.to_components() if view is not None else []
+
+    @property
+    def guild(self) -> Optional[FakeGuild]:
+        return getattr(self.channel, "guild", None)
+
+    @property
+    def jump_url(self) -> str:
+        guild_id = self.guild.id if self.guild else "@me"
+        return f"https://discord.com/channels/{guild_id}/{self.channel.id}/{self.id}"
+
+    async def edit(self, **kwargs) -> FakeMessage:
+        await self._rest.request("PATCH /channels/{c}/messages/{m}", f"channel:{self.channel.id}")
+        if self.deleted:
+            raise not_found("Message")
+        if getattr(self.channel, "archived", False):
+            raise thread_archived()
+        if "embeds" in kwargs or "embed" in kwargs:
+            self.embeds = list(kwargs.get("embeds") or [kwargs.get("embed")])
+        if "view" in kwargs:
+            self.components = self._render(kwargs["view"])
+        return self
+
+    async def delete(self, **_) -> None:
+        await self._rest.request("DELETE /channels/{c}/messages/{m}", f"channel:{self.channel.id}")
+        self.deleted = True
+        self.channel._messages.pop(self.id, None)
+
+################################################################################
+class FakeChannel:
+
+    def __init__(self, rest: FakeREST, guild: Optional[FakeGuild] = None, name: str = "channel"):
+
+        self._rest: FakeREST = rest
+
+        self.id: int = next(snowflakes)
+        self.guild: Optional[FakeGuild] = guild
+        self.name: str = name
+        self._messages: Dict[int, FakeMessage] = {}
+
+    @property
+    def mention(self) -> str:
+        return f"<#{self.id}>"
+
+    @property
+    def jump_url(self) -> str:
+        return f"https://discord.com/channels/{self.guild.id if self.guild else '@me'}/{self.id}"
+
+    @property
+    def last_message(self) -> Optional[FakeMessage]:
+        return next(reversed(self._messages.values()), None)
+
+    @property
+    def last_message_id(self) -> Optional[int]:
+        msg = self.last_message
+        return msg.id if msg else None
+
+    def add_message(self, author: Optional[FakeUser], **kwargs) -> FakeMessage:
+        """Seeds a message without going through REST."""
+        msg = FakeMessage(self._rest, self, author, **kwargs)
+        self._messages[msg.id] = msg
+        return msg
+
+    def get_partial_message(self, message_id: int) -> Optional[FakeMessage]:
+        return self._messages.get(message_id)
+
+    async def send(self, content: Optional[str] = None, **kwargs) -> FakeMessage:
+        await self._rest.request("POST /channels/{c}/messages", f"channel:{self.id}")
+        # Posting in an archived thread reopens it.
+        if getattr(self, "archived", False):
+            self.archived = False
+        author = self.guild.me if self.guild else None
+        return self.add_message(author, content=content, **kwargs)
+
+    async def fetch_message(self, message_id: int) -> FakeMessage:
+        await self._rest.request("GET /channels/{c}/messages/{m}", f"channel:{self.id}")
+        try:
+            return self._messages[message_id]
+        except KeyError:
+            raise not_found("Message")
+
+    async def history(self, limit: Optional[int] = 100, **_) -> Iterable[FakeMessage]:
+        await self._rest.request("GET /channels/{c}/messages", f"channel:{self.id}")
+        for msg in list(self._messages.values())[:limit]:
+            yield msg
+
+    async def edit(self, **kwargs) -> FakeChannel:
+        await self._rest.request("PATCH /channels/{c}", f"channel_edit:{self.id}")
+        if "name" in kwargs:
+            self.name = kwargs["name"]
+        return self
+
+################################################################################
+class FakeThread(FakeChannel):
+
+    def __init__(self, rest: FakeREST, parent: FakeForumChannel, name: str):
+
+        super().__init__(rest, parent.guild, name)
+
+        self.parent: FakeForumChannel = parent
+        self.parent_id: int = parent.id
+        self.applied_tags: List[Any] = []
+        self.archived: bool = False
+        self.locked: bool = False
+        self.auto_archive_duration: int = 4320  # minutes
+        self.archive_timestamp: datetime = datetime.now(pytz.utc)
+
+    async def edit(self, **kwargs) -> FakeThread:
+        # Anything but reopening it fails while a thread is archived.
+        if self.archived and kwargs.get("archived", True):
+            await self._rest.request("PATCH /channels/{c}", f"channel_edit:{self.id}")
+            raise thread_archived()
+        await super().edit(**kwargs)
+        if "applied_tags" in kwargs:
+            self.applied_tags = list(kwargs["applied_tags"])
+        if "archived" in kwargs and kwargs["archived"] != self.archived:
+            self.archived = kwargs["archived"]
+            self.archive_timestamp = datetime.now(pytz.utc)
+        return self
+
+    async def delete(self) -> None:
+        await self._rest.request("DELETE /channels/{c}", f"channel_edit:{self.id}")
+        self.parent._threads.remove(self)
+
+################################################################################
+class FakeForumChannel(FakeChannel):
+
+    def __init__(self, rest: FakeREST, guild: FakeGuild, name: str):
+
+        super().__init__(rest, guild, name)
+
+        self._threads: List[FakeThread] = []
+        self.available_tags: List[Any] = []
+
+    @property
+    def threads(self) -> List[FakeThread]:
+        """Active threads only, like the gateway cache."""
+        return [t for t in self._threads if not t.archived]
+
+    async def archived_threads(self, limit: Optional[int] = 50, **_) -> Iterable[FakeThread]:
+        archived = [t for t in self._threads if t.archived][:limit]
+        # Discord pages these 100 at a time.
+        for i in range(0, max(len(archived), 1), 100):
+            await self._rest.request("GET /channels/{c}/threads/archived/public", f"channel:{self.id}")
+            for thread in archived[i:i + 100]:
+                yield thread
+
+    def add_thread(self, name: str, author: Optional[FakeUser] = None, **kwargs) -> FakeThread:
+        """Seeds a thread (and its starter message) without REST."""
+        thread = FakeThread(self._rest, self, name)
+        thread.add_message(author or self.guild.me, **kwargs)
+        self._threads.append(thread)
+        return thread
+
+    def get_tag(self, tag_id: int) -> None:
+        return None
+
+    async def create_thread(self, name: str, content: Optional[str] = None, **kwargs) -> FakeThread:
+        await self._rest.request("POST /channels/{c}/threads", f"channel:{self.id}")
+        kwargs.pop("applied_tags", None)
+        return self.add_thread(name, content=content, **kwargs)
+
+################################################################################
+class FakeGuild:
+
+    def __init__(
+        self,
+        rest: FakeREST,
+        name: str = "Load Test Guild",
+        cache_members: bool = True
+    ) -> None:
+
+        self._rest: FakeREST = rest
+
+        self.id: int = next(snowflakes)
+        self.name: str = name
+        self.me: FakeMember = FakeMember(rest, self, name="StaffPartyBot")
+
+        # Every member exists; only the ``_cached`` ones are visible to
+        # get_member(), as if the guild hadn't been chunked on connect.
+        self.cache_members: bool = cache_members
+        self._members: Dict[int, FakeMember] = {self.me.id: self.me}
+        self._cached: Set[int] = {self.me.id}
+        self._channels: Dict[int, FakeChannel] = {}
+        self._roles: Dict[int, FakeRole] = {}
+
+    @property
+    def members(self) -> List[FakeMember]:
+        return list(self._members.values())
+
+    @property
+    def channels(self) -> List[FakeChannel]:
+        return list(self._channels.values())
+
+    @property
+    def roles(self) -> List[FakeRole]:
+        return list(self._roles.values())
+
+    @property
+    def member_count(self) -> int:
+        return len(self._members)
+
+    def add_member(self, name: Optional[str] = None) -> FakeMember:
+        member = FakeMember(self._rest, self, name=name)
+        self._members[member.id] = member
+        if self.cache_members:
+            self._cached.add(member.id)
+        return member
+
+    def add_role(self, name: str) -> FakeRole:
+        role = FakeRole(self, name)
+        self._roles[role.id] = role
+        return role
+
+    def add_channel(self, name: str, forum: bool = False) -> FakeChannel:
+        cls = FakeForumChannel if forum else FakeChannel
+        channel = cls(self._rest, self, name)
+        self._channels[channel.id] = channel
+        return channel
+
+    def get_member(self, user_id: int) -> Optional[FakeMember]:
+        return self._members.get(user_id) if user_id in self._cached else None
+
+    def get_channel(self, channel_id: int) -> Optional[FakeChannel]:
+        return self._channels.get(channel_id)
+
+    def get_thread(self, thread_id: int) -> Optional[FakeThread]:
+        for channel in self._channels.values():
+            for thread in getattr(channel, "threads", []):
+                if thread.id == thread_id:
+                    return thread
+
+    def find_thread(self, thread_id: int) -> Optional[FakeThread]:
+        """Any thread, archived ones included, as a fetch would find it."""
+        for channel in self._channels.values():
+            for thread in getattr(channel, "_threads", []):
+                if thread.id == thread_id:
+                    return thread
+
+    def get_role(self, role_id: int) -> Optional[FakeRole]:
+        return self._roles.get(role_id)
+
+    async def fetch_member(self, user_id: int) -> FakeMember:
+        await self._rest.request("GET /guilds/{g}/members/{m}", f"guild:{self.id}")
+        try:
+            return self._members[user_id]
+        except KeyError:
+            raise not_found("Member")
+
+    async def query_members(
+        self,
+        query: Optional[str] = None,
+        *,
+        limit: int = 5,
+        user_ids: Optional[List[int]] = None,
+        presences: bool = False,
+        cache: bool = True
+    ) -> List[FakeMember]:
+        # A gateway opcode rather than a REST call, but it's still a round trip.
+        await self._rest.request("GATEWAY REQUEST_GUILD_MEMBERS", "gateway")
+        found = [self._members[u] for u in user_ids or [] if u in self._members][:limit]
+        if cache:
+            self._cached.update(m.id for m in found)
+        return found
+
+    async def fetch_channel(self, channel_id: int) -> FakeChannel:
+        await self._rest.request("GET /channels/{c}", "channel_get")
+        channel = self.get_channel(channel_id) or self.find_thread(channel_id)
+        if channel is None:
+            raise not_found("Channel")
+        return channel
+
+    async def fetch_channels(self) -> List[FakeChannel]:
+        await self._rest.request("GET /guilds/{g}/channels", f"guild:{self.id}")
+        return self.channels
+
+    async def fetch_roles(self) -> List[FakeRole]:
+        await self._rest.request("GET /guilds/{g}/roles", f"guild:{self.id}")
+        return self.roles
+
+    async def _fetch_role(self, role_id: int) -> FakeRole:
+        await self._rest.request("GET /guilds/{g}/roles", f"guild:{self.id}")
+        try:
+            return self._roles[role_id]
+        except KeyError:
+            raise not_found("Role")
+
+################################################################################
+class _Followup:
+
+    def __init__(self, interaction: FakeInteraction) -> None:
+
+        self._interaction: FakeInteraction = interaction
+
+    async def send(self, *args, **kwargs) -> FakeMessage:
+        return await self._interaction.respond(*args, **kwargs)
+
+################################################################################
+class FakeInteraction:
+    """Auto-confirms any confirmation prompt it is asked to show."""
+
+    def __init__(self, rest: FakeREST, guild: FakeGuild, user: FakeMember) -> None:
+
+        self._rest: FakeREST = rest
+
+        self.id: int = next(snowflakes)
+        self.guild: FakeGuild = guild
+        self.guild_id: int = guild.id
+        self.user: FakeMember = user
+        self.message: Optional[FakeMessage] = None
+        self.followup: _Followup = _Followup(self)
+        self._channel: FakeChannel = FakeChannel(rest, guild, "interaction")
+
+    async def respond(self, *args, view: Optional[View] = None, **kwargs) -> FakeMessage:
+        await self._rest.request("POST /interactions/{i}/callback")
+        if view is not None and hasattr(view, "complete"):
+            view.value = True
+            view.complete = True
+            View.stop(view)
+        self.message = self._channel.add_message(self.guild.me, view=view, **kwargs)
+        return self.message
+
+    async def edit(self, **kwargs) -> None:
+        await self._rest.request("PATCH /interactions/{i}/callback")
+
+    async def edit_original_response(self, **kwargs) -> None:
+        await self._rest.request("PATCH /webhooks/{a}/{t}/messages/@original")
+
+################################################################################
@@ -0,0 +1,264 @@
+"""Wires the real ``StaffPartyBot`` to the fake gateway and database, and
+seeds a guild's worth of rows and Discord objects for the scenarios."""
+from __future__ import annotations
+
+import random
+from datetime import datetime, time, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from discord import Intents
+
+from Classes.Bot import StaffPartyBot
+from Classes.Logger import Logger
+from Utilities import RPLevel, RateType, TrainingLevel, VenueForumTag
+from .FakeDatabase import StandInDatabase
+from .FakeDiscord import (
+    FakeREST,
+    FakeGuild,
+    FakeChannel,
+    FakeForumChannel,
+    FakeMember,
+    FakeUser,
+    not_found,
+)
+################################################################################
+
+__all__ = ("LoadTestBot", "SeedConfig", "seed_guild")
+
+Row = Tuple[Any, ...]
+
+################################################################################
+class LoadTestBot(StaffPartyBot):
+    """The production bot class with its Discord and Postgres edges swapped
+    for in-memory fakes."""
+
+    def __init__(
+        self,
+        rest: FakeREST,
+        guild: FakeGuild,
+        tables: Dict[str, List[Row]],
+        db_latency: float = 0.0
+    ) -> None:
+
+        super().__init__(intents=Intents.all())
+
+        self.rest: FakeREST = rest
+        self.fake_guild: FakeGuild = guild
+        self._db = StandInDatabase(self, tables, db_latency)
+
+        # The hard-coded image dump channel from ``load_all``.
+        self.extra_channels: Dict[int, FakeChannel] = {
+            991902526188302427: FakeChannel(rest, None, "img-dump")
+        }
+        self.extra_users: Dict[int, FakeUser] = {
+            Logger.ALYAH: FakeUser(rest, Logger.ALYAH, "alyah")
+        }
+
+################################################################################
+    @property
+    def guilds(self) -> List[FakeGuild]:  # type: ignore
+
+        return [self.fake_guild]
+
+    @property
+    def user(self) -> FakeMember:  # type: ignore
+
+        return self.fake_guild.me
+
+################################################################################
+    def get_channel(self, channel_id: int) -> Optional[FakeChannel]:  # type: ignore
+
+        return (
+            self.fake_guild.get_channel(channel_id)
+            or self.fake_guild.get_thread(channel_id)
+            or self.extra_channels.get(channel_id)
+        )
+
+    async def fetch_channel(self, channel_id: int) -> FakeChannel:  # type: ignore
+
+        await self.rest.request("GET /channels/{c}", "channel_get")
+        if (channel := self.get_channel(channel_id) or self.fake_guild.find_thread(channel_id)) is None:
+            raise not_found("Channel")
+        return channel
+
+    def get_message(self, message_id: int) -> None:  # type: ignore
+
+        # Nothing is in the message cache straight after connecting.
+        return None
+
+################################################################################
+    def get_user(self, user_id: int) -> Optional[FakeUser]:  # type: ignore
+
+        return self.fake_guild.get_member(user_id) or self.extra_users.get(user_id)
+
+    async def fetch_user(self, user_id: int) -> FakeUser:  # type: ignore
+
+        await self.rest.request("GET /users/{u}", "users")
+        user = self.fake_guild._members.get(user_id) or self.extra_users.get(user_id)
+        if user is None:
+            raise not_found("User")
+        return user
+
+################################################################################
+class SeedConfig:
+
+    __slots__ = (
+        "profiles",
+        "venues",
+        "jobs",
+        "positions",
+        "trainer_ratio",
+        "cache_members",
+        "archived",
+    )
+
+    def __init__(
+        self,
+        profiles: int = 500,
+        venues: int = 100,
+        jobs: int = 200,
+        positions: int = 8,
+        trainer_ratio: float = 0.1,
+        cache_members: bool = True,
+        archived: float = 0.0
+    ) -> None:
+
+        self.profiles: int = profiles
+        self.venues: int = venues
+        self.jobs: int = jobs
+        self.positions: int = positions
+        self.trainer_ratio: float = trainer_ratio
+        self.cache_members: bool = cache_members
+        # Share of forum threads that have gone quiet and auto-archived.
+        self.archived: float = archived
+
+################################################################################
+def _id() -> str:
+
+    return uuid4().hex
+
+################################################################################
+def _url(guild: FakeGuild, channel: FakeChannel, message_id: int) -> str:
+
+    return f"https://discord.com/channels/{guild.id}/{channel.id}/{message_id}"
+
+################################################################################
+def seed_guild(rest: FakeREST, cfg: SeedConfig, seed: int = 0) -> Tuple[FakeGuild, Dict[str, List[Row]]]:
+    """Builds a fake guild and the table rows that describe it."""
+
+    rng = random.Random(seed)
+    guild = FakeGuild(rest, cache_members=cfg.cache_members)
+    gid = guild.id
+
+    temp_jobs = guild.add_channel("temp-jobs", forum=True)
+    perm_jobs = guild.add_channel("perm-jobs", forum=True)
+    venues_ch = guild.add_channel("venues", forum=True)
+    profiles_ch = guild.add_channel("profiles", forum=True)
+    log_ch = guild.add_channel("log")
+    services_ch = guild.add_channel("services")
+    welcome_ch = guild.add_channel("welcome")
+    notify_ch = guild.add_channel("announcements")
+    group_ch = guild.add_channel("group-training")
+    signup_ch = guild.add_channel("signups")
+    signup_msg = signup_ch.add_message(guild.me, content="Trainee signups")
+
+    roles = [guild.add_role(f"role{i}") for i in range(8)]
+
+    tables: Dict[str, List[Row]] = {
+        "bot_config": [(gid, None, signup_ch.id, signup_msg.id)],
+        "roles": [(gid, *[r.id for r in roles])],
+        "channels": [(
+            gid, temp_jobs.id, perm_jobs.id, venues_ch.id, profiles_ch.id,
+            log_ch.id, services_ch.id, welcome_ch.id, [notify_ch.id], group_ch.id
+        )],
+    }
+
+    positions = [(_id(), gid, f"Position {i}", None, 0, None, None) for i in range(cfg.positions)]
+    tables["positions"] = positions
+    pos_ids = [p[0] for p in positions]
+
+    tusers, availability, quals, bg_checks, profiles = [], [], [], [], []
+    members: List[FakeMember] = []
+    for i in range(cfg.profiles):
+        member = guild.add_member(name=f"staff{i}")
+        members.append(member)
+        uid = member.id
+
+        tusers.append((uid, gid, None, f"Staff {i}", None, False, None, True, None, True))
+        for day in rng.sample(range(7), 2):
+            availability.append((uid, gid, day, time(18), time(23)))
+        bg_checks.append((
+            uid, True, [f"Staff {i}"], None, None, True, gid, False, False, None,
+            datetime.utcnow(), None, None
+        ))
+        if rng.random() < cfg.trainer_ratio:
+            for pos_id in pos_ids:
+                quals.append((_id(), gid, uid, pos_id, TrainingLevel.Active.value))
+
+        thread = profiles_ch.add_thread(f"Staff {i}")
+        profiles.append((
+            _id(), uid, gid,
+            f"Staff {i}", None, None, [], None,
+            _url(guild, thread, thread.last_message_id),
+            rng.sample(pos_ids, 2), None,
+            [], [], None, None,
+            None, None, None, None, None, None, None, None, None,
+            None, None,
+        ))
+
+    tables.update({
+        "tuser_master": tusers,
+        "availability": availability,
+        "qualifications": quals,
+        "bg_checks": bg_checks,
+        "profile_master": profiles,
+    })
+
+    tag_names = [t.proper_name for t in VenueForumTag]
+    venues, venue_hours = [], []
+    for i in range(cfg.venues):
+        owner = rng.choice(members)
+        thread = venues_ch.add_thread(f"Venue {i}")
+        vid = _id()
+        venues.append((
+            vid, gid, [owner.id], rng.sample(pos_ids, 3), False,
+            _url(guild, thread, thread.last_message_id),
+            f"Venue {i}", [], True, None, None, None, None,
+            None, None, None, None, None, None, None, None,
+            rng.choice(list(RPLevel)).value, rng.random() < 0.5, None,
+            rng.sample(tag_names, 3),
+            None, None, None, None, None,
+        ))
+        for day in rng.sample(range(7), 3):
+            venue_hours.append((vid, gid, day, time(20), time(23, 59), None, None))
+
+    tables.update({"venue_master": venues, "venue_hours": venue_hours})
+
+    jobs = []
+    now = datetime.utcnow()
+    for i in range(cfg.jobs):
+        venue = rng.choice(venues)
+        pos_index = rng.randrange(cfg.positions)
+        pos_name = positions[pos_index][2]
+        thread = next((t for t in temp_jobs.threads if t.name == pos_name), None)
+        if thread is None:
+            thread = temp_jobs.add_thread(pos_name)
+        msg = thread.add_message(guild.me, content=f"Job {i}")
+        jobs.append((
+            _id(), gid, venue[0], venue[2][0], None, pos_ids[pos_index],
+            f"Job {i}", 20, RateType.PerHour.value, None,
+            _url(guild, thread, msg.id),
+            now + timedelta(days=1), now + timedelta(days=1, hours=4),
+            None, None,
+        ))
+
+    tables["job_postings"] = jobs
+
+    for forum in (profiles_ch, venues_ch, temp_jobs):
+        for thread in forum.threads:
+            thread.archived = rng.random() < cfg.archived
+
+    return guild, tables
+
+################################################################################
@@ -0,0 +1,344 @@
+"""Load-test scenarios. Each one boots (or reuses) a seeded bot, runs a
+workload through the real managers and returns a ``ScenarioResult``."""
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from Classes.BulkExecutor import BulkExecutor
+from Classes.DepartureQueue import DepartureQueue
+from Classes.EditCoalescer import EditCoalescer
+from Classes.Jobs.JobPosting import JobPosting
+from Classes.Jobs.PayRate import PayRate
+from Classes.ThreadRegistry import ThreadRegistry
+from Classes.Training.Training import Training
+from Utilities import RateType, metrics
+from .FakeDiscord import FakeREST, FakeInteraction
+from .Harness import LoadTestBot, SeedConfig, seed_guild
+################################################################################
+
+__all__ = ("ScenarioResult", "Options", "SCENARIOS")
+
+################################################################################
+class Options:
+
+    __slots__ = (
+        "seed",
+        "repeat",
+        "storm",
+        "signups",
+        "leaves",
+        "churn",
+        "concurrency",
+        "latency",
+        "time_scale",
+        "db_latency",
+    )
+
+    def __init__(self, **kwargs) -> None:
+
+        self.seed: SeedConfig = kwargs.get("seed") or SeedConfig()
+        self.repeat: int = kwargs.get("repeat", 3)
+        self.storm: int = kwargs.get("storm", 50)
+        self.signups: int = kwargs.get("signups", 200)
+        self.leaves: int = kwargs.get("leaves", 100)
+        self.churn: int = kwargs.get("churn", 5)
+        self.concurrency: int = kwargs.get("concurrency", 25)
+        self.latency: float = kwargs.get("latency", 0.05)
+        self.time_scale: float = kwargs.get("time_scale", 0.01)
+        self.db_latency: float = kwargs.get("db_latency", 0.0)
+
+################################################################################
+class ScenarioResult:
+
+    __slots__ = (
+        "name",
+        "latencies",
+        "wall",
+        "rest_calls",
+        "rate_limited",
+        "rate_limit_wait",
+        "db_statements",
+        "lookups",
+    )
+
+    def __init__(self, name: str) -> None:
+
+        self.name: str = name
+        self.latencies: List[float] = []
+        self.wall: float = 0.0
+        self.rest_calls: Dict[str, int] = {}
+        self.rate_limited: int = 0
+        self.rate_limit_wait: float = 0.0
+        self.db_statements: Dict[str, int] = {}
+        self.lookups: Dict[str, int] = {}
+
+################################################################################
+    def percentile(self, pct: float) -> float:
+
+        if not self.latencies:
+            return 0.0
+
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered) + 0.5) - 1))
+        return ordered[index]
+
+################################################################################
+    @property
+    def throughput(self) -> float:
+
+        return len(self.latencies) / self.wall if self.wall else 0.0
+
+################################################################################
+    def collect(self, bot: LoadTestBot) -> None:
+
+        self.rest_calls = dict(bot.rest.calls)
+        self.rate_limited = bot.rest.rate_limited
+        self.rate_limit_wait = bot.rest.rate_limit_wait
+        self.db_statements = dict(bot.database.statements)  # type: ignore
+        self.lookups = {
+            f"{dict(labels)['kind']}:{dict(labels)['result']}": int(value)
+            for (name, labels), value in metrics._counters.items()
+            if name == "lookups_total"
+        }
+
+################################################################################
+async def _boot(opts: Options, seed: int = 0) -> LoadTestBot:
+
+    rest = FakeREST(latency=opts.latency, time_scale=opts.time_scale)
+    guild, tables = seed_guild(rest, opts.seed, seed)
+    bot = LoadTestBot(rest, guild, tables, opts.db_latency)
+
+    await bot.load_all()
+
+    return bot
+
+################################################################################
+def _reset(bot: LoadTestBot) -> None:
+
+    bot.rest.reset_counters()
+    bot.database.statements.clear()  # type: ignore
+    metrics.reset()
+
+################################################################################
+async def _run(
+    result: ScenarioResult,
+    jobs: List[Callable[[], Awaitable[None]]],
+    concurrency: int
+) -> None:
+    """Runs ``jobs`` with at most ``concurrency`` in flight, timing each."""
+
+    sem = asyncio.Semaphore(concurrency)
+
+    async def timed(job: Callable[[], Awaitable[None]]) -> None:
+        async with sem:
+            start = time.perf_counter()
+            await job()
+            result.latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(timed(j) for j in jobs))
+    result.wall = time.perf_counter() - start
+
+################################################################################
+async def cold_boot(opts: Options) -> ScenarioResult:
+
+    result = ScenarioResult("cold_boot")
+    metrics.reset()
+
+    bot: Optional[LoadTestBot] = None
+    start = time.perf_counter()
+    for i in range(opts.repeat):
+        rest = FakeREST(latency=opts.latency, time_scale=opts.time_scale)
+        guild, tables = seed_guild(rest, opts.seed, i)
+        bot = LoadTestBot(rest, guild, tables, opts.db_latency)
+
+        t0 = time.perf_counter()
+        await bot.load_all()
+        result.latencies.append(time.perf_counter() - t0)
+
+    result.wall = time.perf_counter() - start
+    result.collect(bot)
+
+    return result
+
+################################################################################
+async def job_post_storm(opts: Options) -> ScenarioResult:
+
+    result = ScenarioResult("job_post_storm")
+    bot = await _boot(opts)
+    gdata = bot[bot.fake_guild.id]
+    mgr = gdata.jobs_manager
+    rng = random.Random(1)
+
+    venues = gdata.venue_manager.venues
+    positions = gdata.position_manager.positions
+    now = datetime.utcnow()
+
+    def make_job(i: int) -> Callable[[], Awaitable[None]]:
+        async def job() -> None:
+            venue = rng.choice(venues)
+            user = venue.authorized_users[0]
+            posting = JobPosting.new(mgr, venue, user)
+            mgr._postings.append(posting)
+
+            posting._position = rng.choice(positions)
+            posting._description = f"Storm job {i}"
+            posting._salary = PayRate(posting, 20, RateType.PerHour, None)
+            posting._start = now + timedelta(hours=2)
+            posting._end = now + timedelta(hours=6)
+
+            await posting.create_post(FakeInteraction(bot.rest, bot.fake_guild, user))
+        return job
+
+    _reset(bot)
+    await _run(result, [make_job(i) for i in range(opts.storm)], opts.concurrency)
+    result.collect(bot)
+
+    return result
+
+################################################################################
+async def mass_trainee_signups(opts: Options) -> ScenarioResult:
+
+    result = ScenarioResult("mass_trainee_signups")
+    bot = await _boot(opts)
+    mgr = bot[bot.fake_guild.id].training_manager
+    rng = random.Random(2)
+
+    position_ids = [p.id for p in mgr.guild.position_manager.positions]
+    trainees = [t for t in mgr.tusers if not t.qualifications]
+
+    def make_job(i: int) -> Callable[[], Awaitable[None]]:
+        async def job() -> None:
+            tuser = trainees[i % len(trainees)]
+            await mgr.add_training(Training.new(tuser, rng.choice(position_ids)))
+        return job
+
+    _reset(bot)
+    await _run(result, [make_job(i) for i in range(opts.signups)], opts.concurrency)
+
+    # The signup board edit is debounced; publish it now so it's counted.
+    mgr._message._cancel_pending_edit()
+    await mgr._message.flush()
+
+    result.collect(bot)
+
+    return result
+
+################################################################################
+async def bulk_updates(opts: Options) -> ScenarioResult:
+    """The profile and job posting bulk update commands, confirmed by an
+    admin, one after the other. Items within each run on the bulk executor's
+    worker pool."""
+
+    result = ScenarioResult("bulk_updates")
+    bot = await _boot(opts)
+    gdata = bot[bot.fake_guild.id]
+    admin = bot.fake_guild.members[0]
+
+    def make_job(mgr: Any) -> Callable[[], Awaitable[None]]:
+        async def job() -> None:
+            await mgr.bulk_update(FakeInteraction(bot.rest, bot.fake_guild, admin))
+        return job
+
+    # Pace in Discord time, like everything else the fake REST layer does.
+    pace, unarchive = BulkExecutor.ITEMS_PER_SECOND, ThreadRegistry.UNARCHIVES_PER_SECOND
+    BulkExecutor.ITEMS_PER_SECOND = pace / opts.time_scale
+    ThreadRegistry.UNARCHIVES_PER_SECOND = unarchive / opts.time_scale
+
+    _reset(bot)
+    try:
+        await _run(result, [make_job(gdata.profile_manager), make_job(gdata.jobs_manager)], 1)
+    finally:
+        BulkExecutor.ITEMS_PER_SECOND, ThreadRegistry.UNARCHIVES_PER_SECOND = pace, unarchive
+    result.collect(bot)
+
+    return result
+
+################################################################################
+async def mass_leave(opts: Options) -> ScenarioResult:
+    """A prune: venue managers and other members leave all at once. Each
+    listener call only queues the departure; wall time runs until the last
+    deferred Discord call is done."""
+
+    result = ScenarioResult("mass_leave")
+    bot = await _boot(opts)
+    gdata = bot[bot.fake_guild.id]
+    guild = bot.fake_guild
+    rng = random.Random(4)
+
+    managers = list(gdata.venue_manager.user_index)
+    others = [m.id for m in guild.members[1:] if m.id not in set(managers)]
+    leaving = (managers + rng.sample(others, len(others)))[:opts.leaves]
+    members = [guild._members[user_id] for user_id in leaving if user_id in guild._members]
+
+    def make_job(member: Any) -> Callable[[], Awaitable[None]]:
+        async def job() -> None:
+            guild._members.pop(member.id, None)
+            guild._cached.discard(member.id)
+            await gdata.on_member_leave(member)
+        return job
+
+    window, rate = DepartureQueue.WINDOW, DepartureQueue.CALLS_PER_SECOND
+    DepartureQueue.WINDOW = window * opts.time_scale
+    DepartureQueue.CALLS_PER_SECOND = rate / opts.time_scale
+
+    _reset(bot)
+    start = time.perf_counter()
+    try:
+        await _run(result, [make_job(m) for m in members], opts.concurrency)
+        await gdata.departures.join()
+    finally:
+        DepartureQueue.WINDOW, DepartureQueue.CALLS_PER_SECOND = window, rate
+    result.wall = time.perf_counter() - start
+    result.collect(bot)
+
+    return result
+
+################################################################################
+async def pickup_churn(opts: Options) -> ScenarioResult:
+    """Job postings picked up and dropped several times in quick succession.
+    Every change asks for a post edit; wall time runs until the coalesced
+    edits are out."""
+
+    result = ScenarioResult("pickup_churn")
+    bot = await _boot(opts)
+    gdata = bot[bot.fake_guild.id]
+    rng = random.Random(5)
+
+    postings = [p for p in gdata.jobs_manager.all_postings if p.post_message is not None]
+    tusers = gdata.training_manager.tusers
+
+    def make_job(posting: JobPosting) -> Callable[[], Awaitable[None]]:
+        async def job() -> None:
+            for _ in range(opts.churn):
+                posting.candidate = rng.choice(tusers)
+                await posting.cancel()
+        return job
+
+    _reset(bot)
+    start = time.perf_counter()
+    # The window isn't scaled: it stands for how fast people click, not for
+    # Discord's latency.
+    await _run(result, [make_job(p) for p in postings], opts.concurrency)
+    await gdata.edits.join()
+    result.wall = time.perf_counter() - start
+    result.collect(bot)
+
+    return result
+
+################################################################################
+
+SCENARIOS: Dict[str, Callable[[Options], Awaitable[ScenarioResult]]] = {
+    "cold_boot": cold_boot,
+    "job_post_storm": job_post_storm,
+    "mass_trainee_signups": mass_trainee_signups,
+    "bulk_updates": bulk_updates,
+    "mass_leave": mass_leave,
+    "pickup_churn": pickup_churn,
+}
+
+################################################################################
@@ -0,0 +1,115 @@
+"""Offline load test: drives GuildData and its managers against a fake
+Discord gateway and a local database stand-in.
+
+Run from the repository root:
+
+    python -m Benchmarks.LoadTest [scenario ...] [--profiles N] [--venues N]
+        [--jobs N] [--storm N] [--signups N] [--churn N] [--concurrency N] [--repeat N]
+        [--latency S] [--time-scale F] [--db-latency S] [--cold-member-cache]
+        [--archived F]
+
+With no scenarios given, all of them run. REST latency and rate-limit
+windows are in Discord seconds and are multiplied by ``--time-scale``
+before being slept, so latencies reported here are scaled the same way.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from typing import List
+
+from .Harness import SeedConfig
+from .Scenarios import SCENARIOS, Options, ScenarioResult
+################################################################################
+def parse_args() -> argparse.Namespace:
+
+    parser = argparse.ArgumentParser(prog="python -m Benchmarks.LoadTest")
+    parser.add_argument("scenarios", nargs="*", choices=[[], *SCENARIOS.keys()], default=[])
+    parser.add_argument("--profiles", type=int, default=500)
+    parser.add_argument("--venues", type=int, default=100)
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--storm", type=int, default=50)
+    parser.add_argument("--signups", type=int, default=200)
+    parser.add_argument("--leaves", type=int, default=100)
+    parser.add_argument("--churn", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=25)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--time-scale", type=float, default=0.01)
+    parser.add_argument("--db-latency", type=float, default=0.0)
+    parser.add_argument(
+        "--archived",
+        type=float,
+        default=0.0,
+        help="share of forum threads seeded as auto-archived"
+    )
+    parser.add_argument(
+        "--cold-member-cache",
+        action="store_true",
+        help="start with no members cached, as if the guild wasn't chunked"
+    )
+
+    return parser.parse_args()
+
+################################################################################
+def report(results: List[ScenarioResult]) -> None:
+
+    print()
+    print(
+        f"{'scenario':<22}{'ops':>6}{'wall s':>9}{'ops/s':>9}"
+        f"{'p50 ms':>9}{'p99 ms':>9}{'REST':>8}{'429s':>6}{'DB':>8}"
+    )
+    for r in results:
+        db_total = sum(v for k, v in r.db_statements.items() if k != "COMMIT")
+        print(
+            f"{r.name:<22}{len(r.latencies):>6}{r.wall:>9.2f}{r.throughput:>9.1f}"
+            f"{r.percentile(50) * 1000:>9.1f}{r.percentile(99) * 1000:>9.1f}"
+            f"{sum(r.rest_calls.values()):>8}{r.rate_limited:>6}{db_total:>8}"
+        )
+
+    for r in results:
+        print(f"\n[{r.name}]")
+        print("  REST calls:")
+        for route, count in sorted(r.rest_calls.items(), key=lambda i: -i[1]):
+            print(f"    {count:>7}  {route}")
+        print(f"  429s: {r.rate_limited} ({r.rate_limit_wait:.1f}s of Discord time waiting)")
+        print("  DB statements: " + ", ".join(f"{k}={v}" for k, v in sorted(r.db_statements.items())))
+        print("  Lookups: " + ", ".join(f"{k}={v}" for k, v in sorted(r.lookups.items())))
+
+################################################################################
+async def main() -> None:
+
+    args = parse_args()
+    opts = Options(
+        seed=SeedConfig(
+            args.profiles, args.venues, args.jobs,
+            cache_members=not args.cold_member_cache, archived=args.archived
+        ),
+        repeat=args.repeat,
+        storm=args.storm,
+        signups=args.signups,
+        leaves=args.leaves,
+        churn=args.churn,
+        concurrency=args.concurrency,
+        latency=args.latency,
+        time_scale=args.time_scale,
+        db_latency=args.db_latency,
+    )
+
+    results = []
+    for name in args.scenarios or SCENARIOS.keys():
+        print(f"Running {name}...")
+        results.append(await SCENARIOS[name](opts))
+
+    report(results)
+
+################################################################################
+
+if __name__ == "__main__":
+    # The bot logs every lookup at INFO; keep warnings (which include the
+    # simulated 429s) and above.
+    logging.disable(logging.INFO)
+    asyncio.run(main())
+
+################################################################################
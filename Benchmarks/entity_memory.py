@@ -0,0 +1,131 @@
+"""Memory benchmark for a guild's loaded entity graph.
+
+Seeds the load-test guild (see ``Benchmarks.LoadTest``) with a large staff
+roster, fills the profile rows with the kind of values real ones carry -
+job lists, free-text fields, pronouns, data centers - and measures what
+the bot holds once ``load_all`` is done and the rows are dropped, by
+source file and per profile. The fake gateway's guild and members are part
+of the total.
+
+Run from the repository root:
+
+    python -m Benchmarks.entity_memory [--profiles N] [--venues N] [--top N]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import logging
+import random
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+from Utilities import Clan, Gender, GlobalDataCenter, Pronoun, Race
+from .LoadTest.FakeDiscord import FakeREST
+from .LoadTest.Harness import LoadTestBot, SeedConfig, seed_guild
+################################################################################
+
+JOBS = (
+    "Bartender", "Dancer", "Greeter", "Courtesan", "Gamba Dealer", "DJ",
+    "Photographer", "Security", "Host", "Bard", "Shout Runner", "Manager",
+)
+RATES = ("Negotiable", "100k/hr", "250k/hr", "500k/hr", "Tips only")
+LIKES = ("Music", "Dancing", "Cocktails", "Roleplay", "Glamour", "Gpose", "Cats")
+
+################################################################################
+def copy(text: str) -> str:
+    """A new str with the same value, as a database driver would return -
+    literals are interned and would hide any duplication."""
+
+    return text.encode().decode()
+
+################################################################################
+def enrich_profiles(rows: List[Tuple[Any, ...]], seed: int = 0) -> List[Tuple[Any, ...]]:
+
+    rng = random.Random(seed)
+    ret = []
+    for row in rows:
+        row = list(row)
+        row[6] = [copy(j) for j in rng.sample(JOBS, 3)]
+        row[7] = copy(rng.choice(RATES))
+        row[11] = [copy(x) for x in rng.sample(LIKES, 2)]
+        row[12] = [copy(x) for x in rng.sample(LIKES, 2)]
+        row[15] = copy(str(rng.choice(list(Gender)).value))
+        row[16] = [copy(str(p.value)) for p in rng.sample(list(Pronoun), 2)]
+        row[17] = copy(str(rng.choice(list(Race)).value))
+        row[18] = copy(str(rng.choice(list(Clan)).value))
+        row[23] = [rng.choice(list(GlobalDataCenter)).value]
+        ret.append(tuple(row))
+
+    return ret
+
+################################################################################
+def by_file(stats: List[tracemalloc.StatisticDiff], root: str) -> Dict[str, int]:
+
+    ret: Dict[str, int] = defaultdict(int)
+    for stat in stats:
+        name = stat.traceback[0].filename
+        ret[name.split(root, 1)[-1] if root in name else name] += stat.size_diff
+
+    return ret
+
+################################################################################
+async def measure(profiles: int, venues: int) -> Tuple[float, int, Dict[str, int]]:
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+
+    rest = FakeREST(latency=0.0, time_scale=0.0)
+    guild, tables = seed_guild(rest, SeedConfig(profiles=profiles, venues=venues, jobs=venues))
+    tables["profile_master"] = enrich_profiles(tables["profile_master"])
+    bot = LoadTestBot(rest, guild, tables, 0.0)
+
+    start = time.perf_counter()
+    await bot.load_all()
+    elapsed = time.perf_counter() - start
+
+    # A driver's rows are garbage once loaded; only what the entities kept
+    # from them should count.
+    for rows in tables.values():
+        rows.clear()
+
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    total = sum(s.size_diff for s in stats)
+
+    return elapsed, total, by_file(stats, "/package/")
+
+################################################################################
+def main() -> None:
+
+    parser = argparse.ArgumentParser(prog="python -m Benchmarks.entity_memory")
+    parser.add_argument("--profiles", type=int, default=50_000)
+    parser.add_argument("--venues", type=int, default=500)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    elapsed, total, files = asyncio.run(measure(args.profiles, args.venues))
+
+    print(
+        f"\n{args.profiles} profiles, {args.venues} venues: loaded in {elapsed:.1f}s, "
+        f"{total / 2 ** 20:.1f} MiB retained ({total / args.profiles:.0f} B per profile)"
+    )
+    print(f"\nRetained by source file:")
+    for name, size in sorted(files.items(), key=lambda i: -i[1])[:args.top]:
+        print(f"  {size / 2 ** 20:>8.2f} MiB  {name}")
+
+################################################################################
+
+if __name__ == "__main__":
+
+    main()
+
+################################################################################
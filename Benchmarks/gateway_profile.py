@@ -0,0 +1,260 @@
+"""Benchmark for the gateway profiles in ``Utilities.GatewayProfile``.
+
+Builds a synthetic guild and an hour of synthetic gateway traffic, then feeds
+the events each profile's intents would let through into pycord's own
+connection state. Each profile runs in a fresh process so RSS is comparable.
+
+Run from the repository root:
+
+    python -m Benchmarks.gateway_profile [--members N] [--tracked F] [--hours H]
+
+Event rates per member per hour are rough estimates for a busy community
+server, not measurements; change ``EVENT_RATES`` to match your own guild.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import random
+import subprocess
+import sys
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import discord
+
+from Utilities import gateway_options, GATEWAY_PROFILES
+################################################################################
+
+# event name -> (intent flag that gates it, events per member per hour)
+EVENT_RATES = {
+    "PRESENCE_UPDATE": ("presences", 2.0),
+    "TYPING_START": ("guild_typing", 0.5),
+    "MESSAGE_CREATE": ("guild_messages", 1.0),
+    "MESSAGE_REACTION_ADD": ("guild_reactions", 0.5),
+    "VOICE_STATE_UPDATE": ("voice_states", 0.05),
+    "GUILD_MEMBER_UPDATE": ("members", 0.02),
+}
+
+# Events this benchmark parses into the cache; the rest are only counted.
+PARSED = {"PRESENCE_UPDATE", "TYPING_START", "MESSAGE_CREATE", "GUILD_MEMBER_UPDATE"}
+
+GUILD_ID = 955933227372122173
+CHANNEL_IDS = [GUILD_ID + 1 + i for i in range(10)]
+NOW = datetime.now(timezone.utc).isoformat()
+
+################################################################################
+def rss_kb() -> int:
+
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+
+    return 0
+
+################################################################################
+def user_payload(user_id: int) -> Dict[str, Any]:
+
+    return {
+        "id": str(user_id),
+        "username": f"user{user_id % 100000}",
+        "global_name": f"User {user_id % 100000}",
+        "discriminator": "0",
+        "avatar": None,
+    }
+
+################################################################################
+def member_payload(user_id: int) -> Dict[str, Any]:
+
+    return {
+        "user": user_payload(user_id),
+        "roles": [],
+        "joined_at": NOW,
+        "deaf": False,
+        "mute": False,
+        "nick": None,
+    }
+
+################################################################################
+def presence_payload(user_id: int) -> Dict[str, Any]:
+
+    return {
+        "guild_id": str(GUILD_ID),
+        "user": {"id": str(user_id)},
+        "status": "online",
+        "client_status": {"desktop": "online"},
+        "activities": [{"name": "FINAL FANTASY XIV", "type": 0}],
+    }
+
+################################################################################
+def guild_payload(member_ids: List[int], presences: bool) -> Dict[str, Any]:
+
+    return {
+        "id": str(GUILD_ID),
+        "name": "Benchmark Guild",
+        "owner_id": str(member_ids[0]),
+        "member_count": len(member_ids),
+        "roles": [{
+            "id": str(GUILD_ID),
+            "name": "@everyone",
+            "permissions": "0",
+            "position": 0,
+            "color": 0,
+            "hoist": False,
+            "managed": False,
+            "mentionable": False,
+        }],
+        "channels": [
+            {"id": str(c), "type": 0, "name": f"channel-{i}", "position": i}
+            for i, c in enumerate(CHANNEL_IDS)
+        ],
+        "members": [member_payload(m) for m in member_ids],
+        "presences": [presence_payload(m) for m in member_ids] if presences else [],
+        "emojis": [],
+        "stickers": [],
+        "threads": [],
+        "features": [],
+    }
+
+################################################################################
+def event_payload(event: str, user_id: int, seq: int) -> Dict[str, Any]:
+
+    channel_id = str(random.choice(CHANNEL_IDS))
+
+    if event == "PRESENCE_UPDATE":
+        return presence_payload(user_id)
+    elif event == "TYPING_START":
+        return {
+            "guild_id": str(GUILD_ID),
+            "channel_id": channel_id,
+            "user_id": str(user_id),
+            "timestamp": 0,
+            "member": member_payload(user_id),
+        }
+    elif event == "MESSAGE_CREATE":
+        return {
+            "id": str(10 ** 18 + seq),
+            "guild_id": str(GUILD_ID),
+            "channel_id": channel_id,
+            "author": user_payload(user_id),
+            "member": {k: v for k, v in member_payload(user_id).items() if k != "user"},
+            "content": "lorem ipsum " * random.randint(1, 20),
+            "timestamp": NOW,
+            "edited_timestamp": None,
+            "tts": False,
+            "mention_everyone": False,
+            "mentions": [],
+            "mention_roles": [],
+            "attachments": [],
+            "embeds": [],
+            "pinned": False,
+            "type": 0,
+        }
+    else:
+        return {"guild_id": str(GUILD_ID), **member_payload(user_id)}
+
+################################################################################
+async def run_profile(profile: str, members: int, tracked: float, hours: float) -> Dict[str, Any]:
+
+    rng = random.Random(0)
+    random.seed(0)
+
+    options = gateway_options(profile)
+    options.pop("trim_member_cache")
+    intents: discord.Intents = options["intents"]
+
+    bot = discord.Bot(**options)
+    state = bot._connection
+    member_ids = [10 ** 17 + i for i in range(members)]
+
+    gc.collect()
+    baseline = rss_kb()
+
+    # Full chunks everyone (with presences) at startup; lean requests only
+    # the tracked users while the guild data loads.
+    if options.get("chunk_guilds_at_startup", intents.members):
+        cached_ids = member_ids
+    else:
+        cached_ids = member_ids[:int(members * tracked)]
+    state._add_guild_from_data(guild_payload(cached_ids, intents.presences))
+
+    delivered: Counter = Counter()
+    seq = 0
+    for event, (flag, rate) in EVENT_RATES.items():
+        if not getattr(intents, flag):
+            continue
+
+        count = int(members * rate * hours)
+        delivered[event] = count
+        if event not in PARSED:
+            continue
+
+        parser = state.parsers[event]
+        for _ in range(count):
+            seq += 1
+            parser(event_payload(event, rng.choice(member_ids), seq))
+
+    # Let any dispatched listeners run.
+    await asyncio.sleep(0)
+    gc.collect()
+
+    guild = bot.get_guild(GUILD_ID)
+    return {
+        "profile": profile,
+        "events": sum(delivered.values()),
+        "by_event": dict(delivered),
+        "members": len(guild.members),
+        "users": len(state._users),
+        "messages": len(state._messages or []),
+        "rss_mb": rss_kb() / 1024,
+        "delta_mb": (rss_kb() - baseline) / 1024,
+    }
+
+################################################################################
+def main(argv: Optional[List[str]] = None) -> None:
+
+    parser = argparse.ArgumentParser(prog="python -m Benchmarks.gateway_profile")
+    parser.add_argument("--members", type=int, default=20000)
+    parser.add_argument("--tracked", type=float, default=0.1, help="fraction of members that are TUsers/profiles/venue managers")
+    parser.add_argument("--hours", type=float, default=1.0)
+    parser.add_argument("--child", choices=GATEWAY_PROFILES, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(asyncio.run(run_profile(args.child, args.members, args.tracked, args.hours))))
+        return
+
+    results = []
+    for profile in ("full", "lean"):
+        out = subprocess.run(
+            [sys.executable, "-m", "Benchmarks.gateway_profile", "--child", profile,
+             "--members", str(args.members), "--tracked", str(args.tracked), "--hours", str(args.hours)],
+            capture_output=True, text=True, check=True
+        )
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    print(
+        f"{args.members} members, {args.tracked:.0%} tracked, {args.hours:g}h of traffic\n"
+    )
+    print(f"{'profile':<8}{'events':>10}{'members':>10}{'users':>9}{'messages':>10}{'RSS MB':>9}{'+MB':>8}")
+    for r in results:
+        print(
+            f"{r['profile']:<8}{r['events']:>10}{r['members']:>10}{r['users']:>9}"
+            f"{r['messages']:>10}{r['rss_mb']:>9.1f}{r['delta_mb']:>8.1f}"
+        )
+
+    print()
+    for r in results:
+        print(f"{r['profile']}: " + ", ".join(f"{k}={v}" for k, v in sorted(r["by_event"].items())))
+
+################################################################################
+
+if __name__ == "__main__":
+
+    main()
+
+################################################################################
@@ -0,0 +1,111 @@
+"""Startup profiler: everything ``main.py`` does before ``bot.run()``.
+
+Runs the import, bot construction and cog loading in a fresh interpreter
+under ``-X importtime`` and reports where the time goes, which heavy optional
+packages were imported, and the resulting RSS.
+
+Run from the repository root:
+
+    python -m Benchmarks.startup_profile [--top N] [--runs N]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+################################################################################
+
+# Packages only some commands need; none of these should load at startup.
+HEAVY = ("pandas", "openpyxl", "flask", "PIL", "requests")
+
+CHILD = """
+import json, os, sys, time
+
+t0 = time.perf_counter()
+from Classes.Bot import StaffPartyBot
+from Utilities import gateway_options
+t1 = time.perf_counter()
+
+bot = StaffPartyBot(description="startup profile", **gateway_options())
+t2 = time.perf_counter()
+
+for filename in os.listdir("Cogs"):
+    if filename.endswith(".py") and filename != "__init__.py":
+        bot.load_extension(f"Cogs.{filename[:-3]}")
+t3 = time.perf_counter()
+
+with open("/proc/self/status") as f:
+    rss = next(int(l.split()[1]) for l in f if l.startswith("VmRSS:"))
+
+print(json.dumps({
+    "import_s": t1 - t0,
+    "construct_s": t2 - t1,
+    "cogs_s": t3 - t2,
+    "rss_mb": rss / 1024,
+    "heavy": [m for m in %r if m in sys.modules],
+}))
+""" % (HEAVY, )
+
+################################################################################
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """(module, self us, cumulative us) for every line of -X importtime."""
+
+    ret = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, self_us, cumulative, name = (p.strip() for p in line.replace("import time:", "|", 1).split("|"))
+        ret.append((name, int(self_us), int(cumulative)))
+
+    return ret
+
+################################################################################
+def run_once() -> Tuple[Dict, List[Tuple[str, int, int]]]:
+
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD],
+        capture_output=True, text=True, check=True
+    )
+
+    return json.loads(out.stdout.strip().splitlines()[-1]), parse_importtime(out.stderr)
+
+################################################################################
+def main() -> None:
+
+    parser = argparse.ArgumentParser(prog="python -m Benchmarks.startup_profile")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--runs", type=int, default=3, help="report the fastest of N runs")
+    args = parser.parse_args()
+
+    runs = [run_once() for _ in range(args.runs)]
+    phases, modules = min(runs, key=lambda r: r[0]["import_s"] + r[0]["construct_s"] + r[0]["cogs_s"])
+    total = phases["import_s"] + phases["construct_s"] + phases["cogs_s"]
+
+    print(f"Startup (fastest of {args.runs}): {total * 1000:.0f} ms, RSS {phases['rss_mb']:.1f} MB")
+    print(f"  import        {phases['import_s'] * 1000:>7.0f} ms")
+    print(f"  construct bot {phases['construct_s'] * 1000:>7.0f} ms")
+    print(f"  load cogs     {phases['cogs_s'] * 1000:>7.0f} ms")
+    print(f"  heavy packages imported: {', '.join(phases['heavy']) or 'none'}")
+
+    by_package: Dict[str, int] = defaultdict(int)
+    for name, self_us, _ in modules:
+        by_package[name.split(".")[0]] += self_us
+
+    print(f"\nBy top-level package (self time):")
+    for name, us in sorted(by_package.items(), key=lambda i: -i[1])[:args.top]:
+        print(f"  {us / 1000:>8.1f} ms  {name}")
+
+    print(f"\nSlowest modules (cumulative):")
+    for name, _, cumulative in sorted(modules, key=lambda m: -m[2])[:args.top]:
+        print(f"  {cumulative / 1000:>8.1f} ms  {name}")
+
+################################################################################
+
+if __name__ == "__main__":
+
+    main()
+
+################################################################################
@@ -0,0 +1,92 @@
+"""Benchmark for internship matching against a large venue directory.
+
+Run from the repository root:
+
+    python -m Benchmarks.venue_matching [num_venues]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from types import SimpleNamespace
+from typing import List
+
+from Classes.Venues.VenueMatcher import VenueMatcher
+from Utilities import RPLevel, NSFWPreference, VenueForumTag
+################################################################################
+
+ALL_TAGS = list(VenueForumTag)
+
+################################################################################
+def fake_venue(i: int) -> SimpleNamespace:
+
+    return SimpleNamespace(
+        id=f"V{i:06d}",
+        post_url=f"https://discord.com/channels/0/0/{i}",
+        rp_level=random.choice(list(RPLevel)),
+        nsfw=random.random() < 0.5,
+        tags=[
+            SimpleNamespace(tag_text=t.proper_name)
+            for t in random.sample(ALL_TAGS, random.randint(0, 5))
+        ],
+    )
+
+################################################################################
+def legacy_routine(venues: List[SimpleNamespace], rp_level, nsfw_pref, tags):
+    """The per-venue loop used before the feature matrix existed."""
+
+    venue_scores = {}
+    for venue in venues:
+        score = 50 - 10 * abs(rp_level.value - venue.rp_level.value)
+        if (nsfw_pref is NSFWPreference.NSFW) == venue.nsfw:
+            score += 30
+        matching_tags = set([t.proper_name.lower() for t in tags]).intersection(
+            set([v.tag_text.lower() for v in venue.tags])
+        )
+        score += (len(matching_tags) / len(tags)) * 20 if tags else 0
+        venue_scores[venue.id] = score
+
+    return sorted(venue_scores.items(), key=lambda x: x[1], reverse=True)[:5]
+
+################################################################################
+def timed(fn, runs: int) -> float:
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - start) / runs * 1000
+
+################################################################################
+def main(num_venues: int = 5000, runs: int = 200) -> None:
+
+    random.seed(0)
+    venues = [fake_venue(i) for i in range(num_venues)]
+
+    matcher = VenueMatcher()
+    start = time.perf_counter()
+    matcher.rebuild(venues)  # type: ignore
+    build_ms = (time.perf_counter() - start) * 1000
+
+    query = (RPLevel.CasualRP, NSFWPreference.SFW, random.sample(ALL_TAGS, 3))
+
+    new = matcher.top_matches(*query)
+    old = legacy_routine(venues, *query)
+    assert [s for _, s in new] == [s for _, s in old], "Score mismatch"
+
+    legacy_ms = timed(lambda: legacy_routine(venues, *query), max(1, runs // 10))
+    matrix_ms = timed(lambda: matcher.top_matches(*query), runs)
+    refresh_ms = timed(lambda: matcher.refresh(random.choice(venues)), runs)  # type: ignore
+
+    print(f"Venues:               {num_venues:,}")
+    print(f"Matrix build:         {build_ms:8.3f} ms")
+    print(f"Legacy match:         {legacy_ms:8.3f} ms/query")
+    print(f"Vectorized match:     {matrix_ms:8.3f} ms/query")
+    print(f"Single venue refresh: {refresh_ms:8.3f} ms")
+
+################################################################################
+if __name__ == "__main__":
+
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
+
+################################################################################
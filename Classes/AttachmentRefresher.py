@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterator, Optional
+
+from discord.http import Route
+
+from Utilities import attachment_urls, log, metrics
+
+if TYPE_CHECKING:
+    from Classes import StaffPartyBot
+################################################################################
+
+__all__ = ("AttachmentRefresher",)
+
+################################################################################
+class AttachmentRefresher:
+    """Keeps the image URLs the bot has stored (profile, service profile and
+    venue images) signed.
+
+    Every pass collects those URLs into ``attachment_urls``, refreshes any
+    that expire within ``MARGIN`` through Discord's batch refresh endpoint,
+    and writes the new URLs back to the database in one statement."""
+
+    __slots__ = (
+        "_state",
+    )
+
+    MARGIN = 6 * 60 * 60  # seconds
+    # The refresh endpoint takes at most 50 URLs per request.
+    BATCH_SIZE = 50
+
+################################################################################
+    def __init__(self, bot: StaffPartyBot):
+
+        self._state: StaffPartyBot = bot
+
+################################################################################
+    def _stored_urls(self) -> Iterator[Optional[str]]:
+
+        for guild in self._state.guild_manager.fguilds:
+            for profile in guild.profile_manager.profiles:
+                yield profile.images.thumbnail
+                yield profile.images.main_image
+                yield from (i.url for i in profile.images.additional)
+
+            for profile in guild.service_manager.profiles:
+                yield profile.images.thumbnail
+                yield profile.images.main_image
+                yield from (i.url for i in profile.images.additional)
+
+            for venue in guild.venue_manager.venues:
+                yield venue.logo_url
+                yield venue.banner_url
+
+################################################################################
+    def collect(self) -> int:
+
+        for url in self._stored_urls():
+            attachment_urls.track(url)
+
+        metrics.set("attachment_urls_tracked", len(attachment_urls))
+        return len(attachment_urls)
+
+################################################################################
+    async def refresh(self) -> int:
+
+        self.collect()
+
+        expiring = attachment_urls.expiring(self.MARGIN)
+        if not expiring:
+            return 0
+
+        log.info("Core", f"Refreshing {len(expiring)} attachment URL(s)...")
+
+        refreshed: Dict[str, str] = {}
+        for i in range(0, len(expiring), self.BATCH_SIZE):
+            batch = expiring[i:i + self.BATCH_SIZE]
+            try:
+                response = await self._state.http.request(
+                    Route("POST", "/attachments/refresh-urls"),
+                    json={"attachment_urls": batch}
+                )
+            except Exception as ex:
+                log.error("Core", f"Failed to refresh {len(batch)} attachment URL(s): {ex}")
+                metrics.inc("attachment_refresh_failures_total")
+                continue
+
+            for pair in response.get("refreshed_urls", []):
+                if pair.get("refreshed") and pair["refreshed"] != pair["original"]:
+                    refreshed[pair["original"]] = pair["refreshed"]
+                    attachment_urls.track(pair["refreshed"])
+
+        metrics.inc("attachment_urls_refreshed_total", len(refreshed))
+
+        if refreshed:
+            self._state.database.update.attachment_urls(refreshed)
+
+        log.info("Core", f"Refreshed {len(refreshed)} attachment URL(s).")
+
+        return len(refreshed)
+
+################################################################################
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
 import os
+import time
 from typing import TYPE_CHECKING, Dict, Any, Optional
 
-from discord import Attachment, Bot, TextChannel, NotFound
+from discord import ApplicationContext, Attachment, AutoShardedBot, Bot, TextChannel, User
 from discord.abc import GuildChannel
 from dotenv import load_dotenv
 
-from Utilities import log
+from Utilities import log, metrics
 from Utilities.Database import Database
+from .AttachmentRefresher import AttachmentRefresher
+from .ChangeFeed import ChangeFeed
+from .ComponentRouter import ComponentRouter
 from .GuildManager import GuildManager
+from .ImagePipeline import ImagePipeline
 from .ReportManager import ReportManager
+from .Resolver import Resolver
 from .Webhooks import FroggeHookManager
 from .XIVVenues import XIVVenuesClient
 from Utilities import Utilities
@@ -20,7 +26,7 @@ if TYPE_CHECKING:
     from Classes import GuildData
 ################################################################################
 
-__all__ = ("StaffPartyBot",)
+__all__ = ("StaffPartyBot", "ShardedStaffPartyBot")
 
 ################################################################################
 class StaffPartyBot(Bot):
@@ -32,11 +38,45 @@ class StaffPartyBot(Bot):
         "_xiv_client",
         "_webhooks",
         "_report_mgr",
+        "_router",
+        "_resolver",
+        "_trim_members",
+        "_images",
+        "_attachments",
+        "_changes",
     )
+    
+    # Which column of each table's rows holds the guild ID. Tables missing
+    # here are matched through their parent's rows.
+    GUILD_COLUMNS = {
+        "bot_config": 0,
+        "roles": 0,
+        "channels": 0,
+        "tusers": 1,
+        "availability": 1,
+        "qualifications": 1,
+        "positions": 1,
+        "requirements": 1,
+        "trainings": 1,
+        "requirement_overrides": 1,
+        "bg_checks": 6,
+        "profiles": 2,
+        "venues": 1,
+        "venue_hours": 1,
+        "job_postings": 1,
+        "hours": 1,
+        "services": 1,
+        "service_profiles": 1,
+        "group_trainings": 1,
+        "bulk_checkpoints": 0,
+    }
 
 ################################################################################
     def __init__(self, *args, **kwargs):
 
+        # Whether to drop cached members nobody's tracking (see gateway_options).
+        self._trim_members: bool = kwargs.pop("trim_member_cache", False)
+
         super().__init__(*args, **kwargs)
 
         self._img_dump: TextChannel = None  # type: ignore
@@ -46,6 +86,11 @@ class StaffPartyBot(Bot):
         self._xiv_client: XIVVenuesClient = XIVVenuesClient(self)
         self._webhooks: FroggeHookManager = FroggeHookManager(self)
         self._report_mgr: ReportManager = ReportManager(self)
+        self._router: ComponentRouter = ComponentRouter(self)
+        self._resolver: Resolver = Resolver()
+        self._images: ImagePipeline = ImagePipeline(self)
+        self._attachments: AttachmentRefresher = AttachmentRefresher(self)
+        self._changes: ChangeFeed = ChangeFeed(self)
 
 ################################################################################
     def __getitem__(self, guild_id: int) -> GuildData:
@@ -76,6 +121,42 @@ class StaffPartyBot(Bot):
         
         return self._report_mgr
     
+################################################################################
+    @property
+    def component_router(self) -> ComponentRouter:
+        
+        return self._router
+    
+################################################################################
+    @property
+    def image_dump(self) -> TextChannel:
+        
+        return self._img_dump
+    
+################################################################################
+    @property
+    def attachment_refresher(self) -> AttachmentRefresher:
+        
+        return self._attachments
+    
+################################################################################
+    @property
+    def image_pipeline(self) -> ImagePipeline:
+        
+        return self._images
+    
+################################################################################
+    @property
+    def trims_member_cache(self) -> bool:
+        
+        return self._trim_members
+    
+################################################################################
+    @property
+    def change_feed(self) -> ChangeFeed:
+        
+        return self._changes
+    
 ################################################################################
     async def load_all(self) -> None:
 
@@ -99,6 +180,10 @@ class StaffPartyBot(Bot):
         for frogge in self._guild_mgr.fguilds:
             await frogge.load_all(data[frogge.guild_id])
             
+        # Pick up changes other processes make to the same database.
+        if os.getenv("DB_LISTEN") == "True":
+            self._db.listen(self._changes.on_change)
+            
         # Start receiving webhooks.
         # self._webhooks.run()
         # print("Webhooks initialized...")
@@ -129,8 +214,16 @@ class StaffPartyBot(Bot):
             "services": [],
             "service_profiles": [],
             "group_trainings": [],
+            "bulk_checkpoints": [],
         } for g in self.guilds }
         
+        # Rows for guilds another process (or nobody) serves.
+        data = {
+            key: [row for row in rows if row[self.GUILD_COLUMNS[key]] in ret]
+            if key in self.GUILD_COLUMNS else rows
+            for key, rows in data.items()
+        }
+        
         load_dotenv()
         
         ### Bot Config ###
@@ -240,21 +333,32 @@ class StaffPartyBot(Bot):
                 }
             )
             
+        ### Bulk Updates ###
+        for bc in data["bulk_checkpoints"]:
+            ret[bc[0]]["bulk_checkpoints"].append(bc)
+            
         log.info("Core", "Data parsed!")
             
         return ret
     
 ################################################################################
-    async def dump_image(self, image: Attachment) -> str:
-        
-        log.info("Core", "Dumping image to image dump...")
-        
-        file = await image.to_file()
-        post = await self._img_dump.send(file=file)
-        
-        log.info("Core", "Image dumped!")
+    async def invoke_application_command(self, ctx: ApplicationContext) -> None:
+
+        name = ctx.command.qualified_name if ctx.command else "unknown"
+        start = time.perf_counter()
+
+        # pycord handles the command's errors in here, and flags them on ctx.
+        with metrics.attribute(name):
+            await super().invoke_application_command(ctx)
+
+        status = "error" if getattr(ctx, "command_failed", False) else "ok"
+        metrics.inc("commands_total", command=name, status=status)
+        metrics.observe("command_seconds", time.perf_counter() - start, command=name)
+
+################################################################################
+    async def dump_image(self, image: Attachment, max_size: int = ImagePipeline.FULL_SIZE) -> str:
         
-        return post.attachments[0].url
+        return await self._images.ingest(image, max_size)
 
 ################################################################################
     async def get_or_fetch_channel(self, channel_id: int) -> Optional[GuildChannel]:
@@ -262,21 +366,26 @@ class StaffPartyBot(Bot):
         if not channel_id:
             return
         
-        log.info("Core", f"Getting or fetching channel {channel_id}...")
+        return await self._resolver.resolve(
+            "channel", channel_id, self.get_channel, self.fetch_channel
+        )
 
-        ret = self.get_channel(channel_id)
-        if ret is None:
-            try:
-                ret = await self.fetch_channel(channel_id)
-            except NotFound:
-                log.warning("Core", f"Channel {channel_id} not found.")
-            except Exception as ex:
-                log.critical(
-                    "Core",
-                    f"An uncaught exception occurred while fetching channel "
-                    f"{channel_id}: {ex}"
-                )
-            
-        return ret
+################################################################################
+    async def get_or_fetch_user(self, user_id: int, /) -> Optional[User]:
+        
+        if not user_id:
+            return
+        
+        return await self._resolver.resolve(
+            "user", user_id, self.get_user, self.fetch_user
+        )
+
+################################################################################
+class ShardedStaffPartyBot(StaffPartyBot, AutoShardedBot):
+    """``StaffPartyBot`` running some or all of the bot's shards, as set up
+    by ``shard_options``. Each process loads and owns only the guilds on its
+    own shards."""
+
+    __slots__ = ()
 
 ################################################################################
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from discord import Embed, Interaction
+
+from Utilities import Utilities as U, log, metrics
+
+if TYPE_CHECKING:
+    from Classes import GuildData
+################################################################################
+
+__all__ = ("BulkExecutor", "BulkResult")
+
+T = TypeVar("T")
+
+################################################################################
+class BulkResult:
+    """What a bulk run got through, for the summary shown afterwards."""
+
+    __slots__ = (
+        "total",
+        "updated",
+        "resumed",
+        "failures",
+    )
+
+    # How many failures the summary lists by name.
+    MAX_LISTED = 10
+
+################################################################################
+    def __init__(self, total: int, resumed: int) -> None:
+
+        self.total: int = total
+        self.updated: int = 0
+        self.resumed: int = resumed
+        self.failures: List[Tuple[str, Exception]] = []
+
+################################################################################
+    def summary(self, noun: str) -> Embed:
+
+        description = f"Successfully updated {self.updated} {noun}."
+        if self.resumed:
+            description += f"\n*({self.resumed} were already done in an earlier run.)*"
+
+        if self.failures:
+            description += (
+                f"\n\n__**{len(self.failures)} failed:**__\n" +
+                "\n".join(
+                    f"* `{label}`: {type(ex).__name__}: {ex}"[:200]
+                    for label, ex in self.failures[:self.MAX_LISTED]
+                )
+            )
+            if len(self.failures) > self.MAX_LISTED:
+                description += f"\n*...and {len(self.failures) - self.MAX_LISTED} more.*"
+
+        return U.make_embed(
+            title="Bulk Update Complete" if not self.failures else "Bulk Update Finished With Errors",
+            description=description[:4000]
+        )
+
+################################################################################
+class BulkExecutor:
+    """Runs a bulk update over a guild's entities on a small pool of workers.
+
+    Progress is edited into a followup message as the run goes, the IDs of
+    finished entities are checkpointed to the database in batches so a rerun
+    of an interrupted job (a restart mid-run) picks up where it stopped, and
+    failures are collected for the summary instead of aborting the run."""
+
+    __slots__ = (
+        "_guild",
+        "_checkpoints",
+        "_next_start",
+    )
+
+    # Items whose posts share a channel share its rate-limit bucket (5 edits
+    # per 5s), so each bucket's items go to a single worker, one after the
+    # other. All workers share the global 50 requests/s, and an item takes
+    # two or three requests, so item starts are also paced to stay under it.
+    WORKERS = int(os.getenv("BULK_WORKERS", 5))
+    ITEMS_PER_SECOND = 15.0
+    PROGRESS_INTERVAL = 2.0  # seconds
+    CHECKPOINT_BATCH = 20
+
+################################################################################
+    def __init__(self, guild: GuildData) -> None:
+
+        self._guild: GuildData = guild
+        # Job name -> IDs finished by an earlier, interrupted run.
+        self._checkpoints: Dict[str, Set[str]] = {}
+        self._next_start: float = 0.0
+
+################################################################################
+    def _load_all(self, data: List[Tuple[Any, ...]]) -> None:
+
+        for _, job, entity_id in data:
+            self._checkpoints.setdefault(job, set()).add(entity_id)
+
+################################################################################
+    def _save(self, job: str, entity_ids: List[str]) -> None:
+
+        if not entity_ids:
+            return
+
+        self._checkpoints.setdefault(job, set()).update(entity_ids)
+        self._guild.bot.database.insert.bulk_checkpoint(self._guild.guild_id, job, entity_ids)
+        entity_ids.clear()
+
+################################################################################
+    def _clear(self, job: str) -> None:
+
+        if self._checkpoints.pop(job, None) is not None:
+            self._guild.bot.database.delete.bulk_checkpoint(self._guild.guild_id, job)
+
+################################################################################
+    async def _pace(self) -> None:
+
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        self._next_start = start + 1 / self.ITEMS_PER_SECOND
+        if start > now:
+            await asyncio.sleep(start - now)
+
+################################################################################
+    async def run(
+        self,
+        interaction: Interaction,
+        job: str,
+        noun: str,
+        items: Sequence[T],
+        action: Callable[[T], Awaitable[Any]],
+        label: Callable[[T], str],
+        bucket: Optional[Callable[[T], Hashable]] = None
+    ) -> BulkResult:
+        """Awaits ``action`` for every item (by ``.id``) not already
+        checkpointed under ``job``. ``bucket`` gives the channel an item's
+        requests go to when items share channels."""
+
+        done = self._checkpoints.get(job, set())
+        todo = [item for item in items if item.id not in done]  # type: ignore
+        result = BulkResult(len(items), len(items) - len(todo))
+
+        groups: Dict[Hashable, List[T]] = {}
+        for item in todo:
+            key = bucket(item) if bucket is not None else item.id  # type: ignore
+            groups.setdefault(key, []).append(item)
+
+        log.info(
+            "Core",
+            f"Bulk job '{job}': {len(todo)} to update, {result.resumed} resumed from checkpoint."
+        )
+
+        def progress() -> str:
+            finished = result.resumed + result.updated + len(result.failures)
+            text = f"Updating {noun}... **{finished}/{result.total}**"
+            if result.failures:
+                text += f" ({len(result.failures)} failed)"
+            return text
+
+        msg = await interaction.followup.send(progress())
+
+        # Biggest buckets first, so a long one doesn't start last.
+        queue: asyncio.Queue = asyncio.Queue()
+        for group in sorted(groups.values(), key=len, reverse=True):
+            queue.put_nowait(group)
+
+        pending: List[str] = []
+
+        async def worker() -> None:
+            while not queue.empty():
+                for item in queue.get_nowait():
+                    await self._pace()
+                    try:
+                        await action(item)
+                    except Exception as ex:
+                        log.error("Core", f"Bulk job '{job}' failed on {label(item)}: {ex}")
+                        metrics.inc("bulk_items_total", job=job, result="failed")
+                        result.failures.append((label(item), ex))
+                    else:
+                        metrics.inc("bulk_items_total", job=job, result="updated")
+                        result.updated += 1
+                        pending.append(item.id)  # type: ignore
+                        if len(pending) >= self.CHECKPOINT_BATCH:
+                            self._save(job, pending)
+
+        async def reporter() -> None:
+            shown = progress()
+            while True:
+                await asyncio.sleep(self.PROGRESS_INTERVAL)
+                if (text := progress()) != shown:
+                    shown = text
+                    try:
+                        await msg.edit(content=text)
+                    except Exception as ex:
+                        log.warning("Core", f"Couldn't update bulk progress message: {ex}")
+
+        start = time.perf_counter()
+        progress_task = asyncio.create_task(reporter())
+        try:
+            await asyncio.gather(*(worker() for _ in range(min(self.WORKERS, len(groups)))))
+        except BaseException:
+            # Cancelled or crashed - keep what got done for the rerun.
+            self._save(job, pending)
+            raise
+        finally:
+            progress_task.cancel()
+
+        # Finished, failures and all - the next run starts from scratch.
+        self._clear(job)
+
+        metrics.observe("bulk_job_seconds", time.perf_counter() - start, job=job)
+        log.info(
+            "Core",
+            f"Bulk job '{job}' finished: {result.updated} updated, {len(result.failures)} failed."
+        )
+
+        try:
+            await msg.delete()
+        except Exception:
+            pass
+
+        return result
+
+################################################################################
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from Utilities import log, metrics
+
+if TYPE_CHECKING:
+    from Classes import StaffPartyBot
+################################################################################
+
+__all__ = ("ChangeFeed",)
+
+################################################################################
+class ChangeFeed:
+    """Keeps this process's entities in line with changes other processes
+    (a reports or sync worker, or the bot itself when this *is* the worker)
+    make to the database.
+
+    Notifications from ``Database.listen`` are collected for ``DELAY``
+    seconds, so the several rows one save touches become a single reload,
+    then each changed entity is reloaded from its rows and handed to its
+    guild. The guild's managers fold the fresh copy into the live object
+    (or add / drop it), and the event bus takes it from there - indexes,
+    the signup board and so on update as they would for a local change."""
+
+    __slots__ = (
+        "_state",
+        "_pending",
+        "_flush_task",
+    )
+
+    DELAY = 0.5  # seconds
+
+################################################################################
+    def __init__(self, bot: StaffPartyBot) -> None:
+
+        self._state: StaffPartyBot = bot
+
+        # (kind, entity ID) -> guild ID, if the notification had one
+        self._pending: Dict[Tuple[str, str], Optional[int]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._pending)
+
+################################################################################
+    def on_change(self, change: Dict[str, Any]) -> None:
+
+        key = (change["kind"], change["id"])
+        guild_id = int(change["guild"]) if change.get("guild") else None
+        self._pending[key] = guild_id or self._pending.get(key)
+
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+################################################################################
+    async def _flush_later(self) -> None:
+
+        await asyncio.sleep(self.DELAY)
+        self._flush_task = None
+
+        await self.flush()
+
+################################################################################
+    async def flush(self) -> int:
+
+        pending = list(self._pending.items())
+        self._pending.clear()
+
+        for (kind, entity_id), guild_id in pending:
+            try:
+                await self.apply(kind, entity_id, guild_id)
+            except Exception as ex:
+                log.error("Core", f"Couldn't reload {kind} {entity_id} after a remote change: {ex}")
+                metrics.inc("entity_reloads_total", kind=kind, result="failed")
+            else:
+                metrics.inc("entity_reloads_total", kind=kind, result="ok")
+
+        return len(pending)
+
+################################################################################
+    async def apply(self, kind: str, entity_id: str, guild_id: Optional[int] = None) -> None:
+
+        bot = self._state
+        if guild_id is not None and bot.guild_manager[guild_id] is None:
+            # A guild this process doesn't serve.
+            return
+
+        data = bot._parse_data(bot.database.load_entity(kind, entity_id, guild_id))
+
+        for frogge in bot.guild_manager.fguilds:
+            if guild_id is None or frogge.guild_id == guild_id:
+                await frogge.apply_change(kind, entity_id, data[frogge.guild_id])
+
+################################################################################
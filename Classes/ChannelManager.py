@@ -53,6 +53,9 @@ class ChannelManager:
 ################################################################################
     async def _load_all(self, data: Tuple[Any, ...]) -> None:
         
+        # One bulk lookup up front; the per-channel calls below then hit cache.
+        await self._guild.resolve_many("channel", [*data[1:8], *(data[8] or []), data[9]])
+        
         self._temp_job = await self._guild.get_or_fetch_channel(data[1])
         self._perm_job = await self._guild.get_or_fetch_channel(data[2])
         self._venues = await self._guild.get_or_fetch_channel(data[3])
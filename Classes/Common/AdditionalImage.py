@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Optional, Any, Dict, Union
 from discord import Interaction
 
 from UI.Profiles import AdditionalImageCaptionModal
-from Utilities import log
+from Utilities import attachment_urls, log
 
 if TYPE_CHECKING:
     from Classes import ProfileImages, ServiceProfileImages
@@ -55,7 +55,7 @@ class AdditionalImage(ABC):
     @property
     def url(self) -> str:
         
-        return self._url
+        return attachment_urls.fresh(self._url)
     
 ################################################################################
     @property
@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from datetime import time
 from typing import TYPE_CHECKING, List, Type, TypeVar, Any, Tuple, Union
 
-from Utilities import Utilities as U, Weekday
+from Utilities import Weekday, time_tables
 
 if TYPE_CHECKING:
     from Classes import Profile, ServiceProfile, TUser
@@ -22,6 +22,8 @@ class Availability(ABC):
         "_day",
         "_start",
         "_end",
+        "_start_min",
+        "_end_min",
     )
 
 ################################################################################
@@ -39,6 +41,10 @@ class Availability(ABC):
         self._start: time = start
         self._end: time = end
 
+        # Minutes of the week (UTC), for comparisons and timestamp lookups.
+        self._start_min: int = time_tables.minute_of_week(day, start)
+        self._end_min: int = time_tables.minute_of_week(day, end)
+
 ################################################################################
     @classmethod
     @abstractmethod
@@ -93,17 +99,29 @@ class Availability(ABC):
 
         return self._end
 
+################################################################################
+    @property
+    def start_minute(self) -> int:
+
+        return self._start_min
+
+################################################################################
+    @property
+    def end_minute(self) -> int:
+
+        return self._end_min
+
 ################################################################################
     @property
     def start_timestamp(self) -> str:
 
-        return U.format_dt(U.time_to_datetime(self._start), "t")
+        return time_tables.timestamp(self._start_min)
 
 ################################################################################
     @property
     def end_timestamp(self) -> str:
 
-        return U.format_dt(U.time_to_datetime(self._end), "t")
+        return time_tables.timestamp(self._end_min)
 
 ################################################################################
     @staticmethod
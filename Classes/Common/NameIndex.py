@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import unicodedata
+from bisect import bisect_left, insort
+from typing import Dict, Generic, Hashable, Iterable, List, Optional, Set, Tuple, TypeVar
+################################################################################
+
+__all__ = ("NameIndex",)
+
+T = TypeVar("T")
+
+################################################################################
+class NameIndex(Generic[T]):
+    """Case-insensitive exact, prefix and trigram lookups over a guild's
+    entity names, kept current by the owning manager on create, rename and
+    delete.
+
+    ``search()`` ranks whole-name prefixes first, then word prefixes, then
+    trigram similarity, so autocomplete stays well inside Discord's
+    3-second window however large the directory gets."""
+
+    __slots__ = (
+        "_entries",
+        "_exact",
+        "_sorted",
+        "_words",
+        "_grams",
+    )
+
+    # Discord shows at most 25 autocomplete choices.
+    LIMIT = 25
+    # Share of the query's trigrams a name needs for a trigram-only match.
+    MIN_SIMILARITY = 0.4
+
+################################################################################
+    def __init__(self) -> None:
+
+        self._reset()
+
+################################################################################
+    def _reset(self) -> None:
+
+        # Key -> (normalized name, item)
+        self._entries: Dict[Hashable, Tuple[str, T]] = {}
+        self._exact: Dict[str, Hashable] = {}
+
+        # Sorted (normalized name, key) and (word, key) pairs for bisecting.
+        self._sorted: List[Tuple[str, Hashable]] = []
+        self._words: List[Tuple[str, Hashable]] = []
+
+        self._grams: Dict[str, Set[Hashable]] = {}
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._entries)
+
+################################################################################
+    @staticmethod
+    def normalize(name: str) -> str:
+
+        # Accents are folded too, so "cafe" finds "Café".
+        decomposed = unicodedata.normalize("NFKD", name.casefold())
+        return " ".join(
+            "".join(c for c in decomposed if not unicodedata.combining(c)).split()
+        )
+
+################################################################################
+    @staticmethod
+    def _trigrams(text: str) -> Set[str]:
+
+        # Padded per word, so word starts weigh more than word boundaries.
+        grams = set()
+        for word in text.split():
+            padded = f"  {word} "
+            grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+
+        return grams
+
+################################################################################
+    def rebuild(self, entries: Iterable[Tuple[Hashable, str, T]]) -> None:
+
+        self._reset()
+        for key, name, item in entries:
+            self._add(key, self.normalize(name), item, sort=False)
+
+        self._sorted.sort()
+        self._words.sort()
+
+################################################################################
+    def refresh(self, key: Hashable, name: str, item: T) -> None:
+        """Adds ``item`` under ``name``, or re-indexes it if its name changed."""
+
+        normalized = self.normalize(name)
+
+        current = self._entries.get(key)
+        if current is not None:
+            if current[0] == normalized:
+                self._entries[key] = (normalized, item)
+                return
+            self.remove(key)
+
+        self._add(key, normalized, item)
+
+################################################################################
+    def _add(self, key: Hashable, normalized: str, item: T, sort: bool = True) -> None:
+
+        self._entries[key] = (normalized, item)
+        self._exact.setdefault(normalized, key)
+
+        add = insort if sort else list.append
+        add(self._sorted, (normalized, key))
+        for word in set(normalized.split()):
+            add(self._words, (word, key))
+        for gram in self._trigrams(normalized):
+            self._grams.setdefault(gram, set()).add(key)
+
+################################################################################
+    def remove(self, key: Hashable) -> None:
+
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        normalized = entry[0]
+        if self._exact.get(normalized) == key:
+            del self._exact[normalized]
+            # Another entity may share the name.
+            for other, (name, _) in self._entries.items():
+                if name == normalized:
+                    self._exact[normalized] = other
+                    break
+
+        self._discard(self._sorted, (normalized, key))
+        for word in set(normalized.split()):
+            self._discard(self._words, (word, key))
+        for gram in self._trigrams(normalized):
+            keys = self._grams.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._grams[gram]
+
+################################################################################
+    @staticmethod
+    def _discard(pairs: List[Tuple[str, Hashable]], pair: Tuple[str, Hashable]) -> None:
+
+        i = bisect_left(pairs, pair)
+        if i < len(pairs) and pairs[i] == pair:
+            del pairs[i]
+
+################################################################################
+    def get(self, name: str) -> Optional[T]:
+
+        key = self._exact.get(self.normalize(name))
+        return self._entries[key][1] if key is not None else None
+
+################################################################################
+    @staticmethod
+    def _prefixed(pairs: List[Tuple[str, Hashable]], prefix: str) -> Iterable[Hashable]:
+
+        i = bisect_left(pairs, (prefix,))
+        while i < len(pairs) and pairs[i][0].startswith(prefix):
+            yield pairs[i][1]
+            i += 1
+
+################################################################################
+    def search(self, query: str, limit: int = LIMIT) -> List[T]:
+
+        query = self.normalize(query)
+        if not query:
+            return [self._entries[key][1] for _, key in self._sorted[:limit]]
+
+        ranked: List[Hashable] = []
+        seen: Set[Hashable] = set()
+
+        def take(keys: Iterable[Hashable]) -> bool:
+            for k in keys:
+                if k not in seen:
+                    seen.add(k)
+                    ranked.append(k)
+                    if len(ranked) >= limit:
+                        return True
+            return False
+
+        if take(self._prefixed(self._sorted, query)):
+            return [self._entries[k][1] for k in ranked]
+
+        # Every query word has to start a word of the name ("moon" finds
+        # "Blue Moon"); sorting by name keeps the order stable.
+        tokens = query.split()
+        matches = sorted(
+            (
+                key for key in set(self._prefixed(self._words, tokens[0]))
+                if all(
+                    any(w.startswith(t) for w in self._entries[key][0].split())
+                    for t in tokens[1:]
+                )
+            ),
+            key=lambda k: self._entries[k][0]
+        )
+        if take(matches):
+            return [self._entries[k][1] for k in ranked]
+
+        grams = self._trigrams(query)
+        shared: Dict[Hashable, int] = {}
+        for gram in grams:
+            for key in self._grams.get(gram, ()):
+                if key not in seen:
+                    shared[key] = shared.get(key, 0) + 1
+
+        # Rank by how much of the query the name covers, then by how much of
+        # the name the query covers, so short close names beat long ones.
+        scored = []
+        for key, count in shared.items():
+            coverage = count / len(grams)
+            if coverage >= self.MIN_SIMILARITY:
+                name = self._entries[key][0]
+                scored.append((-coverage, -count / len(self._trigrams(name)), name, key))
+
+        take(key for *_, key in sorted(scored))
+
+        return [self._entries[k][1] for k in ranked]
+
+################################################################################
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import Dict, FrozenSet, Generic, Hashable, Iterable, Iterator, List, Tuple, TypeVar
+################################################################################
+
+__all__ = ("UserIndex",)
+
+T = TypeVar("T")
+
+################################################################################
+class UserIndex(Generic[T]):
+    """User ID -> the entities of one kind that user is attached to (the
+    venues they manage, the postings they own, ...), kept current by the
+    owning manager so per-user lookups never scan the whole guild."""
+
+    __slots__ = (
+        "_by_user",
+        "_users",
+    )
+
+################################################################################
+    def __init__(self) -> None:
+
+        self._reset()
+
+################################################################################
+    def _reset(self) -> None:
+
+        # User ID -> {key: item}; dicts keep insertion order and O(1) removal.
+        self._by_user: Dict[int, Dict[Hashable, T]] = {}
+        # Key -> the user IDs it is currently filed under.
+        self._users: Dict[Hashable, FrozenSet[int]] = {}
+
+################################################################################
+    def __getitem__(self, user_id: int) -> List[T]:
+
+        return list(self._by_user.get(user_id, {}).values())
+
+################################################################################
+    def __contains__(self, user_id: int) -> bool:
+
+        return user_id in self._by_user
+
+################################################################################
+    def __iter__(self) -> Iterator[int]:
+
+        return iter(self._by_user)
+
+################################################################################
+    def rebuild(self, entries: Iterable[Tuple[Hashable, Iterable[int], T]]) -> None:
+
+        self._reset()
+        for key, user_ids, item in entries:
+            self.refresh(key, user_ids, item)
+
+################################################################################
+    def refresh(self, key: Hashable, user_ids: Iterable[int], item: T) -> None:
+        """Files ``item`` under exactly ``user_ids``."""
+
+        new = frozenset(u for u in user_ids if u is not None)
+        old = self._users.get(key, frozenset())
+
+        for user_id in old - new:
+            self._drop(user_id, key)
+        for user_id in new:
+            self._by_user.setdefault(user_id, {})[key] = item
+
+        if new:
+            self._users[key] = new
+        else:
+            self._users.pop(key, None)
+
+################################################################################
+    def remove(self, key: Hashable) -> None:
+
+        for user_id in self._users.pop(key, frozenset()):
+            self._drop(user_id, key)
+
+################################################################################
+    def _drop(self, user_id: int, key: Hashable) -> None:
+
+        items = self._by_user.get(user_id)
+        if items is None:
+            return
+
+        items.pop(key, None)
+        if not items:
+            del self._by_user[user_id]
+
+################################################################################
@@ -1,3 +1,5 @@
 from .AdditionalImage import AdditionalImage
 from .Availability import Availability
+from .NameIndex import NameIndex
+from .UserIndex import UserIndex
 ################################################################################
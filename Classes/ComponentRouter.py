@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Awaitable, Callable, List, Optional, Pattern, Tuple
+
+from discord import Interaction, InteractionType
+
+from Utilities import log, metrics, edit_message_helper, dummy_response
+
+if TYPE_CHECKING:
+    from Classes import StaffPartyBot, GuildData
+################################################################################
+
+__all__ = ("ComponentRouter",)
+
+Handler = Callable[[Interaction, "GuildData", str, Optional[str]], Awaitable[bool]]
+
+################################################################################
+class ComponentRouter:
+    """Routes button presses on long-lived posts (venues, profiles, job
+    postings, group trainings and background checks) to the entity they
+    belong to, using only the ``custom_id``.
+
+    Because nothing here depends on a live View, there is nothing to register
+    at startup or whenever a post is edited."""
+
+    __slots__ = (
+        "_state",
+        "_routes",
+    )
+
+################################################################################
+    def __init__(self, bot: StaffPartyBot):
+
+        self._state: StaffPartyBot = bot
+
+        # (pattern, handler) - group 1 is always the entity ID, group 2 the
+        # action if the pattern has one. Prefixed patterns go first so the
+        # generic "<id>_<action>" form can't shadow them.
+        self._routes: List[Tuple[Pattern, Handler]] = [
+            (re.compile(r"^venue_mute_(.+)$"), self._venue_mute),
+            (re.compile(r"^mute_user_(.+)$"), self._profile_mute),
+            (re.compile(r"^approve_bg_check_(\d+)$"), self._bg_check_approve),
+            (re.compile(r"^(.+)_(accept|reject|cancel|tentative)$"), self._pickup),
+        ]
+
+################################################################################
+    async def dispatch(self, interaction: Interaction) -> bool:
+
+        if interaction.type != InteractionType.component or interaction.guild_id is None:
+            return False
+
+        custom_id = (interaction.data or {}).get("custom_id")
+        if not custom_id:
+            return False
+
+        for pattern, handler in self._routes:
+            match = pattern.match(custom_id)
+            if match is None:
+                continue
+
+            guild = self._state[interaction.guild_id]
+            if guild is None:
+                return False
+
+            action = match.group(2) if pattern.groups > 1 else None
+            # Labelled by route (and action), not the full custom_id, which
+            # carries an entity ID.
+            name = handler.__name__.lstrip("_") + (f"_{action}" if action else "")
+            with metrics.component(name):
+                if await handler(interaction, guild, match.group(1), action):
+                    return True
+
+                log.warning(
+                    "Core",
+                    f"No entity found for component {custom_id} in guild {interaction.guild_id}."
+                )
+                await dummy_response(interaction)
+            return True
+
+        return False
+
+################################################################################
+    @staticmethod
+    async def _venue_mute(
+        interaction: Interaction, guild: GuildData, venue_id: str, _: Optional[str]
+    ) -> bool:
+
+        venue = guild.venue_manager[venue_id]
+        if venue is None:
+            return False
+
+        tuser = guild.training_manager[interaction.user.id]
+        if tuser is None:
+            await interaction.edit()
+            return True
+
+        await tuser.mute_venue(interaction, venue)
+        return True
+
+################################################################################
+    @staticmethod
+    async def _profile_mute(
+        interaction: Interaction, guild: GuildData, profile_id: str, _: Optional[str]
+    ) -> bool:
+
+        profile = guild.profile_manager.get_profile_by_id(profile_id)
+        if profile is None:
+            return False
+
+        await profile.venue_mute(interaction)
+        return True
+
+################################################################################
+    @staticmethod
+    async def _bg_check_approve(
+        interaction: Interaction, guild: GuildData, user_id: str, _: Optional[str]
+    ) -> bool:
+
+        tuser = guild.training_manager[int(user_id)]
+        if tuser is None:
+            return False
+
+        await tuser.bg_check.approve(interaction.user)
+        await edit_message_helper(interaction, view=None)
+        return True
+
+################################################################################
+    @staticmethod
+    async def _pickup(
+        interaction: Interaction, guild: GuildData, entity_id: str, action: Optional[str]
+    ) -> bool:
+
+        # Job postings and group trainings share this ID format.
+        posting = guild.jobs_manager.get_posting(entity_id)
+        if posting is not None:
+            if action == "accept":
+                await posting.candidate_accept(interaction)
+            elif action == "reject":
+                await posting.reject(interaction)
+            elif action == "cancel":
+                if posting.candidate is not None and interaction.user == posting.candidate.user:
+                    await posting.cancel(interaction)
+            else:
+                return False
+            return True
+
+        group = guild.training_manager.get_group_training(entity_id)
+        if group is not None:
+            if action == "accept":
+                await group.signup(interaction)
+            elif action == "tentative":
+                await group.tentative_signup(interaction)
+            else:
+                return False
+            await edit_message_helper(interaction, embed=group.status())
+            return True
+
+        return False
+
+################################################################################
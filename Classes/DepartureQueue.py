@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Deque, Dict, Hashable, List, Optional, Set, Tuple
+
+from discord import Member
+
+from Utilities import log, metrics
+
+if TYPE_CHECKING:
+    from Classes import GuildData
+################################################################################
+
+__all__ = ("DepartureQueue", "DepartureBatch", "Departure")
+
+Call = Tuple[str, Callable[[], Awaitable[Any]]]
+# (kind, entity ID) of something a cascade changed, as ``ChangeFeed`` reloads it
+Touched = Tuple[str, Any]
+
+################################################################################
+class Departure:
+    """What one member's leave cascade did, for the audit log."""
+
+    __slots__ = (
+        "member",
+        "jobs_deleted",
+        "jobs_canceled",
+        "venue_deleted",
+        "profile_deleted",
+        "trainings_modified",
+        "trainings_deleted",
+    )
+
+################################################################################
+    def __init__(self, member: Member) -> None:
+
+        self.member: Member = member
+
+        self.jobs_deleted: int = 0
+        self.jobs_canceled: int = 0
+        self.venue_deleted: bool = False
+        self.profile_deleted: bool = False
+        self.trainings_modified: int = 0
+        self.trainings_deleted: int = 0
+
+################################################################################
+class DepartureBatch:
+    """The departures handled together, and the Discord calls their cascades
+    left for the worker."""
+
+    __slots__ = (
+        "departures",
+        "calls",
+        "_keys",
+    )
+
+################################################################################
+    def __init__(self) -> None:
+
+        self.departures: List[Departure] = []
+        self.calls: List[Call] = []
+        # Key -> index of its call
+        self._keys: Dict[Hashable, int] = {}
+
+################################################################################
+    def defer(self, label: str, call: Callable[[], Awaitable[Any]], key: Optional[Hashable] = None) -> None:
+        """Queues ``call`` for after the batch is committed. Calls sharing a
+        ``key`` run once per batch."""
+
+        if key is not None:
+            if key in self._keys:
+                return
+            self._keys[key] = len(self.calls)
+
+        self.calls.append((label, call))
+
+################################################################################
+    def truncate(self, count: int) -> None:
+        """Drops every call deferred after the first ``count`` - those of a
+        cascade that was rolled back."""
+
+        del self.calls[count:]
+        self._keys = {k: i for k, i in self._keys.items() if i < count}
+
+################################################################################
+class DepartureQueue:
+    """Collects a guild's member departures and handles them in batches.
+
+    Leaves arriving within ``WINDOW`` of each other (a prune, a raid, a wave
+    of bans) are cascaded together: every manager's state and database
+    changes for the batch are made in one transaction, the Discord calls
+    they leave behind (post deletions, DMs, edits) go through a single
+    paced worker, and the audit log gets one embed per batch.
+
+    Each member's cascade runs under its own savepoint. One that fails is
+    undone in the database alone, the entities it changed are reloaded, and
+    its Discord calls are dropped; if the whole transaction is rolled back,
+    that happens for every member. Either way the members are queued again,
+    once."""
+
+    __slots__ = (
+        "_guild",
+        "_pending",
+        "_flush_task",
+        "_calls",
+        "_worker",
+        "_next_start",
+        "_retried",
+    )
+
+    WINDOW = 2.0  # seconds
+    # Deferred calls mostly hit different channels and users, so this only
+    # keeps a large batch from eating the global rate limit.
+    CALLS_PER_SECOND = 5.0
+
+################################################################################
+    def __init__(self, guild: GuildData) -> None:
+
+        self._guild: GuildData = guild
+
+        self._pending: Dict[int, Member] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+        self._calls: Deque[Call] = deque()
+        self._worker: Optional[asyncio.Task] = None
+        self._next_start: float = 0.0
+
+        # Members whose departure has been rolled back once already
+        self._retried: Set[int] = set()
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._pending)
+
+################################################################################
+    def enqueue(self, member: Member) -> None:
+
+        self._pending[member.id] = member
+        metrics.inc("member_departures_total")
+
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+################################################################################
+    def discard(self, member_id: int) -> bool:
+        """Drops a pending departure (the member came back before it ran)."""
+
+        return self._pending.pop(member_id, None) is not None
+
+################################################################################
+    async def _flush_later(self) -> None:
+
+        await asyncio.sleep(self.WINDOW)
+        self._flush_task = None
+
+        await self.flush()
+
+################################################################################
+    async def flush(self) -> Optional[DepartureBatch]:
+
+        if not self._pending:
+            return None
+
+        batch = DepartureBatch()
+        members = list(self._pending.values())
+        self._pending.clear()
+
+        log.info("Core", f"Processing {len(members)} member departure(s)...")
+
+        database = self._guild.bot.database
+        failed: List[Member] = []
+        touched: List[Touched] = []
+        committed: List[Touched] = []
+
+        # No awaits in here - the transaction is on the bot's only connection.
+        start = time.perf_counter()
+        try:
+            with database.transaction():
+                for member in members:
+                    mark = len(batch.calls)
+                    try:
+                        with self._guild.events.batch() as changes, database.savepoint():
+                            departure = self._cascade(member, batch)
+                    except Exception as ex:
+                        log.error("Core", f"Departure cascade failed for {member.id}: {ex}")
+                        batch.truncate(mark)
+                        failed.append(member)
+                        touched.extend(self._touched(changes))
+                    else:
+                        batch.departures.append(departure)
+                        committed.extend(self._touched(changes))
+        except Exception as ex:
+            log.error("Core", f"Departure batch rolled back: {ex}")
+            metrics.observe("departure_batch_seconds", time.perf_counter() - start)
+            await self._recover(members, touched + committed)
+            return None
+
+        metrics.observe("departure_batch_seconds", time.perf_counter() - start)
+        self._retried.difference_update(d.member.id for d in batch.departures)
+
+        self._calls.extend(batch.calls)
+        if self._calls and self._worker is None:
+            self._worker = asyncio.create_task(self._drain())
+
+        log.info(
+            "Core",
+            f"Departures committed; {len(batch.calls)} Discord call(s) queued."
+        )
+
+        if batch.departures:
+            await self._guild.log.members_left(batch.departures)
+
+        if failed:
+            await self._recover(failed, touched)
+
+        return batch
+
+################################################################################
+    @staticmethod
+    def _touched(changes: Dict[Tuple[str, Hashable], List[Any]]) -> List[Touched]:
+
+        return [(kind, getattr(entity, "id", key)) for (kind, key), (_, _, entity) in changes.items()]
+
+################################################################################
+    async def _recover(self, members: List[Member], touched: List[Touched]) -> None:
+        """Puts the entities a rolled-back cascade changed back the way the
+        database still has them, then gives the members one more try."""
+
+        feed = self._guild.bot.change_feed
+        # Newest first, so a venue is back before the postings that name it.
+        for kind, entity_id in dict.fromkeys(reversed(touched)):
+            try:
+                await feed.apply(kind, str(entity_id), self._guild.guild_id)
+            except Exception as ex:
+                log.error("Core", f"Couldn't reload {kind} {entity_id} after a rolled-back departure: {ex}")
+
+        for member in members:
+            metrics.inc("member_departures_failed_total")
+            if member.id in self._retried:
+                log.error("Core", f"Giving up on the departure of member {member.id}.")
+                self._retried.discard(member.id)
+            else:
+                self._retried.add(member.id)
+                self._pending[member.id] = member
+
+        if self._pending and self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+################################################################################
+    def _cascade(self, member: Member, batch: DepartureBatch) -> Departure:
+
+        guild = self._guild
+        ret = Departure(member)
+
+        ret.jobs_deleted, ret.jobs_canceled = guild.jobs_manager.on_member_leave(member, batch)
+        ret.venue_deleted = guild.venue_manager.on_member_leave(member, batch)
+        ret.profile_deleted = guild.profile_manager.on_member_leave(member, batch)
+        ret.trainings_modified, ret.trainings_deleted = guild.training_manager.on_member_leave(member, batch)
+
+        return ret
+
+################################################################################
+    async def _pace(self) -> None:
+
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        self._next_start = start + 1 / self.CALLS_PER_SECOND
+        if start > now:
+            await asyncio.sleep(start - now)
+
+################################################################################
+    async def _drain(self) -> None:
+
+        while self._calls:
+            label, call = self._calls.popleft()
+            await self._pace()
+            try:
+                await call()
+            except Exception as ex:
+                log.warning("Core", f"Departure cleanup failed for {label}: {ex}")
+                metrics.inc("departure_calls_total", result="failed")
+            else:
+                metrics.inc("departure_calls_total", result="ok")
+
+        self._worker = None
+
+################################################################################
+    async def join(self) -> None:
+        """Waits for the pending window and the worker to finish."""
+
+        while self._flush_task is not None or self._worker is not None:
+            await (self._flush_task or self._worker)
+
+################################################################################
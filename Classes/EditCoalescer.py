@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional
+
+from discord import Message
+
+from Utilities import log, metrics
+
+if TYPE_CHECKING:
+    from Classes import GuildData
+################################################################################
+
+__all__ = ("EditCoalescer",)
+
+Edit = Callable[[], Awaitable[Any]]
+
+################################################################################
+class EditCoalescer:
+    """Collapses edits of the same post requested within ``WINDOW`` seconds
+    into one.
+
+    A request names the post's message and a callable that renders the
+    owner and edits the message - usually its ``_update_post_components``.
+    Nothing is rendered until the window closes, so the single edit that
+    goes out shows the latest state however many requests came in. The
+    "post now" paths use ``flush``, which runs the edit straight away and
+    drops any pending one."""
+
+    __slots__ = (
+        "_guild",
+        "_pending",
+        "_tasks",
+    )
+
+    WINDOW = 2  # seconds
+
+################################################################################
+    def __init__(self, guild: GuildData) -> None:
+
+        self._guild: GuildData = guild
+
+        # Message ID -> latest edit requested for it
+        self._pending: Dict[int, Edit] = {}
+        self._tasks: Dict[int, asyncio.Task] = {}
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._pending)
+
+################################################################################
+    def request(self, message: Optional[Message], edit: Edit) -> None:
+
+        if message is None:
+            return
+
+        if message.id in self._pending:
+            metrics.inc("post_edits_total", result="coalesced")
+        self._pending[message.id] = edit
+
+        if message.id not in self._tasks:
+            self._tasks[message.id] = asyncio.create_task(self._edit_later(message.id))
+
+################################################################################
+    async def _edit_later(self, message_id: int) -> None:
+
+        try:
+            # Requests made while an edit is in flight get a window of their own.
+            while message_id in self._pending:
+                await asyncio.sleep(self.WINDOW)
+                edit = self._pending.pop(message_id, None)
+                if edit is not None:
+                    await self._run(message_id, edit)
+        finally:
+            if self._tasks.get(message_id) is asyncio.current_task():
+                del self._tasks[message_id]
+
+################################################################################
+    def cancel(self, message: Optional[Message]) -> None:
+
+        if message is None:
+            return
+
+        self._pending.pop(message.id, None)
+        task = self._tasks.pop(message.id, None)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
+################################################################################
+    async def flush(self, message: Optional[Message], edit: Optional[Edit] = None) -> Any:
+        """Runs ``edit`` (or the pending one) now, in place of anything
+        pending for ``message``. Returns what the edit returned."""
+
+        if message is None:
+            return None
+
+        edit = edit or self._pending.get(message.id)
+        self.cancel(message)
+
+        if edit is None:
+            return None
+
+        return await self._run(message.id, edit)
+
+################################################################################
+    async def join(self) -> None:
+        """Waits for every pending edit to go out."""
+
+        while self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+################################################################################
+    @staticmethod
+    async def _run(message_id: int, edit: Edit) -> Any:
+
+        metrics.inc("post_edits_total", result="sent")
+        try:
+            return await edit()
+        except Exception as ex:
+            log.error("Core", f"Edit of post message {message_id} failed: {ex}")
+
+################################################################################
@@ -0,0 +1,429 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from Utilities import log, metrics, EntityChange
+
+if TYPE_CHECKING:
+    from Classes import GuildData
+################################################################################
+
+__all__ = ("EventBus", "EntityEvent")
+
+# Field names (shared by every entity of the same shape), and their values.
+Snapshot = Tuple[Tuple[str, ...], Tuple[Any, ...]]
+Diff = Dict[str, Tuple[Any, Any]]
+Handler = Callable[["EntityEvent"], Any]
+
+################################################################################
+class EntityEvent:
+    """One change to one entity, as delivered to subscribers."""
+
+    __slots__ = (
+        "kind",
+        "change",
+        "key",
+        "entity",
+        "diff",
+        "replayed",
+        "remote",
+    )
+
+################################################################################
+    def __init__(
+        self,
+        kind: str,
+        change: EntityChange,
+        key: Hashable,
+        entity: Any,
+        diff: Optional[Diff] = None,
+        replayed: bool = False,
+        remote: bool = False
+    ) -> None:
+
+        self.kind: str = kind
+        self.change: EntityChange = change
+        self.key: Hashable = key
+        self.entity: Any = entity
+        # Field -> (old, new); only filled in for updates.
+        self.diff: Diff = diff or {}
+        self.replayed: bool = replayed
+        # Made by another process and picked up from the database.
+        self.remote: bool = remote
+
+################################################################################
+    def __repr__(self) -> str:
+
+        return f"<EntityEvent {self.kind}:{self.key} {self.change.name} {list(self.diff)}>"
+
+################################################################################
+    def changed(self, *fields: str) -> bool:
+        """Whether any of ``fields`` changed. Always True for creations,
+        deletions and replays, where there's nothing to compare against."""
+
+        if self.change != EntityChange.Updated:
+            return True
+
+        return any(f in self.diff for f in fields)
+
+################################################################################
+    def added(self, field: str) -> List[Any]:
+        """Items in collection ``field`` after an update that weren't before."""
+
+        old, new = self.diff.get(field, ((), ()))
+        return [item for item in (new or ()) if item not in (old or ())]
+
+################################################################################
+    def removed(self, field: str) -> List[Any]:
+
+        old, new = self.diff.get(field, ((), ()))
+        return [item for item in (old or ()) if item not in (new or ())]
+
+################################################################################
+class _Batch:
+
+    __slots__ = (
+        "open",
+        "changes",
+    )
+
+################################################################################
+    def __init__(self) -> None:
+
+        self.open: bool = True
+        # (kind, key) -> [first change, last change, entity]
+        self.changes: Dict[Tuple[str, Hashable], List[Any]] = {}
+
+################################################################################
+class EventBus:
+    """Created / updated / deleted events for a guild's entities, published
+    by their ``update()`` and delete paths and consumed by whatever keeps
+    state derived from them - name and user indexes, the open-hours index,
+    the training signup board, the audit log.
+
+    The bus keeps a shallow snapshot of every entity it has seen (its slots,
+    plus those of components that point back at it through ``_parent``), so
+    an update carries a diff of what actually changed and an ``update()``
+    that changed nothing is not delivered at all. ``replay()`` feeds every
+    known entity to a handler as a creation, which is how indexes rebuild.
+    Handlers run synchronously; a handler that returns a coroutine has it
+    scheduled as a task."""
+
+    __slots__ = (
+        "_guild",
+        "_handlers",
+        "_entities",
+        "_batch",
+    )
+
+    # Slot names per class, collected across the MRO.
+    _SLOTS: Dict[type, Tuple[str, ...]] = {}
+    # (Class, component class per slot) -> snapshot field names
+    _LAYOUTS: Dict[Tuple[type, Tuple[Optional[type], ...]], Tuple[str, ...]] = {}
+
+################################################################################
+    def __init__(self, guild: GuildData) -> None:
+
+        self._guild: GuildData = guild
+
+        self._handlers: Dict[str, List[Handler]] = {}
+        # Kind -> key -> (entity, snapshot)
+        self._entities: Dict[str, Dict[Hashable, Tuple[Any, Snapshot]]] = {}
+        self._batch: ContextVar[Optional[_Batch]] = ContextVar(
+            f"entity_batch_{id(self)}", default=None
+        )
+
+################################################################################
+    def __len__(self) -> int:
+
+        return sum(len(e) for e in self._entities.values())
+
+################################################################################
+    def subscribe(self, kind: str, handler: Handler) -> None:
+
+        self._handlers.setdefault(kind, []).append(handler)
+
+################################################################################
+    def unsubscribe(self, kind: str, handler: Handler) -> None:
+
+        handlers = self._handlers.get(kind, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+################################################################################
+    @classmethod
+    def _slots(cls, klass: type) -> Tuple[str, ...]:
+
+        slots = cls._SLOTS.get(klass)
+        if slots is None:
+            names = []
+            for base in reversed(klass.__mro__):
+                declared = base.__dict__.get("__slots__", ())
+                if isinstance(declared, str):
+                    declared = (declared,)
+                names.extend(s for s in declared if s not in ("__weakref__", "__dict__"))
+            slots = cls._SLOTS[klass] = tuple(dict.fromkeys(names))
+
+        return slots
+
+################################################################################
+    @staticmethod
+    def _freeze(value: Any) -> Any:
+
+        # Collections are copied, so later in-place edits still show up.
+        if isinstance(value, list):
+            return tuple(value)
+        if isinstance(value, set):
+            return frozenset(value)
+        if isinstance(value, dict):
+            return tuple(value.items())
+
+        return value
+
+################################################################################
+    @classmethod
+    def _layout(cls, klass: type, components: Tuple[Optional[type], ...]) -> Tuple[str, ...]:
+
+        layout = cls._LAYOUTS.get((klass, components))
+        if layout is None:
+            names = []
+            for name, component in zip(cls._slots(klass), components):
+                if component is None:
+                    names.append(name)
+                else:
+                    names.extend(f"{name}.{sub}" for sub in cls._slots(component) if sub != "_parent")
+            layout = cls._LAYOUTS[(klass, components)] = tuple(names)
+
+        return layout
+
+################################################################################
+    @classmethod
+    def snapshot(cls, entity: Any) -> Snapshot:
+
+        klass = type(entity)
+        raw = [getattr(entity, name, None) for name in cls._slots(klass)]
+        # A component (details, config, location...) is flattened one level
+        # down, under "component.field".
+        components = tuple(
+            type(value) if getattr(value, "_parent", None) is entity else None
+            for value in raw
+        )
+
+        values = []
+        for value, component in zip(raw, components):
+            if component is None:
+                values.append(cls._freeze(value))
+            else:
+                values.extend(
+                    cls._freeze(getattr(value, sub, None))
+                    for sub in cls._slots(component) if sub != "_parent"
+                )
+
+        # Only the values are kept per entity; the names are shared.
+        return cls._layout(klass, components), tuple(values)
+
+################################################################################
+    @staticmethod
+    def _diff(old: Snapshot, new: Snapshot) -> Diff:
+
+        (old_layout, old_values), (layout, values) = old, new
+        if old_layout is layout:
+            pairs = zip(layout, old_values, values)
+        else:
+            fields = dict(zip(old_layout, old_values))
+            pairs = ((name, fields.get(name), value) for name, value in zip(layout, values))
+
+        ret = {}
+        for name, before, value in pairs:
+            try:
+                same = before is value or before == value
+            except Exception:
+                same = False
+            if not same:
+                ret[name] = (before, value)
+
+        return ret
+
+################################################################################
+    @staticmethod
+    def _key(entity: Any, key: Optional[Hashable]) -> Hashable:
+
+        return key if key is not None else entity.id
+
+################################################################################
+    def load(self, kind: str, entities: Iterable[Any], key: Optional[Callable[[Any], Hashable]] = None) -> None:
+        """Records entities loaded from the database, without publishing."""
+
+        known = self._entities.setdefault(kind, {})
+        for entity in entities:
+            known[key(entity) if key else entity.id] = (entity, self.snapshot(entity))
+
+################################################################################
+    def get(self, kind: str, key: Hashable) -> Optional[Any]:
+
+        entry = self._entities.get(kind, {}).get(key)
+        return entry[0] if entry is not None else None
+
+################################################################################
+    def created(self, kind: str, entity: Any, key: Optional[Hashable] = None, remote: bool = False) -> None:
+
+        self._publish(kind, EntityChange.Created, entity, self._key(entity, key), remote)
+
+################################################################################
+    def updated(self, kind: str, entity: Any, key: Optional[Hashable] = None, remote: bool = False) -> None:
+
+        self._publish(kind, EntityChange.Updated, entity, self._key(entity, key), remote)
+
+################################################################################
+    def deleted(self, kind: str, entity: Any, key: Optional[Hashable] = None, remote: bool = False) -> None:
+
+        self._publish(kind, EntityChange.Deleted, entity, self._key(entity, key), remote)
+
+################################################################################
+    def refresh(self, kind: str, entity: Any, fresh: Any, key: Optional[Hashable] = None) -> None:
+        """Moves the state of ``fresh``, a copy of ``entity`` just reloaded
+        from the database, into ``entity`` (so everything holding a
+        reference to it sees the change), then publishes the update."""
+
+        for name in self._slots(type(entity)):
+            if not hasattr(fresh, name):
+                continue
+            value = getattr(fresh, name)
+            setattr(entity, name, value)
+            # Components and child records were built pointing at the copy.
+            for item in (value if isinstance(value, list) else (value,)):
+                if getattr(item, "_parent", None) is fresh:
+                    item._parent = entity
+
+        self.updated(kind, entity, key, remote=True)
+
+################################################################################
+    def _publish(
+        self,
+        kind: str,
+        change: EntityChange,
+        entity: Any,
+        key: Hashable,
+        remote: bool = False
+    ) -> None:
+
+        batch = self._batch.get()
+        if batch is not None and batch.open and not remote:
+            pending = batch.changes.get((kind, key))
+            if pending is None:
+                batch.changes[(kind, key)] = [change, change, entity]
+            else:
+                pending[1] = change
+                pending[2] = entity
+            return
+
+        self._settle(kind, change, change, entity, key, remote)
+
+################################################################################
+    def _settle(
+        self,
+        kind: str,
+        first: EntityChange,
+        last: EntityChange,
+        entity: Any,
+        key: Hashable,
+        remote: bool = False
+    ) -> None:
+
+        known = self._entities.setdefault(kind, {})
+        previous = known.get(key)
+
+        if last == EntityChange.Deleted:
+            known.pop(key, None)
+            # Created and deleted inside one batch - nobody needs to know.
+            if previous is None and first == EntityChange.Created:
+                return
+            self._dispatch(EntityEvent(kind, EntityChange.Deleted, key, entity, remote=remote))
+            return
+
+        snapshot = self.snapshot(entity)
+        known[key] = (entity, snapshot)
+
+        if previous is None or first == EntityChange.Created:
+            self._dispatch(EntityEvent(kind, EntityChange.Created, key, entity, remote=remote))
+            return
+
+        diff = self._diff(previous[1], snapshot)
+        if diff:
+            self._dispatch(EntityEvent(kind, EntityChange.Updated, key, entity, diff, remote=remote))
+
+################################################################################
+    def _dispatch(self, event: EntityEvent) -> None:
+
+        metrics.inc("entity_events_total", kind=event.kind, change=event.change.name.lower())
+
+        for handler in list(self._handlers.get(event.kind, [])):
+            self._call(handler, event)
+
+################################################################################
+    @staticmethod
+    def _call(handler: Handler, event: EntityEvent) -> None:
+
+        try:
+            result = handler(event)
+        except Exception as ex:
+            log.error("Core", f"Event handler {handler.__qualname__} failed on {event}: {ex}")
+            return
+
+        if inspect.isawaitable(result):
+            asyncio.ensure_future(EventBus._await(handler, event, result))
+
+################################################################################
+    @staticmethod
+    async def _await(handler: Handler, event: EntityEvent, result: Any) -> None:
+
+        try:
+            await result
+        except Exception as ex:
+            log.error("Core", f"Event handler {handler.__qualname__} failed on {event}: {ex}")
+
+################################################################################
+    def replay(self, kind: str, handler: Optional[Handler] = None) -> int:
+        """Feeds every known ``kind`` entity to ``handler`` (or to all of the
+        kind's subscribers) as a creation. Returns how many were sent."""
+
+        handlers = [handler] if handler is not None else list(self._handlers.get(kind, []))
+        entries = list(self._entities.get(kind, {}).items())
+
+        for key, (entity, _) in entries:
+            event = EntityEvent(kind, EntityChange.Created, key, entity, replayed=True)
+            for h in handlers:
+                self._call(h, event)
+
+        return len(entries)
+
+################################################################################
+    @contextmanager
+    def batch(self) -> Iterator[Dict[Tuple[str, Hashable], List[Any]]]:
+        """Holds back this task's events until the block exits, then publishes
+        one per entity: a creation followed by edits is a single creation,
+        and several updates are one update with their combined diff.
+
+        Yields the changes collected so far - (kind, key) -> [first change,
+        last change, entity] - which, for a nested block, are the outer
+        block's."""
+
+        if self._batch.get() is not None and self._batch.get().open:
+            yield self._batch.get().changes
+            return
+
+        batch = _Batch()
+        token = self._batch.set(batch)
+        try:
+            yield batch.changes
+        finally:
+            batch.open = False
+            self._batch.reset(token)
+            for (kind, key), (first, last, entity) in batch.changes.items():
+                self._settle(kind, first, last, entity, key)
+
+################################################################################
@@ -1,22 +1,28 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union, List
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Set, Union, List
 
 import discord.utils
 from discord import Guild, User, Interaction, Message, NotFound, Member, Role
 from discord.abc import GuildChannel
-from discord.ext import tasks
 
+from Classes.BulkExecutor import BulkExecutor
 from Classes.Itinerary.ItineraryManager import ItineraryManager
 from Classes.ChannelManager import ChannelManager
+from Classes.DepartureQueue import DepartureQueue
+from Classes.EditCoalescer import EditCoalescer
+from Classes.EventBus import EventBus
 from Classes.Jobs.JobsManager import JobsManager
 from Classes.Logger import Logger
 from Classes.Positions.PositionManager import PositionManager
+from Classes.Resolver import Resolver
 from Classes.Profiles.ProfileManager import ProfileManager
 from Classes.RoleManager import RoleManager
 from Classes.Services.ServicesManager import ServicesManager
+from Classes.ThreadRegistry import ThreadRegistry
 from Classes.Training.TrainingManager import TrainingManager
 from Classes.Venues.VenueManager import VenueManager
 from UI.Guild import ReportMenuView, BulkUpdateView
@@ -32,23 +38,27 @@ __all__ = ("GuildData",)
 class GuildData:
     """A container for bot-specific guild data and settings."""
 
-    # Can't have slots if we're going to do the member_welcome task as 
-    # the presence of __slots__ will prevent writing to this class.
-    
-    # __slots__ = (
-    #     "_state",
-    #     "_parent",
-    #     "_pos_mgr",
-    #     "_training_mgr",
-    #     "_logger",
-    #     "_profile_mgr",
-    #     "_venue_mgr",
-    #     "_job_mgr",
-    #     "_role_mgr",
-    #     "_channel_mgr",
-    #     "_service_mgr",
-    #     "_itinerary_mgr",
-    # )
+    __slots__ = (
+        "_state",
+        "_parent",
+        "_pos_mgr",
+        "_training_mgr",
+        "_logger",
+        "_profile_mgr",
+        "_venue_mgr",
+        "_job_mgr",
+        "_role_mgr",
+        "_channel_mgr",
+        "_service_mgr",
+        "_itinerary_mgr",
+        "_resolver",
+        "_bulk",
+        "_departures",
+        "_threads",
+        "_events",
+        "_edits",
+        "_welcomes",
+    )
     
     RESTART_TIME = 6  # minutes
 
@@ -58,7 +68,16 @@ class GuildData:
         self._state: StaffPartyBot = bot
         self._parent: Guild = parent
         
+        # Ahead of everything that subscribes to it.
+        self._events: EventBus = EventBus(self)
         self._logger: Logger = Logger(self)
+        self._resolver: Resolver = Resolver()
+        self._bulk: BulkExecutor = BulkExecutor(self)
+        self._departures: DepartureQueue = DepartureQueue(self)
+        self._threads: ThreadRegistry = ThreadRegistry(self)
+        self._edits: EditCoalescer = EditCoalescer(self)
+        # Pending welcome messages, one per member who joined recently
+        self._welcomes: Set[asyncio.Task] = set()
         
         self._pos_mgr: PositionManager = PositionManager(self)
         self._training_mgr: TrainingManager = TrainingManager(self)
@@ -86,9 +105,12 @@ class GuildData:
         await self._profile_mgr._load_all(data)
         await self._job_mgr._load_all(data)
         await self._service_mgr._load_all(data)
+        self._bulk._load_all(data["bulk_checkpoints"])
         
         await self.end_notify_of_bot_restart(msgs)
         
+        self.trim_member_cache()
+        
 ################################################################################
     @property
     def bot(self) -> StaffPartyBot:
@@ -198,35 +220,71 @@ class GuildData:
         await interaction.respond(embed=prompt, view=view)
         await view.wait()
     
+################################################################################
+    @property
+    def resolver(self) -> Resolver:
+        
+        return self._resolver
+    
+################################################################################
+    @property
+    def bulk(self) -> BulkExecutor:
+        
+        return self._bulk
+    
+################################################################################
+    @property
+    def departures(self) -> DepartureQueue:
+        
+        return self._departures
+    
+################################################################################
+    @property
+    def threads(self) -> ThreadRegistry:
+        
+        return self._threads
+
+################################################################################
+    @property
+    def events(self) -> EventBus:
+
+        return self._events
+
+################################################################################
+    @property
+    def edits(self) -> EditCoalescer:
+
+        return self._edits
+
+################################################################################
+    async def apply_change(self, kind: str, entity_id: str, data: Dict[str, Any]) -> None:
+        """Folds an entity another process changed, reloaded as ``data``,
+        into this guild's state. See ``ChangeFeed``."""
+
+        if kind == "venue":
+            await self._venue_mgr.reload(entity_id, data)
+        elif kind == "job_posting":
+            await self._job_mgr.reload(entity_id, data)
+        elif kind == "position":
+            await self._pos_mgr.reload(entity_id, data)
+        elif kind == "profile":
+            await self._profile_mgr.reload(entity_id, data)
+        elif kind == "tuser":
+            await self._training_mgr.reload_tuser(entity_id, data)
+        elif kind == "training":
+            await self._training_mgr.reload_training(entity_id, data)
+        else:
+            log.warning("Core", f"Don't know how to reload a '{kind}'.")
+
 ################################################################################
     async def get_or_fetch_channel(self, channel_id: int) -> Optional[GuildChannel]:
         
         if channel_id is None:
             return
         
-        log.info(
-            "Core",
-            f"Getting or fetching channel {channel_id}..."
+        return await self._resolver.resolve(
+            "channel", channel_id, self._parent.get_channel, self._parent.fetch_channel
         )
-        
-        if channel := self._parent.get_channel(channel_id):
-            log.info("Core", "Channel found in cache.")
-            return channel
-        
-        try:
-            ret = await self._parent.fetch_channel(channel_id)
-        except NotFound:
-            log.warning("Core", f"Channel {channel_id} not found.")
-            return
-        except Exception as ex:
-            log.critical(
-                "Core",
-                f"Error fetching channel {channel_id}: {ex}"
-            )
-            return
-        else:
-            log.info("Core", "Channel fetched from Discord.")
-            return ret
 
 ################################################################################
     async def get_or_fetch_message(self, message_url: Optional[str]) -> Optional[Message]:
@@ -234,36 +292,24 @@ class GuildData:
         if message_url is None:
             return
         
-        log.info(
-            "Core",
-            f"Getting or fetching message {message_url}..."
+        return await self._resolver.resolve(
+            "message",
+            int(message_url.split("/")[-1]),
+            self.bot.get_message,
+            lambda _: self._fetch_message(message_url)
         )
+
+################################################################################
+    async def _fetch_message(self, message_url: str) -> Optional[Message]:
         
         url_parts = message_url.split("/")
         
-        if msg := self.bot.get_message(int(url_parts[-1])):
-            log.info("Core", "Message found in cache.")
-            return msg
-        
         channel = await self.get_or_fetch_channel(int(url_parts[-2]))
         if channel is None:
             log.info("Core", "Message channel not found.")
             return
         
-        try:
-            ret = await channel.fetch_message(int(url_parts[-1]))  # type: ignore
-        except NotFound:
-            log.warning("Core", f"Message {message_url} not found.")
-            return
-        except Exception as ex:
-            log.critical(
-                "Core",
-                f"Error fetching message {message_url}: {ex}"
-            )
-            return
-        else:
-            log.info("Core", "Message fetched from Discord.")
-            return ret
+        return await channel.fetch_message(int(url_parts[-1]))  # type: ignore
 
 ################################################################################
     async def get_or_fetch_user(self, user_id: Optional[int]) -> Optional[Union[Member, User]]:
@@ -271,43 +317,18 @@ class GuildData:
         if user_id is None:
             return
         
-        log.info(
-            "Core",
-            f"Getting or fetching user/member {user_id}..."
+        return await self._resolver.resolve(
+            "user", user_id, self._parent.get_member, self._fetch_member_or_user
         )
-        
-        if user := self._parent.get_member(user_id):
-            log.info("Core", "Member found in cache.")
-            return user
-        
-        try:
-            member = await self._parent.fetch_member(user_id)
-        except NotFound:
-            pass
-        except Exception as ex:
-            log.error(
-                "Core",
-                f"Error fetching member {user_id}: {ex}"
-            )
-            return
-        else:
-            log.info("Core", "Member fetched from Discord.")
-            return member
+    
+################################################################################
+    async def _fetch_member_or_user(self, user_id: int) -> Optional[Union[Member, User]]:
         
         try:
-            ret = await self.bot.get_or_fetch_user(user_id)
+            return await self._parent.fetch_member(user_id)
         except NotFound:
-            log.warning("Core", f"User {user_id} not found.")
-            return
-        except Exception as ex:
-            log.critical(
-                "Core",
-                f"Error fetching user {user_id}: {ex}"
-            )
-            return
-        else:
-            log.info("Core", "User fetched from Discord.")
-            return ret
+            # Not (or no longer) in the guild - fall back to the plain user.
+            return await self.bot.get_or_fetch_user(user_id)
             
 ################################################################################
     async def get_or_fetch_role(self, role_id: Optional[int]) -> Optional[Role]:
@@ -315,55 +336,134 @@ class GuildData:
         if role_id is None:
             return
         
-        log.info("Core", f"Getting or fetching role {role_id}...")
+        return await self._resolver.resolve(
+            "role", role_id, self._parent.get_role, self._parent._fetch_role
+        )
+    
+################################################################################
+    async def resolve_many(self, kind: str, ids: Iterable[Any]) -> Dict[Any, Any]:
+        """Resolves a batch of users, channels or roles by ID, or messages by
+        URL, in as few API calls as possible. Unresolvable entries map to
+        ``None``."""
+        
+        if kind == "user":
+            return await self._resolver.resolve_many(
+                "user",
+                ids,
+                self._parent.get_member,
+                self._fetch_member_or_user,
+                bulk=self._query_members if self.bot.intents.members else None
+            )
+        elif kind == "channel":
+            # Threads aren't listed by fetch_channels(), so anything it
+            # doesn't return still gets fetched by ID.
+            return await self._resolver.resolve_many(
+                "channel",
+                ids,
+                self._parent.get_channel,
+                self._parent.fetch_channel,
+                bulk=self._fetch_all_channels
+            )
+        elif kind == "role":
+            return await self._resolver.resolve_many(
+                "role",
+                ids,
+                self._parent.get_role,
+                self._parent._fetch_role,
+                bulk=self._fetch_all_roles,
+                authoritative=True
+            )
+        elif kind == "message":
+            urls = {int(url.split("/")[-1]): url for url in ids if url}
+            ret = await self._resolver.resolve_many(
+                "message",
+                urls,
+                self.bot.get_message,
+                lambda message_id: self._fetch_message(urls[message_id])
+            )
+            return {urls[message_id]: msg for message_id, msg in ret.items()}
         
-        if role := self._parent.get_role(role_id):
-            log.info("Core", "Role found in cache.")
-            return role
+        raise ValueError(f"Can't resolve objects of kind '{kind}'.")
+    
+################################################################################
+    async def _query_members(self, user_ids: List[int]) -> Dict[int, Member]:
         
-        try:
-            ret = await self._parent._fetch_role(role_id)
-        except NotFound:
-            log.warning("Core", f"Role {role_id} not found.")
-            return
-        except Exception as ex:
-            log.critical(
-                "Core",
-                f"Error fetching role {role_id}: {ex}"
-            )
-            return
-        else:
-            log.info("Core", "Role fetched from Discord.")
-            return ret
+        ret = {}
+        
+        # The gateway takes at most 100 IDs per member request.
+        for i in range(0, len(user_ids), 100):
+            chunk = user_ids[i:i + 100]
+            for member in await self._parent.query_members(user_ids=chunk, limit=len(chunk)):
+                ret[member.id] = member
+                
+        return ret
+    
+################################################################################
+    async def _fetch_all_channels(self, _: List[int]) -> Dict[int, GuildChannel]:
+        
+        return {c.id: c for c in await self._parent.fetch_channels()}
+    
+################################################################################
+    async def _fetch_all_roles(self, _: List[int]) -> Dict[int, Role]:
+        
+        return {r.id: r for r in await self._parent.fetch_roles()}
+    
+################################################################################
+    def tracked_user_ids(self) -> Set[int]:
+        """Users the bot keeps state for - TUsers, profile owners and venue
+        managers."""
+        
+        ret = {t.user_id for t in self._training_mgr.tusers}
+        ret.update(p.user_id for p in self._profile_mgr.profiles)
+        ret.update(self._venue_mgr.user_index)
+        
+        return ret
+    
+################################################################################
+    def trim_member_cache(self) -> int:
+        """Drops cached members outside ``tracked_user_ids()``, keeping anyone
+        who joined in the last hour (they're still being welcomed). Does
+        nothing unless the bot's gateway profile asks for it."""
+        
+        if not self.bot.trims_member_cache:
+            return 0
+        
+        keep = self.tracked_user_ids()
+        keep.add(self.bot.user.id)
+        recent = discord.utils.utcnow() - timedelta(hours=1)
+        
+        stale = [
+            m for m in self._parent.members
+            if m.id not in keep and (m.joined_at is None or m.joined_at < recent)
+        ]
+        for member in stale:
+            self._parent._remove_member(member)
+            
+        if stale:
+            log.info("Core", f"Trimmed {len(stale)} untracked members from the cache.")
+        
+        return len(stale)
     
 ################################################################################
     async def on_member_leave(self, member: Member) -> None:
         
-        jobs_deleted, jobs_canceled = await self.jobs_manager.on_member_leave(member)
-        venue_deleted = await self.venue_manager.on_member_leave(member)
-        profile_deleted = await self.profile_manager.on_member_leave(member)
-        num_modified, num_deleted = await self.training_manager.on_member_leave(member)
-
-        await self.log.member_left(
-            member=member,
-            venue_deleted=venue_deleted,
-            profile_deleted=profile_deleted,
-            trainings_modified=num_modified,
-            trainings_deleted=num_deleted,
-            jobs_deleted=jobs_deleted,
-            jobs_canceled=jobs_canceled
-        )        
+        # Cascaded with any other leaves in the same window.
+        self._departures.enqueue(member)
         
 ################################################################################
     async def on_member_join(self, member: Member) -> None:
         
+        if self._departures.discard(member.id):
+            log.info("Core", f"Member {member.id} rejoined before their departure was processed.")
+        
         log.info("Core", f"Member joined! Sending welcome message in t-minus 60 seconds...")
         
         await self.log.member_join(member)
-        self.member_welcome.start(member)
+        task = asyncio.create_task(self.member_welcome(member))
+        self._welcomes.add(task)
+        task.add_done_callback(self._welcomes.discard)
         
 ################################################################################
-    @tasks.loop(count=1)
     async def member_welcome(self, member: Member) -> None:
         
         if not self.channel_manager.welcome_channel:
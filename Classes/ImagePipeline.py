@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+import aiohttp
+from discord import Attachment, File
+
+from Utilities import attachment_urls, log, metrics
+
+if TYPE_CHECKING:
+    from Classes import StaffPartyBot
+################################################################################
+
+__all__ = ("ImagePipeline", "ImageTooLarge")
+
+################################################################################
+def _reencode(data: bytes, max_size: int) -> Tuple[bytes, str]:
+    """Downscales ``data`` to fit in ``max_size`` x ``max_size`` and
+    re-encodes it - WebP if it has transparency, JPEG otherwise. Animated
+    images and anything that comes out bigger are returned untouched.
+
+    Runs in a worker process, so it has to stay a module-level function."""
+
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as img:
+        fmt = (img.format or "png").lower()
+        if getattr(img, "is_animated", False):
+            return data, fmt
+
+        img.thumbnail((max_size, max_size), Image.LANCZOS)
+
+        out = io.BytesIO()
+        if img.mode in ("RGBA", "LA", "P"):
+            img.save(out, "WEBP", quality=85, method=4)
+            ext = "webp"
+        else:
+            img.convert("RGB").save(out, "JPEG", quality=85, optimize=True, progressive=True)
+            ext = "jpg"
+
+    encoded = out.getvalue()
+    if len(encoded) >= len(data):
+        return data, fmt
+
+    return encoded, ext
+
+################################################################################
+class ImageTooLarge(ValueError):
+    """An attachment is over ``ImagePipeline.MAX_BYTES``."""
+
+    pass
+
+################################################################################
+class ImagePipeline:
+    """Ingests user images into the image dump channel.
+
+    Attachments are streamed down with a size cap, downscaled and re-encoded
+    in a worker process, and deduplicated by content hash so uploading the
+    same picture again reuses the URL it already has, unless its signature
+    is about to expire. Uploads that arrive close together share a single
+    message in the dump channel."""
+
+    __slots__ = (
+        "_state",
+        "_pool",
+        "_urls",
+        "_pending",
+        "_flush_task",
+    )
+
+    THUMBNAIL_SIZE = 256
+    FULL_SIZE = 1024
+
+    MAX_BYTES = 25 * 1024 * 1024
+    CHUNK_SIZE = 64 * 1024
+
+    # Discord allows 10 attachments per message.
+    BATCH_SIZE = 10
+    BATCH_WINDOW = 0.5  # seconds
+
+    MAX_REMEMBERED = 2000
+    # A remembered URL this close to its signature expiring is uploaded again.
+    REUSE_MARGIN = 24 * 60 * 60  # seconds
+
+################################################################################
+    def __init__(self, bot: StaffPartyBot):
+
+        self._state: StaffPartyBot = bot
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+        # Content hash (of the original or the re-encoded bytes) -> dump URL.
+        self._urls: OrderedDict[str, str] = OrderedDict()
+
+        self._pending: List[Tuple[File, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+################################################################################
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+
+        # Created on first use - most processes never touch an image.
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=int(os.getenv("IMAGE_WORKERS", 1)))
+
+        return self._pool
+
+################################################################################
+    def _remember(self, digest: str, url: str) -> None:
+
+        self._urls[digest] = url
+        self._urls.move_to_end(digest)
+        while len(self._urls) > self.MAX_REMEMBERED:
+            self._urls.popitem(last=False)
+
+################################################################################
+    def _lookup(self, digest: str) -> Optional[str]:
+
+        if (url := self._urls.get(digest)) is None:
+            return None
+
+        url = attachment_urls.fresh(url)
+        expires = attachment_urls.expiry(url)
+        if expires is not None and expires < time.time() + self.REUSE_MARGIN:
+            del self._urls[digest]
+            return None
+
+        self._urls.move_to_end(digest)
+        metrics.inc("images_total", result="duplicate")
+
+        return url
+
+################################################################################
+    async def _download(self, attachment: Attachment) -> bytes:
+
+        if attachment.size > self.MAX_BYTES:
+            raise ImageTooLarge(f"Image is too large ({attachment.size} bytes).")
+
+        buffer = io.BytesIO()
+        async with aiohttp.ClientSession() as session:
+            async with session.get(attachment.url) as response:
+                response.raise_for_status()
+                async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+                    buffer.write(chunk)
+                    if buffer.tell() > self.MAX_BYTES:
+                        raise ImageTooLarge("Image is too large.")
+
+        return buffer.getvalue()
+
+################################################################################
+    async def ingest(self, attachment: Attachment, max_size: int = FULL_SIZE) -> str:
+        """Returns a dump channel URL for ``attachment``, resized to fit in
+        ``max_size`` pixels. Raises ``ImageTooLarge`` past ``MAX_BYTES``."""
+
+        log.info("Core", "Dumping image to image dump...")
+
+        with metrics.timer("image_ingest_seconds"):
+            data = await self._download(attachment)
+
+            source_digest = f"{hashlib.sha256(data).hexdigest()}:{max_size}"
+            if (url := self._lookup(source_digest)) is not None:
+                log.info("Core", "Image already dumped, reusing its URL.")
+                return url
+
+            try:
+                encoded, ext = await asyncio.get_running_loop().run_in_executor(
+                    self.pool, _reencode, data, max_size
+                )
+            except Exception as ex:
+                # Not something PIL understands - store it as it came.
+                log.warning("Core", f"Couldn't re-encode image, storing original: {ex}")
+                encoded, ext = data, attachment.filename.rsplit(".", 1)[-1]
+
+            digest = hashlib.sha256(encoded).hexdigest()
+            if (url := self._lookup(digest)) is None:
+                metrics.inc("images_total", result="uploaded")
+                metrics.inc("image_bytes_saved_total", len(data) - len(encoded))
+                url = await self._upload(File(io.BytesIO(encoded), filename=f"{digest[:16]}.{ext}"))
+                self._remember(digest, url)
+
+            self._remember(source_digest, url)
+
+        log.info("Core", "Image dumped!")
+
+        return url
+
+################################################################################
+    async def _upload(self, file: File) -> str:
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((file, future))
+
+        if len(self._pending) >= self.BATCH_SIZE:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+        return await future
+
+################################################################################
+    async def _flush_later(self) -> None:
+
+        await asyncio.sleep(self.BATCH_WINDOW)
+        self._flush_task = None
+        await self.flush()
+
+################################################################################
+    async def flush(self) -> None:
+
+        while self._pending:
+            batch = self._pending[:self.BATCH_SIZE]
+            self._pending = self._pending[self.BATCH_SIZE:]
+
+            try:
+                post = await self._state.image_dump.send(files=[f for f, _ in batch])
+            except Exception as ex:
+                log.error("Core", f"Failed to upload {len(batch)} image(s) to the image dump: {ex}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(ex)
+                continue
+
+            metrics.inc("image_dump_messages_total")
+            for (_, future), attachment in zip(batch, post.attachments):
+                if not future.done():
+                    future.set_result(attachment.url)
+
+################################################################################
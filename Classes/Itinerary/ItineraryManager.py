@@ -29,10 +29,22 @@ class ItineraryManager:
         return self._parent.bot
     
 ################################################################################
-    async def compile_itinerary(self, interaction: Interaction, hours: int, region: Optional[str]) -> None:
+    async def compile_itinerary(
+        self,
+        interaction: Interaction,
+        hours: int,
+        region: Optional[str],
+        local: bool = False
+    ) -> None:
         
         await interaction.response.defer()
 
+        if local:
+            # Our own venues' saved hours - no FFXIV Venues call needed.
+            openings = self._parent.venue_manager.open_hours.open_within(hours)
+            await self.bot.report_manager.local_itinerary_report(interaction, openings, region)
+            return
+
         all_venues = await self.bot.veni_client.get_all_venues()
         await self.bot.report_manager.itinerary_report(interaction, hours, all_venues, region)
 
@@ -88,7 +88,10 @@ class JobPosting:
     def new(cls: Type[JP], mgr: JobsManager, venue: Venue, user: User) -> JP:
         
         new_id = mgr.bot.database.insert.job_posting(mgr.guild_id, venue.id, user.id)
-        return cls(mgr, _id=new_id, venue=venue, user=user)
+        self = cls(mgr, _id=new_id, venue=venue, user=user)
+        mgr.guild.events.created("job_posting", self)
+        
+        return self
     
 ################################################################################
     @classmethod
@@ -117,8 +120,6 @@ class JobPosting:
         self._end = data[12]
         
         self._schedule_updated = False
-
-        await self._update_post_components()
         
         return self
     
@@ -194,6 +195,12 @@ class JobPosting:
         
         return self._position.name if self._position is not None else "None"
     
+################################################################################
+    @property
+    def label(self) -> str:
+        
+        return f"{self._venue.name} - {self.position_name} ({self._id})"
+    
 ################################################################################    
     @property
     def post_message(self) -> Optional[Message]:
@@ -278,6 +285,7 @@ class JobPosting:
     def update(self) -> None:
 
         self.bot.database.update.job_posting(self)
+        self._mgr.guild.events.updated("job_posting", self)
         
 ################################################################################
     async def delete(self) -> None:
@@ -290,6 +298,22 @@ class JobPosting:
             )
         )
         
+        await self._delete_messages()
+        self._remove()
+        
+        log.info("Jobs", f"Job posting {self._id} deleted successfully")
+        
+################################################################################
+    def _remove(self) -> None:
+        
+        self._mgr._postings.remove(self)
+        self._mgr.guild.edits.cancel(self._post_msg)
+        self.bot.database.delete.job_posting(self)
+        self._mgr.guild.events.deleted("job_posting", self)
+        
+################################################################################
+    async def _delete_messages(self) -> None:
+        
         if self.post_message is not None:
             try:
                 await self.post_message.delete()
@@ -313,11 +337,6 @@ class JobPosting:
             await self.candidate.send(embed=embed)
             log.debug("Jobs", f"Sent job posting cancellation message to candidate")
         
-        self._mgr._postings.remove(self)
-        self.bot.database.delete.job_posting(self)
-        
-        log.info("Jobs", f"Job posting {self._id} deleted successfully")
-        
 ################################################################################
     async def menu(self, interaction: Interaction) -> None:
         
@@ -767,6 +786,21 @@ class JobPosting:
         
         self.update()
         
+        # Not an error - venues run events outside their regular hours.
+        open_hours = self._mgr.guild.venue_manager.open_hours
+        if open_hours.is_open_between(self.venue, start_time, end_time) is False:
+            note = U.make_embed(
+                title="Outside Venue Hours",
+                description=(
+                    f"`{self.venue.name}` isn't scheduled to be open between "
+                    f"{U.format_dt(start_time, 'f')} and {U.format_dt(end_time, 'f')}.\n\n"
+                    
+                    "The schedule has been saved anyway; just double-check "
+                    "the times if that wasn't intended."
+                )
+            )
+            await interaction.respond(embed=note, ephemeral=True)
+        
         log.info(
             "Jobs",
             (
@@ -797,7 +831,7 @@ class JobPosting:
             await interaction.respond(embed=error, ephemeral=True)
             return
     
-        if self.post_message is not None and await self._update_post_components():
+        if await self._mgr.guild.edits.flush(self.post_message, self._update_post_components):
             confirm = U.make_embed(
                 title="Job Posting Updated",
                 description="The job posting has been updated."
@@ -831,22 +865,20 @@ class JobPosting:
             return
     
         post_view = JobPostingPickupView(self)
-        self.bot.add_view(post_view)
         
         channel = (
             self._mgr.temporary_jobs_channel 
             if self.post_type == JobPostingType.Temporary 
             else self._mgr.permanent_jobs_channel
         )
-        pos_thread = next(
-            (t for t in channel.threads if t.name == self.position.name), None
-        ) if channel is not None else None
+        pos_thread = await self._mgr.guild.threads.find(channel, self.position.name)
     
         try:
             if pos_thread:
                 self.post_message = await pos_thread.send(embed=self.compile(), view=post_view)
             else:
                 pos_thread = await channel.create_thread(name=self.position.name, embed=self.compile(), view=post_view)
+                self._mgr.guild.threads.track(pos_thread)
                 self.post_message = pos_thread.last_message
                 
             log.debug(
@@ -886,7 +918,7 @@ class JobPosting:
             log.info("Jobs", "Notified eligible applicants of job posting")
 
 ################################################################################
-    async def _update_post_components(self, addl_attempt: bool = False) -> bool:
+    async def _update_post_components(self) -> bool:
 
         if self.post_message is None:
             return False
@@ -901,8 +933,7 @@ class JobPosting:
         
         try:
             view = JobPostingPickupView(self)
-            self.bot.add_view(view, message_id=self._post_msg.id)
-            await self._post_msg.edit(embed=self.compile(), view=view)
+            await self._mgr.guild.threads.edit_message(self._post_msg, embed=self.compile(), view=view)
         except NotFound as ex:
             log.error(
                 "Jobs",
@@ -914,17 +945,11 @@ class JobPosting:
             self.post_message = None
             return False
         except HTTPException as ex:
-            if ex.code != 50083 and not addl_attempt:
-                log.critical(
-                    "Jobs",
-                    f"An uncaught error occurred while updating the post components: {ex}"
-                )
-            log.warning(
+            log.critical(
                 "Jobs",
-                "Thread was archived for exceeding 30 day limit - attempting to revive."
+                f"An uncaught error occurred while updating the post components: {ex}"
             )
-            await self._post_msg.channel.send("Hey Ur Cute", delete_after=0.1)
-            await self._update_post_components(addl_attempt=True)
+            return False
         else:
             log.info(
                 "Jobs",
@@ -936,7 +961,7 @@ class JobPosting:
     async def notify_eligible_applicants(self) -> None:
         
         eligible = [
-            tuser for tuser in self._mgr.guild.training_manager.tusers 
+            tuser for tuser in self._mgr.applicants
             if await tuser.is_eligible(self)
         ]
         if not eligible:
@@ -998,7 +1023,7 @@ class JobPosting:
             return
         
         self.candidate = tuser
-        await self._update_post_components()
+        self._mgr.guild.edits.request(self._post_msg, self._update_post_components)
         await interaction.edit()
         
         log.info(
@@ -1042,8 +1067,9 @@ class JobPosting:
         log.info(
             "Jobs",
             (
-                f"User {interaction.user.name} triggered job posting {self.id} "
-                f"Cancel button (Venue: {self.venue.name}, Position: {self.position_name})"
+                f"User {interaction.user.name if interaction else '(member left)'} "
+                f"triggered job posting {self.id} Cancel button "
+                f"(Venue: {self.venue.name}, Position: {self.position_name})"
             )
         )
         
@@ -1055,11 +1081,16 @@ class JobPosting:
         await self._mgr.guild.log.temp_job_canceled(self)
         
         self.candidate = None
-        await self._update_post_components()
+        self._mgr.guild.edits.request(self._post_msg, self._update_post_components)
         
         if interaction is not None:
             await interaction.edit()
             
+        await self._notify_canceled()
+        
+################################################################################
+    async def _notify_canceled(self) -> None:
+        
         notify = U.make_embed(
             title="Job Canceled",
             description=(
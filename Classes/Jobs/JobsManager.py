@@ -19,12 +19,14 @@ from Utilities import (
     JobPostingNotFoundError,
     DateTimeFormatError,
     DateTimeMismatchError,
+    EntityChange,
 )
 from Utilities import log
+from Classes.Common import NameIndex, UserIndex
 from .JobPosting import JobPosting
 
 if TYPE_CHECKING:
-    from Classes import GuildData, StaffPartyBot, VenueManager, Venue
+    from Classes import GuildData, StaffPartyBot, VenueManager, Venue, DepartureBatch, EntityEvent, TUser
 ################################################################################
 
 __all__ = ("JobsManager",)
@@ -35,6 +37,10 @@ class JobsManager:
     __slots__ = (
         "_guild",
         "_postings",
+        "_names",
+        "_owners",
+        "_candidates",
+        "_applicants",
     )
     
 ################################################################################
@@ -43,6 +49,17 @@ class JobsManager:
         self._guild: GuildData = guild
         
         self._postings: List[JobPosting] = []
+        self._names: NameIndex[JobPosting] = NameIndex()
+        # Posting owner / accepted candidate user ID -> postings.
+        self._owners: UserIndex[JobPosting] = UserIndex()
+        self._candidates: UserIndex[JobPosting] = UserIndex()
+        # User ID -> TUsers who could be notified of new postings: not on
+        # hiatus, with a posted profile.
+        self._applicants: Dict[int, TUser] = {}
+        
+        guild.events.subscribe("job_posting", self._on_posting_event)
+        guild.events.subscribe("tuser", self._on_applicant_event)
+        guild.events.subscribe("profile", self._on_applicant_event)
         
 ################################################################################
     async def _load_all(self, data: Dict[str, Any]) -> None:
@@ -50,6 +67,90 @@ class JobsManager:
         for _, posting in data["job_postings"].items():
             self._postings.append(await JobPosting.load(self, posting))
             
+        self._guild.events.load("job_posting", self._postings)
+        self.rebuild_indexes()
+            
+################################################################################
+    def rebuild_indexes(self) -> None:
+        
+        self._names.rebuild([])
+        self._owners.rebuild([])
+        self._candidates.rebuild([])
+        self._applicants = {}
+        
+        events = self._guild.events
+        events.replay("job_posting", self._on_posting_event)
+        # Training and profiles are loaded ahead of jobs.
+        events.replay("tuser", self._on_applicant_event)
+        
+################################################################################
+    def _on_posting_event(self, event: EntityEvent) -> None:
+        
+        if event.change == EntityChange.Deleted:
+            self.unindex(event.entity)
+        else:
+            self.index(event.entity)
+            
+################################################################################
+    def _on_applicant_event(self, event: EntityEvent) -> None:
+        
+        if not event.changed("_details._hiatus", "_details._post_msg"):
+            return
+        
+        user_id = event.key
+        tuser = self._guild.training_manager[user_id]
+        profile = self._guild.profile_manager[user_id]
+        
+        if (
+            event.change != EntityChange.Deleted
+            and tuser is not None
+            and not tuser.on_hiatus
+            and profile is not None
+            and profile.post_message is not None
+        ):
+            self._applicants[user_id] = tuser
+        else:
+            self._applicants.pop(user_id, None)
+            
+################################################################################
+    def index(self, posting: JobPosting) -> None:
+        
+        self._names.refresh(posting.id, posting.label, posting)
+        self._owners.refresh(posting.id, [posting.user.id] if posting.user else [], posting)
+        self._candidates.refresh(
+            posting.id,
+            [posting.candidate.user_id] if posting.candidate is not None else [],
+            posting
+        )
+        
+################################################################################
+    def unindex(self, posting: JobPosting) -> None:
+        
+        self._names.remove(posting.id)
+        self._owners.remove(posting.id)
+        self._candidates.remove(posting.id)
+
+################################################################################
+    async def reload(self, post_id: str, data: Dict[str, Any]) -> None:
+        """Brings a posting in line with the database after another process
+        changed it."""
+
+        current = self.get_posting(post_id)
+        record = data["job_postings"].get(post_id)
+
+        if record is None:
+            if current is not None:
+                self._postings.remove(current)
+                self._guild.events.deleted("job_posting", current, remote=True)
+            return
+
+        fresh = await JobPosting.load(self, record)
+        if current is None:
+            self._postings.append(fresh)
+            self._guild.events.created("job_posting", fresh, remote=True)
+        else:
+            self._guild.events.refresh("job_posting", current, fresh)
+
 ################################################################################
     def get_posting(self, post_id: str) -> Optional[JobPosting]:
         
@@ -89,6 +190,18 @@ class JobsManager:
         
         return self._postings
     
+################################################################################
+    @property
+    def names(self) -> NameIndex[JobPosting]:
+        
+        return self._names
+    
+################################################################################
+    @property
+    def applicants(self) -> List[TUser]:
+        
+        return list(self._applicants.values())
+    
 ################################################################################
     @property
     def temporary_jobs_channel(self) -> Optional[ForumChannel]:
@@ -155,13 +268,15 @@ class JobsManager:
         for posting in self._postings:
             await posting.expiration_check()
             
-        for thread in self.temporary_jobs_channel.threads:
+        # Archived threads included - they're the likeliest to be empty.
+        for thread in await self.guild.threads.forum(self.temporary_jobs_channel):
             count = 0
             async for _ in thread.history():
                 count += 1
             if count == 0:
                 log.debug("Jobs", f"Deleting empty thread {thread.name}")
                 await thread.delete()
+                self.guild.threads.remove(thread.id)
         
 ################################################################################
     async def temp_job_report(self, interaction: Interaction) -> None:
@@ -296,27 +411,49 @@ class JobsManager:
         
         count = 0
         
-        for p in self._postings:
-            if p.venue == venue:
-                await p.delete()
-                count += 1
+        # Deleting removes from _postings, so iterate over a copy.
+        for p in [p for p in self._postings if p.venue == venue]:
+            await p.delete()
+            count += 1
                 
         return count
 
 ################################################################################
-    async def on_member_leave(self, member: Member) -> Tuple[int, int]:
+    def remove_all_by_venue(self, venue: Venue, batch: DepartureBatch) -> int:
+        
+        log.info("Jobs", f"Removing all job postings for {venue.name}")
+        
+        postings = [p for p in self._postings if p.venue == venue]
+        for p in postings:
+            p._remove()
+            batch.defer(f"job posting {p.id}", p._delete_messages)
+            
+        return len(postings)
+
+################################################################################
+    def refresh_names(self, venue: Venue) -> None:
+        
+        for posting in self._postings:
+            if posting.venue == venue:
+                self._names.refresh(posting.id, posting.label, posting)
+            
+################################################################################
+    def on_member_leave(self, member: Member, batch: DepartureBatch) -> Tuple[int, int]:
         
         log.info("Jobs", f"Member Left. Deleting all job postings for {member.display_name}")
         
         delete_count = 0
         cancel_count = 0
         
-        for posting in self._postings:
-            if posting.user.id == member.id:
-                await posting.delete()
-                delete_count += 1
-            if posting.candidate is not None and posting.candidate.user_id == member.id:
-                await posting.cancel()
+        for posting in self._owners[member.id]:
+            posting._remove()
+            batch.defer(f"job posting {posting.id}", posting._delete_messages)
+            delete_count += 1
+        for posting in self._candidates[member.id]:
+            posting.candidate = None
+            batch.defer(f"job posting {posting.id}", posting._update_post_components)
+            batch.defer(f"job posting {posting.id} owner", posting._notify_canceled)
+            cancel_count += 1
                 
         log.info("Jobs", f"Deleted {delete_count} job postings and cancelled {cancel_count}.")
         return delete_count, cancel_count
@@ -344,22 +481,19 @@ class JobsManager:
             log.debug("Jobs", "Bulk update cancelled")
             return
         
-        msg = await interaction.followup.send("Please wait...")
-        
-        count = 0
-        for posting in self._postings:
-            await posting._update_post_components()
-            count += 1
-        
-        await msg.delete()
-        
-        confirm = U.make_embed(
-            title="Bulk Update Complete",
-            description=f"Successfully updated {count} job postings."
+        await self.guild.threads.ensure_open_many(
+            p.post_message.channel for p in self._postings if p.post_message is not None
+        )
+        result = await self.guild.bulk.run(
+            interaction, "jobs", "job postings", list(self._postings),
+            lambda p: p._update_post_components(),
+            lambda p: p.label,
+            # Postings for the same position share a thread.
+            lambda p: p.post_message.channel.id if p.post_message is not None else p.id
         )
-        await interaction.respond(embed=confirm)
+        await interaction.respond(embed=result.summary("job postings"))
         
-        log.info("Jobs", f"Bulk update complete. Updated {count} job postings.")
+        log.info("Jobs", f"Bulk update complete. Updated {result.updated} job postings.")
         
 ################################################################################
         
\ No newline at end of file
@@ -3,7 +3,7 @@ from __future__ import annotations
 import os
 import random
 from dotenv import load_dotenv
-from typing import TYPE_CHECKING, Optional, List
+from typing import TYPE_CHECKING, Any, Coroutine, Optional, List
 
 from UI.Guild import BGCheckApprovalView
 from discord import (
@@ -19,7 +19,7 @@ from discord import (
     Message
 )
 from Assets import BotEmojis
-from Utilities import Utilities as U, ChannelTypeError, LOG_COLORS, LogType
+from Utilities import Utilities as U, ChannelTypeError, LOG_COLORS, LogType, EntityChange
 
 if TYPE_CHECKING:
     from Classes import *
@@ -42,6 +42,8 @@ class Logger:
 
         self._guild: GuildData = state
         self._alyah: User = None  # type: ignore
+        
+        state.events.subscribe("venue", self._on_venue_event)
 
 ################################################################################
     async def load(self) -> None:
@@ -147,6 +149,66 @@ class Logger:
 
         await self._log(embed, LogType.MemberLeave)
 
+################################################################################
+    async def members_left(self, departures: List[Departure]) -> None:
+
+        if len(departures) == 1:
+            d = departures[0]
+            await self.member_left(
+                member=d.member,
+                venue_deleted=d.venue_deleted,
+                profile_deleted=d.profile_deleted,
+                trainings_modified=d.trainings_modified,
+                trainings_deleted=d.trainings_deleted,
+                jobs_deleted=d.jobs_deleted,
+                jobs_canceled=d.jobs_canceled
+            )
+            return
+
+        lines = []
+        for d in departures:
+            changes = [
+                f"{label} `{count}`" for label, count in (
+                    ("Jobs Deleted", d.jobs_deleted),
+                    ("Jobs Re-Opened", d.jobs_canceled),
+                    ("Trainings Reassigned", d.trainings_modified),
+                    ("Trainings Deleted", d.trainings_deleted),
+                ) if count
+            ]
+            if d.venue_deleted:
+                changes.append("Venue Deleted")
+            if d.profile_deleted:
+                changes.append("Profile Deleted")
+            lines.append(
+                f"* {d.member.mention} ({d.member.display_name})" +
+                (f" - {', '.join(changes)}" if changes else "")
+            )
+
+        description = ""
+        for i, line in enumerate(lines):
+            if len(description) + len(line) > 3900:
+                description += f"*...and {len(lines) - i} more.*"
+                break
+            description += line + "\n"
+
+        embed = U.make_embed(
+            title=f"{len(departures)} Members Left!",
+            description=description,
+            fields=[
+                ("__Trainings Reassigned__", f"`{sum(d.trainings_modified for d in departures)}`", True),
+                ("__Trainings Deleted__", f"`{sum(d.trainings_deleted for d in departures)}`", True),
+                ("** **", "** **", False),
+                ("__Jobs Deleted__", f"`{sum(d.jobs_deleted for d in departures)}`", True),
+                ("__Jobs Re-Opened__", f"`{sum(d.jobs_canceled for d in departures)}`", True),
+                ("** **", "** **", False),
+                ("__Venues Deleted__", f"`{sum(d.venue_deleted for d in departures)}`", True),
+                ("__Profiles Deleted__", f"`{sum(d.profile_deleted for d in departures)}`", True)
+            ],
+            timestamp=True
+        )
+
+        await self._log(embed, LogType.MemberLeave)
+
 ################################################################################
     async def training_signup(self, training: Training) -> None:
 
@@ -218,6 +280,32 @@ class Logger:
         
         await self._log(embed, LogType.UserHiatus)
         
+################################################################################
+    def _on_venue_event(self, event: EntityEvent) -> Optional[Coroutine[Any, Any, None]]:
+        
+        # Removals are logged by whoever does them; cascades go in the
+        # departure summary instead. Changes from other processes were
+        # logged there.
+        if event.replayed or event.remote or event.change == EntityChange.Deleted:
+            return None
+        if not event.changed("_users"):
+            return None
+        
+        return self._log_venue_event(event)
+    
+################################################################################
+    async def _log_venue_event(self, event: EntityEvent) -> None:
+        
+        venue = event.entity
+        if event.change == EntityChange.Created:
+            await self.venue_created(venue)
+            return
+        
+        for user in event.added("_users"):
+            await self.venue_user_added(venue, user)
+        for user in event.removed("_users"):
+            await self.venue_user_removed(venue, user)
+            
 ################################################################################
     async def venue_user_added(self, venue: Venue, user: User) -> None:
 
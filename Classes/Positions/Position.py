@@ -60,7 +60,10 @@ class Position:
         log.info("Positions", f"Creating new position: {name}")
         
         new_id = mgr.bot.database.insert.position(mgr.guild_id, name)
-        return cls(mgr, new_id, name)
+        self = cls(mgr, new_id, name)
+        mgr.guild_data.events.created("position", self)
+        
+        return self
 
 ################################################################################
     @classmethod
@@ -86,6 +89,7 @@ class Position:
     def update(self) -> None:
         
         self.bot.database.update.position(self)
+        self._manager.guild_data.events.updated("position", self)
         
 ################################################################################    
     @property
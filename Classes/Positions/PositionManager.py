@@ -8,13 +8,14 @@ from discord.ext.pages import Page, PageGroup
 
 from UI.Common import ConfirmCancelView, Frogginator
 from UI.Positions import GlobalRequirementsView, GlobalRequirementModal, RemoveRequirementView
-from Utilities import Utilities as U, PositionExistsError
+from Utilities import Utilities as U, PositionExistsError, EntityChange
 from Utilities import log
+from Classes.Common import NameIndex
 from .Position import Position
 from .Requirement import Requirement
 
 if TYPE_CHECKING:
-    from Classes import StaffPartyBot, GuildData
+    from Classes import StaffPartyBot, GuildData, EntityEvent
 ################################################################################
 
 __all__ = ("PositionManager", )
@@ -26,6 +27,7 @@ class PositionManager:
         "_guild",
         "_positions",
         "_requirements",
+        "_names",
     )
     
 ################################################################################
@@ -35,6 +37,9 @@ class PositionManager:
     
         self._positions: List[Position] = []
         self._requirements: List[Requirement] = []
+        self._names: NameIndex[Position] = NameIndex()
+        
+        guild.events.subscribe("position", self._on_position_event)
 
 ################################################################################
     async def _load_all(self, data: Dict[str, Any]) -> None:
@@ -54,11 +59,48 @@ class PositionManager:
             [Requirement.load(self.bot, r) for r in global_reqs]
         )
 
+        await self._guild.resolve_many("role", [pos[3] for pos in position_data])
+
         for pos in position_data:
             reqs = requirements.get(pos[0], [])
             self._positions.append(await Position.load(self, pos, reqs))
             
-################################################################################    
+        self._guild.events.load("position", self._positions)
+        self._names.rebuild([])
+        self._guild.events.replay("position", self._on_position_event)
+        
+################################################################################
+    def _on_position_event(self, event: EntityEvent) -> None:
+        
+        position: Position = event.entity
+        if event.change == EntityChange.Deleted:
+            self._names.remove(position.id)
+        elif event.changed("_name"):
+            self._names.refresh(position.id, position.name, position)
+
+################################################################################
+    async def reload(self, pos_id: str, data: Dict[str, Any]) -> None:
+        """Brings a position and its requirements in line with the database
+        after another process changed them."""
+
+        current = self.get_position(pos_id)
+        pos = next((p for p in data["positions"] if p[0] == pos_id), None)
+
+        if pos is None:
+            if current is not None:
+                self._positions.remove(current)
+                self._guild.events.deleted("position", current, remote=True)
+            return
+
+        reqs = [r for r in data["requirements"] if r[2] == pos_id]
+        fresh = await Position.load(self, pos, reqs)
+        if current is None:
+            self._positions.append(fresh)
+            self._guild.events.created("position", fresh, remote=True)
+        else:
+            self._guild.events.refresh("position", current, fresh)
+
+################################################################################
     @property
     def bot(self) -> StaffPartyBot:
         
@@ -83,6 +125,12 @@ class PositionManager:
         self._positions.sort(key=lambda p: p.name)
         return self._positions
     
+################################################################################
+    @property
+    def names(self) -> NameIndex[Position]:
+        
+        return self._names
+    
 ################################################################################
     @property
     def guild_id(self) -> int:
@@ -156,9 +204,7 @@ class PositionManager:
 ################################################################################
     def get_position_by_name(self, pos_name: str) -> Optional[Position]:
         
-        for position in self._positions:
-            if position.name.lower() == pos_name.lower():
-                return position
+        return self._names.get(pos_name)
             
 ################################################################################
     async def position_status(self, interaction: Interaction, pos_name: str) -> None:
@@ -47,8 +47,10 @@ from Utilities import (
     NoVenuesFoundError,
     GlobalDataCenter,
     ProfileIncompleteError,
+    ImageTooLargeError,
 )
 from Utilities import log
+from Classes.ImagePipeline import ImageTooLarge
 
 from .ProfileAtAGlance import ProfileAtAGlance
 from .ProfileDetails import ProfileDetails
@@ -96,7 +98,10 @@ class Profile:
         
         log.info("Profiles", f"New profile created for {user.name} ({user.id})")
         new_id = mgr.bot.database.insert.profile(mgr.guild_id, user.id)
-        return cls(mgr, user, _id=new_id)
+        self = cls(mgr, user, _id=new_id)
+        mgr.guild.events.created("profile", self, user.id)
+        
+        return self
     
 ################################################################################
     @classmethod
@@ -106,9 +111,8 @@ class Profile:
         addl_imgs = data["additional_images"]
         hours = data["availability"]
         
-        try:
-            user = await mgr.bot.fetch_user(profile[1])
-        except NotFound:
+        user = await mgr.guild.get_or_fetch_user(profile[1])
+        if user is None:
             return
         
         self: P = cls.__new__(cls)
@@ -148,6 +152,12 @@ class Profile:
         
         return self._id
     
+################################################################################
+    @property
+    def images(self) -> ProfileImages:
+        
+        return self._images
+    
 ################################################################################
     @property
     def user(self) -> User:
@@ -264,7 +274,11 @@ class Profile:
                 log.debug("Profiles", "User cancelled additional image assignment")
                 return
 
-            image_url = await self.bot.dump_image(file)
+            try:
+                image_url = await self.bot.dump_image(file)
+            except ImageTooLarge:
+                await self._image_too_large(interaction)
+                return
             # if shortened_url := U.shorten_url(image_url):
             #     image_url = shortened_url
             
@@ -274,7 +288,16 @@ class Profile:
             return
         
         await interaction.response.defer()
-        image_url = await self.bot.dump_image(file)
+        try:
+            image_url = await self.bot.dump_image(
+                file,
+                self.bot.image_pipeline.THUMBNAIL_SIZE
+                if img_type is ImageType.Thumbnail
+                else self.bot.image_pipeline.FULL_SIZE
+            )
+        except ImageTooLarge:
+            await self._image_too_large(interaction)
+            return
         
         if img_type is ImageType.Thumbnail:
             log.info("Profiles", "User is assigning a thumbnail image")
@@ -296,6 +319,16 @@ class Profile:
         
         log.info("Profiles", "Image assigned")
     
+################################################################################
+    async def _image_too_large(self, interaction: Interaction) -> None:
+        
+        log.warning(
+            "Profiles",
+            f"User {interaction.user.name} ({interaction.user.id}) uploaded an image over the size limit"
+        )
+        error = ImageTooLargeError(self.bot.image_pipeline.MAX_BYTES // (1024 * 1024))
+        await interaction.respond(embed=error, ephemeral=True)
+        
 ################################################################################
     async def progress(self, interaction: Interaction) -> None:
         
@@ -424,17 +457,18 @@ class Profile:
                 )
                 await member.add_roles(*pos_roles)
                 
-        if await self._update_post_components():
+        if await self.manager.guild.edits.flush(self.post_message, self._update_post_components):
             await interaction.respond(embed=self.success_message())
             return
     
-        # Prepare embeds and persistent view
+        # Prepare embeds and post components
         embeds = [main_profile, availability] + ([aboutme] if aboutme else [])
         view = ProfileUserMuteView(self)
     
         # Handling threads
         channel = self.manager.guild.channel_manager.profiles_channel
-        matching_thread = next((t for t in channel.threads if t.name.lower() == self.char_name.lower()), None)
+        threads = self.manager.guild.threads
+        matching_thread = await threads.find(channel, self.char_name)
         
         log.debug(
             "Profiles",
@@ -446,20 +480,19 @@ class Profile:
         
         if matching_thread:
             # Clear the matching thread
-            await matching_thread.edit(applied_tags=self.get_tags())
+            matching_thread = await threads.edit_thread(matching_thread, applied_tags=self.get_tags())
             async for m in matching_thread.history():
                 await m.delete()
             action = matching_thread.send  # type: ignore
         else:
             # Or create a new thread if no matching one
             action = lambda **kw: channel.create_thread(name=self.char_name, applied_tags=self.get_tags(), **kw)
-    
-        self.bot.add_view(view)
         
         # Post or create thread and handle permissions error
         try:
             result = await action(embeds=embeds, view=view)
             if isinstance(result, Thread):
+                threads.track(result)
                 self.post_message = await result.fetch_message(result.last_message_id)
             else:
                 self.post_message = result
@@ -475,7 +508,7 @@ class Profile:
             log.info("Profiles", "Profile post created successfully")
 
 ################################################################################
-    async def update_tags(self, addl_attempt: bool = False) -> bool:
+    async def update_tags(self) -> bool:
         
         if self.post_message is None or self.manager.guild.channel_manager.profiles_channel is None:
             return False
@@ -487,7 +520,7 @@ class Profile:
         )
 
         try:
-            await self.post_message.channel.edit(applied_tags=tags)
+            await self.manager.guild.threads.edit_thread(self.post_message.channel, applied_tags=tags)
         except Forbidden:
             log.warning(
                 "Profiles",
@@ -500,17 +533,6 @@ class Profile:
             log.warning("Profiles", "Thread could not be located. Exiting.")
             return False
         except HTTPException as ex:
-            if ex.code != 50083 and not addl_attempt:
-                log.critical(
-                    "Profiles",
-                    f"An uncaught error occurred while updating the post components: {ex}"
-                )
-            log.warning(
-                "Profiles",
-                "Thread was archived for exceeding 30 day limit - attempting to revive."
-            )
-            await self.post_message.channel.send("Hey Ur Cute", delete_after=0.1)
-            await self.update_tags(addl_attempt=True)
             log.critical(
                 "Profiles",
                 f"An uncaught error occurred while updating profile tags: {ex}"
@@ -521,7 +543,7 @@ class Profile:
             return True
         
 ################################################################################
-    async def _update_post_components(self, addl_attempt: bool = False) -> bool:
+    async def _update_post_components(self) -> bool:
         
         if self.post_message is None:
             log.debug("Profiles", "Post message not found - skipping update")
@@ -536,13 +558,12 @@ class Profile:
             return False
         
         view = ProfileUserMuteView(self)
-        self.bot.add_view(view, message_id=self.post_message.id)
 
         main_profile, availability, aboutme = self.compile()
         embeds = [main_profile, availability] + ([aboutme] if aboutme else [])
         
         try:
-            await self.post_message.edit(embeds=embeds, view=view)
+            await self.manager.guild.threads.edit_message(self.post_message, embeds=embeds, view=view)
         except NotFound:
             log.warning(
                 "Profiles",
@@ -551,18 +572,10 @@ class Profile:
             self.post_message = None
             return False
         except HTTPException as ex:
-            if ex.code != 50083 and not addl_attempt:
-                log.critical(
-                    "Profiles",
-                    f"An uncaught error occurred while updating the post components: {ex}"
-                )
-                return False
-            log.warning(
+            log.critical(
                 "Profiles",
-                "Thread was archived for exceeding 30 day limit - attempting to revive."
+                f"An uncaught error occurred while updating the post components: {ex}"
             )
-            await self.post_message.channel.send("Hey Ur Cute", delete_after=0.1)
-            await self._update_post_components(addl_attempt=True)
             return False
         else:
             log.info("Profiles", "Profile post components updated successfully")
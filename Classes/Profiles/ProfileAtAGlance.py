@@ -210,6 +210,7 @@ class ProfileAtAGlance(ProfileSection):
     def update(self) -> None:
 
         self.parent.bot.database.update.profile_ataglance(self)
+        self._publish()
     
 ################################################################################
     async def menu(self, interaction: Interaction) -> None:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional, Type, TypeVar, Any, Tuple, Dict
 
@@ -91,8 +92,9 @@ class ProfileDetails(ProfileSection):
             name=data[0],
             url=data[1],
             color=Colour(data[2]) if data[2] is not None else None,
-            jobs=data[3] or [],
-            rates=data[4],
+            # Job titles and rates repeat across most of the roster.
+            jobs=[sys.intern(j) for j in data[3]] if data[3] else [],
+            rates=sys.intern(data[4]) if data[4] is not None else None,
             post_msg=post_msg,
             positions=[
                 parent.manager.guild.position_manager.get_position(p) 
@@ -209,6 +211,7 @@ class ProfileDetails(ProfileSection):
     def update(self) -> None:
         
         self.parent.bot.database.update.profile_details(self)
+        self._publish()
         
 ################################################################################
     async def menu(self, interaction: Interaction) -> None:
@@ -10,7 +10,7 @@ from UI.Profiles import (
     ProfileImageStatusView,
     AdditionalImageSelectView
 )
-from Utilities import Utilities as U, NS
+from Utilities import Utilities as U, NS, attachment_urls
 from Utilities import log
 from .PAdditionalImage import PAdditionalImage
 from .ProfileSection import ProfileSection
@@ -67,7 +67,7 @@ class ProfileImages(ProfileSection):
     @property
     def thumbnail(self) -> Optional[str]:
         
-        return self._thumbnail
+        return attachment_urls.fresh(self._thumbnail)
     
 ################################################################################    
     @thumbnail.setter
@@ -80,7 +80,7 @@ class ProfileImages(ProfileSection):
     @property
     def main_image(self) -> Optional[str]:
         
-        return self._main_image
+        return attachment_urls.fresh(self._main_image)
     
 ################################################################################
     @main_image.setter
@@ -99,6 +99,7 @@ class ProfileImages(ProfileSection):
     def update(self) -> None:
         
         self.parent.bot.database.update.profile_images(self)
+        self._publish()
         
 ################################################################################
     async def menu(self, interaction: Interaction) -> None:
@@ -150,8 +151,8 @@ class ProfileImages(ProfileSection):
                 "***To change your thumbnail and main image assets, or to add an additional image\n"
                 "to your profile, use the `/profiles add_image` command.***"
             ),
-            thumbnail_url=self._thumbnail or BotImages.ThumbnailMissing,
-            image_url=self._main_image or BotImages.MainImageMissing,
+            thumbnail_url=self.thumbnail or BotImages.ThumbnailMissing,
+            image_url=self.main_image or BotImages.MainImageMissing,
             timestamp=False,
             fields=fields
         )
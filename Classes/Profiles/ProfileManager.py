@@ -9,7 +9,7 @@ from Utilities import Utilities as U, log
 from .Profile import Profile
 
 if TYPE_CHECKING:
-    from Classes import GuildData, StaffPartyBot
+    from Classes import GuildData, StaffPartyBot, DepartureBatch
 ################################################################################
 
 __all__ = ("ProfileManager",)
@@ -19,7 +19,8 @@ class ProfileManager:
     
     __slots__ = (
         "_state",
-        "_profiles"
+        "_profiles",
+        "_by_user",
     )
     
 ################################################################################
@@ -27,27 +28,57 @@ class ProfileManager:
         
         self._state: GuildData = guild
         self._profiles: List[Profile] = []
+        self._by_user: Dict[int, Profile] = {}
     
 ################################################################################
     async def _load_all(self, payload: Dict[str, Any]) -> None:
         
+        await self.guild.resolve_many("user", [p["profile"][1] for p in payload["profiles"]])
+        
         profiles = []
         for p in payload["profiles"]:       
             if profile := await Profile.load(self, p):
                 profiles.append(profile)
                 
         self._profiles = profiles
-        
-        for p in self._profiles:
-            await p._update_post_components()
+        self._by_user = {p.user_id: p for p in profiles}
+        self.guild.events.load("profile", profiles, key=lambda p: p.user_id)
         
 ################################################################################
     def __getitem__(self, user_id: int) -> Optional[Profile]:
         
+        return self._by_user.get(user_id)
+    
+################################################################################
+    def get_profile_by_id(self, profile_id: str) -> Optional[Profile]:
+        
         for p in self._profiles:
-            if p.user.id == user_id:
+            if p.id == profile_id:
                 return p
-    
+
+################################################################################
+    async def reload(self, profile_id: str, data: Dict[str, Any]) -> None:
+        """Brings a profile in line with the database after another process
+        changed it."""
+
+        current = self.get_profile_by_id(profile_id)
+        record = next((p for p in data["profiles"] if p["profile"][0] == profile_id), None)
+        fresh = await Profile.load(self, record) if record is not None else None
+
+        if fresh is None:
+            if current is not None:
+                self._profiles.remove(current)
+                self._by_user.pop(current.user_id, None)
+                self.guild.events.deleted("profile", current, current.user_id, remote=True)
+            return
+
+        if current is None:
+            self._profiles.append(fresh)
+            self._by_user[fresh.user_id] = fresh
+            self.guild.events.created("profile", fresh, fresh.user_id, remote=True)
+        else:
+            self.guild.events.refresh("profile", current, fresh, current.user_id)
+
 ################################################################################
     @property
     def bot(self) -> StaffPartyBot:
@@ -66,6 +97,12 @@ class ProfileManager:
         
         return self._state.parent.id
     
+################################################################################
+    @property
+    def profiles(self) -> List[Profile]:
+        
+        return self._profiles
+    
 ################################################################################
     def create_profile(self, user: User) -> Profile:
         
@@ -82,19 +119,25 @@ class ProfileManager:
         
         profile = Profile.new(self, user)
         self._profiles.append(profile)
+        self._by_user[profile.user_id] = profile
         
         log.info("Profiles", f"Profile created successfully for {user.id} ({user.name})")
         
         return profile
 
 ################################################################################
-    async def on_member_leave(self, member: Member) -> bool:
+    def on_member_leave(self, member: Member, batch: DepartureBatch) -> bool:
         
-        for profile in self._profiles:
-            if profile.user.id == member.id:
-                await profile.post_message.delete()
-                self._profiles.remove(profile)
-                return True
+        profile = self._by_user.pop(member.id, None)
+        if profile is None:
+            return False
+        
+        if profile.post_message is not None:
+            batch.defer(f"profile {profile.user_id}", profile.post_message.delete)
+        self._profiles.remove(profile)
+        self.guild.events.deleted("profile", profile, profile.user_id)
+        
+        return True
 
 ################################################################################
     async def bulk_update(self, interaction: Interaction) -> None:
@@ -123,30 +166,30 @@ class ProfileManager:
             log.debug("Profiles", "Bulk update cancelled.")
             return
 
-        msg = await interaction.followup.send("Please wait...")
-
-        count = 0
-        for profile in self._profiles:
-            member = self.guild.parent.get_member(profile.user.id)
-            if member is not None:
-                await profile._update_post_components()
-                count += 1
-            else:
-                if profile.post_message:
-                    await profile.post_message.delete()
-                self._profiles.remove(profile)
-
-        await msg.delete()
+        departed = [
+            p for p in self._profiles
+            if self.guild.parent.get_member(p.user.id) is None
+        ]
+        for profile in departed:
+            if profile.post_message:
+                await profile.post_message.delete()
+            self._profiles.remove(profile)
+            self._by_user.pop(profile.user_id, None)
+            self.guild.events.deleted("profile", profile, profile.user_id)
 
-        confirm = U.make_embed(
-            title="Bulk Update Complete",
-            description=f"Successfully updated {count} profiles."
+        await self.guild.threads.ensure_open_many(
+            p.post_message.channel for p in self._profiles if p.post_message is not None
+        )
+        result = await self.guild.bulk.run(
+            interaction, "profiles", "profiles", list(self._profiles),
+            lambda p: p._update_post_components(),
+            lambda p: p.char_name
         )
-        await interaction.respond(embed=confirm)
+        await interaction.respond(embed=result.summary("profiles"))
         
         log.info(
             "Profiles",
-            f"Bulk update completed for {count} profiles in guild {self.guild_id}"
+            f"Bulk update completed for {result.updated} profiles in guild {self.guild_id}"
         )
 
 ################################################################################
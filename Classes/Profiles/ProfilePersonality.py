@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING, List, Optional, Type, TypeVar, Tuple, Any, Dict
 
 from discord import Interaction, Embed, EmbedField
@@ -48,8 +49,8 @@ class ProfilePersonality(ProfileSection):
 
         return cls(
             parent=parent,
-            likes=data[0],
-            dislikes=data[1],
+            likes=[sys.intern(x) for x in data[0]] if data[0] else [],
+            dislikes=[sys.intern(x) for x in data[1]] if data[1] else [],
             personality=data[2],
             aboutme=data[3]
         )
@@ -110,6 +111,7 @@ class ProfilePersonality(ProfileSection):
     def update(self) -> None:
         
         self.parent.bot.database.update.profile_personality(self)
+        self._publish()
         
 ################################################################################
     async def menu(self, interaction: Interaction) -> None:
@@ -39,6 +39,12 @@ class ProfileSection:
         
         return self._parent.id
     
+################################################################################
+    def _publish(self) -> None:
+        
+        profile = self._parent
+        profile.manager.guild.events.updated("profile", profile, profile.user_id)
+        
 ################################################################################
     @staticmethod
     def progress_emoji(attribute: Optional[Any]) -> str:
@@ -3,15 +3,14 @@ from __future__ import annotations
 import asyncio
 import os
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import pandas as pd
 from discord import Interaction, Member, Role, File
 
 from Utilities import log, GlobalDataCenter
 
 if TYPE_CHECKING:
-    from Classes import StaffPartyBot, XIVVenue
+    from Classes import StaffPartyBot, XIVVenue, VenueOpening
 ################################################################################
 
 __all__ = ("ReportManager",)
@@ -68,6 +67,10 @@ class ReportManager:
             for role in roles:
                 data[role.name].append('Yes' if role in member_roles else 'No')
     
+        # pandas/openpyxl are only needed here, so they're imported on
+        # first use instead of at startup.
+        import pandas as pd
+        
         # Create a DataFrame
         df = pd.DataFrame(data)
     
@@ -112,19 +115,7 @@ class ReportManager:
             
         log.info("Core", f"Filtered venues count: {len(filtered_venues)}")
 
-        # Prepare the data structure
-        data = {
-            "Itinerary String": [],
-            "Venue Name": [],
-            "Data Center": [],
-            "Home World": [],
-            "Housing Div.": [],
-            "Ward": [],
-            "Plot": [],
-            "Open Time": [],
-            "Close Time": [],
-            "Tags": []
-        }
+        data = ReportManager._itinerary_columns()
         
         # Nightclubs sorted by DC
         # Everything else sorted by 
@@ -170,11 +161,79 @@ class ReportManager:
                     data["Tags"].append(", ".join(venue.tags[:3]) if venue.tags else "None")
                     data["Itinerary String"].append(venue.to_itinerary_string())
 
+        prefix = region.upper() if region else "FULL"
+        await ReportManager._send_itinerary(interaction, data, prefix, start_limit)
+        
+################################################################################
+    @staticmethod
+    async def local_itinerary_report(
+        interaction: Interaction,
+        openings: List[VenueOpening],
+        region: Optional[str]
+    ) -> None:
+        """The same report, built from this server's venues and their saved
+        hours instead of the FFXIV Venues API."""
+        
+        log.info("Core", f"Creating local itinerary report for region: {region}.")
+        
+        if region is not None:
+            dcs = GlobalDataCenter.data_centers_by_region(region)
+            openings = [o for o in openings if o.venue.location.data_center in dcs]
+        
+        log.info("Core", f"Filtered openings count: {len(openings)}")
+        
+        data = ReportManager._itinerary_columns()
+        
+        for opening in sorted(openings, key=lambda o: o.start):
+            location = opening.venue.location
+            data["Venue Name"].append(opening.venue.name)
+            data["Data Center"].append(location.data_center.proper_name if location.data_center else None)
+            data["Home World"].append(location.world.proper_name if location.world else None)
+            data["Housing Div."].append(location.zone.proper_name if location.zone else None)
+            data["Ward"].append(location.ward)
+            data["Plot"].append(location.plot)
+            data["Open Time"].append(opening.start.strftime("%H:%M %p"))
+            data["Close Time"].append(opening.end.strftime("%H:%M %p"))
+            data["Tags"].append(
+                ", ".join(t.tag_text for t in opening.venue.tags[:3]) if opening.venue.tags else "None"
+            )
+            data["Itinerary String"].append(opening.venue.to_itinerary_string())
+            
+        prefix = f"LOCAL_{region.upper()}" if region else "LOCAL"
+        await ReportManager._send_itinerary(interaction, data, prefix, datetime.now())
+        
+################################################################################
+    @staticmethod
+    def _itinerary_columns() -> Dict[str, List[Any]]:
+        
+        return {
+            "Itinerary String": [],
+            "Venue Name": [],
+            "Data Center": [],
+            "Home World": [],
+            "Housing Div.": [],
+            "Ward": [],
+            "Plot": [],
+            "Open Time": [],
+            "Close Time": [],
+            "Tags": []
+        }
+        
+################################################################################
+    @staticmethod
+    async def _send_itinerary(
+        interaction: Interaction,
+        data: Dict[str, List[Any]],
+        prefix: str,
+        start_limit: datetime
+    ) -> None:
+
+        import pandas as pd
+        
         # Create a DataFrame
         df = pd.DataFrame(data)
 
         date_str = start_limit.strftime("%Y-%m-%d")
-        prefix = region.upper() if region else "FULL"
         xl_path = f"{prefix}_itinerary_{date_str}.xlsx"
         
         # Write the DataFrame to an Excel file
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from discord import NotFound
+
+from Utilities import log, metrics
+################################################################################
+
+__all__ = ("Resolver",)
+
+Getter = Callable[[Any], Optional[Any]]
+Fetcher = Callable[[Any], Awaitable[Optional[Any]]]
+BulkFetcher = Callable[[List[Any]], Awaitable[Dict[Any, Any]]]
+
+################################################################################
+class Resolver:
+    """Resolves Discord objects by ID through the gateway cache, then a TTL'd
+    cache of earlier fetches, then the API.
+
+    Failed lookups (``NotFound``, or a fetcher returning ``None``) are cached
+    too, so deleted users, messages and channels aren't re-requested on every
+    call. Concurrent misses on the same ID share a single request. Other
+    errors are logged and never cached.
+
+    Expired entries are swept once the cache outgrows ``PURGE_THRESHOLD``,
+    and again each time it doubles since the last sweep. Past ``MAX_SIZE``
+    the oldest entries are evicted."""
+
+    __slots__ = (
+        "_cache",
+        "_inflight",
+        "_positive_ttl",
+        "_negative_ttl",
+        "_purge_at",
+    )
+
+    POSITIVE_TTL = 300  # seconds
+    NEGATIVE_TTL = 600  # seconds
+    CONCURRENCY = 10
+    PURGE_THRESHOLD = 10_000
+    MAX_SIZE = 100_000
+
+################################################################################
+    def __init__(
+        self,
+        positive_ttl: float = POSITIVE_TTL,
+        negative_ttl: float = NEGATIVE_TTL
+    ):
+
+        # (kind, key) -> (expires_at, value), oldest store first. ``None``
+        # marks a known miss.
+        self._cache: OrderedDict[Tuple[str, Hashable], Tuple[float, Optional[Any]]] = OrderedDict()
+        self._inflight: Dict[Tuple[str, Hashable], asyncio.Task] = {}
+
+        self._positive_ttl: float = positive_ttl
+        self._negative_ttl: float = negative_ttl
+        self._purge_at: int = self.PURGE_THRESHOLD
+
+################################################################################
+    def _peek(self, kind: str, key: Hashable) -> Tuple[bool, Optional[Any]]:
+
+        entry = self._cache.get((kind, key))
+        if entry is None:
+            return False, None
+
+        if entry[0] < time.monotonic():
+            del self._cache[(kind, key)]
+            return False, None
+
+        return True, entry[1]
+
+################################################################################
+    def store(self, kind: str, key: Hashable, value: Optional[Any]) -> None:
+
+        if len(self._cache) >= self._purge_at:
+            self.purge_expired()
+            # Amortized - the next sweep waits until the cache has doubled.
+            self._purge_at = max(self.PURGE_THRESHOLD, 2 * len(self._cache))
+
+        self._cache.pop((kind, key), None)
+        while len(self._cache) >= self.MAX_SIZE:
+            self._cache.popitem(last=False)
+            metrics.inc("lookup_cache_evictions_total")
+
+        ttl = self._positive_ttl if value is not None else self._negative_ttl
+        self._cache[(kind, key)] = (time.monotonic() + ttl, value)
+
+################################################################################
+    def invalidate(self, kind: str, key: Optional[Hashable] = None) -> None:
+
+        if key is not None:
+            self._cache.pop((kind, key), None)
+            return
+
+        for cache_key in [k for k in self._cache if k[0] == kind]:
+            del self._cache[cache_key]
+
+################################################################################
+    def purge_expired(self) -> int:
+
+        now = time.monotonic()
+        expired = [k for k, (expires, _) in self._cache.items() if expires < now]
+        for key in expired:
+            del self._cache[key]
+
+        return len(expired)
+
+################################################################################
+    async def resolve(
+        self,
+        kind: str,
+        key: Hashable,
+        get: Getter,
+        fetch: Fetcher
+    ) -> Optional[Any]:
+
+        log.info("Core", f"Getting or fetching {kind} {key}...")
+
+        if (ret := get(key)) is not None:
+            log.info("Core", f"{kind.capitalize()} found in cache.")
+            metrics.inc("lookups_total", kind=kind, result="hit", origin=metrics.origin)
+            return ret
+
+        found, ret = self._peek(kind, key)
+        if found:
+            result = "cached" if ret is not None else "negative"
+            metrics.inc("lookups_total", kind=kind, result=result, origin=metrics.origin)
+            return ret
+
+        task = self._inflight.get((kind, key))
+        if task is not None:
+            metrics.inc("lookups_total", kind=kind, result="coalesced", origin=metrics.origin)
+        else:
+            task = asyncio.create_task(self._fetch(kind, key, fetch))
+            self._inflight[(kind, key)] = task
+            task.add_done_callback(lambda _: self._inflight.pop((kind, key), None))
+
+        # Shielded so one caller being cancelled doesn't cancel the fetch
+        # everyone else is waiting on.
+        return await asyncio.shield(task)
+
+################################################################################
+    async def _fetch(self, kind: str, key: Hashable, fetch: Fetcher) -> Optional[Any]:
+
+        try:
+            with metrics.timer("lookup_fetch_seconds", kind=kind):
+                ret = await fetch(key)
+        except NotFound:
+            ret = None
+        except Exception as ex:
+            log.critical("Core", f"Error fetching {kind} {key}: {ex}")
+            metrics.inc("lookups_total", kind=kind, result="error", origin=metrics.origin)
+            return
+
+        self.store(kind, key, ret)
+
+        if ret is None:
+            log.warning("Core", f"{kind.capitalize()} {key} not found.")
+            metrics.inc("lookups_total", kind=kind, result="not_found", origin=metrics.origin)
+        else:
+            log.info("Core", f"{kind.capitalize()} fetched from Discord.")
+            metrics.inc("lookups_total", kind=kind, result="miss", origin=metrics.origin)
+
+        return ret
+
+################################################################################
+    async def resolve_many(
+        self,
+        kind: str,
+        keys: Iterable[Hashable],
+        get: Getter,
+        fetch: Fetcher,
+        bulk: Optional[BulkFetcher] = None,
+        authoritative: bool = False
+    ) -> Dict[Hashable, Optional[Any]]:
+        """Resolves every key in ``keys``.
+
+        Keys still missing after the gateway and TTL caches are handed to
+        ``bulk`` in one go, if given. Whatever it doesn't return is fetched
+        individually, at most ``CONCURRENCY`` at a time - unless the bulk
+        result is ``authoritative``, in which case those keys are recorded
+        as not found."""
+
+        ret: Dict[Hashable, Optional[Any]] = {}
+        missing: List[Hashable] = []
+
+        for key in dict.fromkeys(k for k in keys if k is not None):
+            if (value := get(key)) is not None:
+                metrics.inc("lookups_total", kind=kind, result="hit", origin=metrics.origin)
+                ret[key] = value
+                continue
+
+            found, value = self._peek(kind, key)
+            if found:
+                result = "cached" if value is not None else "negative"
+                metrics.inc("lookups_total", kind=kind, result=result, origin=metrics.origin)
+                ret[key] = value
+            else:
+                missing.append(key)
+
+        if not missing:
+            return ret
+
+        if bulk is not None and (len(missing) > 1 or authoritative):
+            try:
+                with metrics.timer("lookup_bulk_seconds", kind=kind):
+                    fetched = await bulk(missing)
+            except Exception as ex:
+                log.error("Core", f"Bulk {kind} fetch failed, falling back: {ex}")
+            else:
+                for key, value in fetched.items():
+                    self.store(kind, key, value)
+                    ret[key] = value
+                metrics.inc("lookups_total", len(fetched), kind=kind, result="bulk", origin=metrics.origin)
+
+                if authoritative:
+                    for key in missing:
+                        if key not in fetched:
+                            self.store(kind, key, None)
+                            ret[key] = None
+                    return ret
+
+                missing = [k for k in missing if k not in fetched]
+
+        sem = asyncio.Semaphore(self.CONCURRENCY)
+
+        async def one(key: Hashable) -> None:
+            async with sem:
+                ret[key] = await self.resolve(kind, key, get, fetch)
+
+        await asyncio.gather(*(one(k) for k in missing))
+
+        return ret
+
+################################################################################
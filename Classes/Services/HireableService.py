@@ -137,6 +137,7 @@ class HireableService:
     def update(self) -> None:
         
         self.bot.database.update.service(self)
+        self._mgr.names.refresh(self.id, self.name, self)
     
 ################################################################################
     def status(self) -> Embed:
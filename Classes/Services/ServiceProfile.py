@@ -81,6 +81,12 @@ class ServiceProfile:
         
         return self._service
     
+################################################################################
+    @property
+    def images(self) -> ServiceProfileImages:
+        
+        return self._images
+    
 ################################################################################
     @property
     def schedule(self) -> List[SAvailability]:
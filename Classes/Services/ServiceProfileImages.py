@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional, List
 
+from Utilities import attachment_urls
 from .SPAdditionalImage import SPAdditionalImage
 
 if TYPE_CHECKING:
@@ -38,13 +39,13 @@ class ServiceProfileImages:
     @property
     def thumbnail(self) -> Optional[str]:
         
-        return self._thumbnail
+        return attachment_urls.fresh(self._thumbnail)
     
 ################################################################################
     @property
     def main_image(self) -> Optional[str]:
         
-        return self._main_image
+        return attachment_urls.fresh(self._main_image)
     
 ################################################################################
     @property
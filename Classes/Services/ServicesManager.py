@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, List, Any, Dict, Optional
 
 from discord import Interaction
 
+from Classes.Common import NameIndex
 from .HireableService import HireableService
 from .ServiceProfile import ServiceProfile
 from UI.Common import ConfirmCancelView
@@ -22,6 +23,7 @@ class ServicesManager:
         "_guild",
         "_services",
         "_profiles",
+        "_names",
     )
     
 ################################################################################
@@ -30,6 +32,7 @@ class ServicesManager:
         self._guild: GuildData = guild
         self._services: List[HireableService] = []
         self._profiles: List[ServiceProfile] = []
+        self._names: NameIndex[HireableService] = NameIndex()
         
 ################################################################################
     async def _load_all(self, data: Dict[str, Any]) -> None:
@@ -38,6 +41,7 @@ class ServicesManager:
         self._profiles = [
             await ServiceProfile.load(self, p) for p in data["service_profiles"]
         ]
+        self._names.rebuild((s.id, s.name, s) for s in self._services)
     
 ################################################################################
     @property
@@ -57,12 +61,22 @@ class ServicesManager:
         
         return self._guild.guild_id
     
+################################################################################
+    @property
+    def profiles(self) -> List[ServiceProfile]:
+        
+        return self._profiles
+    
+################################################################################
+    @property
+    def names(self) -> NameIndex[HireableService]:
+        
+        return self._names
+    
 ################################################################################
     def get_service_by_name(self, name: str) -> Optional[HireableService]:
         
-        for service in self._services:
-            if service.name.lower() == name.lower():
-                return service
+        return self._names.get(name)
     
 ################################################################################
     async def add_service(self, interaction: Interaction, name: str) -> None:
@@ -89,6 +103,7 @@ class ServicesManager:
         
         service = HireableService.new(self, name)
         self._services.append(service)
+        self._names.refresh(service.id, service.name, service)
         
         await service.menu(interaction)
         
@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Optional
+
+import pytz
+from discord import ForumChannel, HTTPException, Message, Thread
+from discord.utils import snowflake_time
+
+from Utilities import log, metrics
+
+if TYPE_CHECKING:
+    from Classes import GuildData
+################################################################################
+
+__all__ = ("ThreadRegistry", "ForumThreads")
+
+# Discord's "Thread is archived" error code.
+THREAD_ARCHIVED = 50083
+
+################################################################################
+class ForumThreads:
+    """One forum's threads, active and archived, by ID and by name."""
+
+    __slots__ = (
+        "_by_id",
+        "_by_name",
+        "_lock",
+        "loaded",
+    )
+
+################################################################################
+    def __init__(self) -> None:
+
+        self._by_id: Dict[int, Thread] = {}
+        # Casefolded name -> thread ID; the first thread with a name keeps it.
+        self._by_name: Dict[str, int] = {}
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+        self.loaded: bool = False
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._by_id)
+
+################################################################################
+    def __iter__(self) -> Iterator[Thread]:
+
+        return iter(list(self._by_id.values()))
+
+################################################################################
+    def __contains__(self, thread_id: int) -> bool:
+
+        return thread_id in self._by_id
+
+################################################################################
+    async def load(self, forum: ForumChannel) -> None:
+
+        async with self._lock:
+            if self.loaded:
+                return
+
+            for thread in forum.threads:
+                self.add(thread)
+            async for thread in forum.archived_threads(limit=None):
+                self.add(thread)
+
+            self.loaded = True
+
+        log.debug("Core", f"Loaded {len(self)} thread(s) for forum {forum.name}.")
+
+################################################################################
+    def get(self, thread_id: int) -> Optional[Thread]:
+
+        return self._by_id.get(thread_id)
+
+################################################################################
+    def find(self, name: str) -> Optional[Thread]:
+
+        thread_id = self._by_name.get(name.casefold())
+        return self._by_id.get(thread_id) if thread_id is not None else None
+
+################################################################################
+    def add(self, thread: Thread) -> None:
+
+        old = self._by_id.get(thread.id)
+        if old is not None and old.name != thread.name:
+            self._drop_name(old)
+
+        self._by_id[thread.id] = thread
+        self._by_name.setdefault(thread.name.casefold(), thread.id)
+
+################################################################################
+    def remove(self, thread_id: int) -> Optional[Thread]:
+
+        thread = self._by_id.pop(thread_id, None)
+        if thread is not None:
+            self._drop_name(thread)
+
+        return thread
+
+################################################################################
+    def _drop_name(self, thread: Thread) -> None:
+
+        key = thread.name.casefold()
+        if self._by_name.get(key) != thread.id:
+            return
+
+        del self._by_name[key]
+        # Hand the name to another thread that has it, if there is one.
+        for other in self._by_id.values():
+            if other.id != thread.id and other.name.casefold() == key:
+                self._by_name[key] = other.id
+                break
+
+################################################################################
+class ThreadRegistry:
+    """The guild's forum threads, archived ones included, so posts can be
+    found by name without scanning ``channel.threads`` (which only holds
+    active threads) and edited without tripping over auto-archival.
+
+    Every thread's archive deadline is worked out from its last activity and
+    auto-archive duration. Edits reopen a thread that is archived, or past its
+    deadline, with one ``archived=False`` before editing; bulk jobs and the
+    keep-alive pass reopen every thread they're about to touch up front, at a
+    paced rate."""
+
+    __slots__ = (
+        "_guild",
+        "_forums",
+        "_next_start",
+    )
+
+    # Thread edits share a per-guild limit on top of the per-channel ones.
+    UNARCHIVES_PER_SECOND = 5.0
+
+################################################################################
+    def __init__(self, guild: GuildData) -> None:
+
+        self._guild: GuildData = guild
+
+        # Forum channel ID -> its threads.
+        self._forums: Dict[int, ForumThreads] = {}
+        self._next_start: float = 0.0
+
+################################################################################
+    def _forum(self, forum_id: int) -> ForumThreads:
+
+        forum = self._forums.get(forum_id)
+        if forum is None:
+            forum = self._forums[forum_id] = ForumThreads()
+
+        return forum
+
+################################################################################
+    async def forum(self, channel: ForumChannel) -> ForumThreads:
+        """``channel``'s threads, fetching its archived ones the first time."""
+
+        forum = self._forum(channel.id)
+        if not forum.loaded:
+            await forum.load(channel)
+
+        return forum
+
+################################################################################
+    async def find(self, channel: Optional[ForumChannel], name: str) -> Optional[Thread]:
+
+        if channel is None:
+            return None
+
+        thread = (await self.forum(channel)).find(name)
+        metrics.inc("lookups_total", kind="thread", result="hit" if thread else "miss", origin=metrics.origin)
+
+        return thread
+
+################################################################################
+    def get(self, thread_id: int) -> Optional[Thread]:
+
+        for forum in self._forums.values():
+            if (thread := forum.get(thread_id)) is not None:
+                return thread
+
+################################################################################
+    def track(self, thread: Thread) -> None:
+        """Records a thread the bot just created or edited."""
+
+        self._forum(thread.parent_id).add(thread)
+
+################################################################################
+    def refresh(self, thread: Thread) -> None:
+        """Takes a gateway update for a thread, if its forum is followed."""
+
+        if thread.parent_id in self._forums:
+            self._forum(thread.parent_id).add(thread)
+
+################################################################################
+    def remove(self, thread_id: int) -> None:
+
+        for forum in self._forums.values():
+            if forum.remove(thread_id) is not None:
+                return
+
+################################################################################
+    def _current(self, thread: Thread) -> Thread:
+
+        # A message's ``channel`` can be an older copy than the registry's.
+        return self.get(thread.id) or thread
+
+################################################################################
+    @staticmethod
+    def deadline(thread: Thread) -> Optional[datetime]:
+        """When ``thread`` auto-archives if nothing happens in it."""
+
+        if not getattr(thread, "auto_archive_duration", None):
+            return None
+
+        last = thread.archive_timestamp
+        if thread.last_message_id:
+            last = max(last, snowflake_time(thread.last_message_id))
+
+        return last + timedelta(minutes=thread.auto_archive_duration)
+
+################################################################################
+    def is_archived(self, thread: Any) -> bool:
+
+        # Text channels (and anything else that isn't a thread) never are.
+        if getattr(thread, "archived", None) is None:
+            return False
+
+        thread = self._current(thread)
+        if thread.archived:
+            return True
+
+        deadline = self.deadline(thread)
+        return deadline is not None and deadline <= datetime.now(pytz.utc)
+
+################################################################################
+    async def ensure_open(self, thread: Any, reason: str = "edit") -> bool:
+        """Unarchives ``thread`` if it is (or should by now be) archived.
+        Returns whether a request was made."""
+
+        if not self.is_archived(thread):
+            return False
+
+        thread = self._current(thread)
+        try:
+            thread = await thread.edit(archived=False)
+        except HTTPException as ex:
+            log.warning("Core", f"Couldn't unarchive thread {thread.name} ({thread.id}): {ex}")
+            metrics.inc("thread_unarchives_total", reason=reason, result="failed")
+            return False
+
+        self.track(thread)
+        metrics.inc("thread_unarchives_total", reason=reason, result="ok")
+
+        return True
+
+################################################################################
+    async def _pace(self) -> None:
+
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        self._next_start = start + 1 / self.UNARCHIVES_PER_SECOND
+        if start > now:
+            await asyncio.sleep(start - now)
+
+################################################################################
+    async def ensure_open_many(self, threads: Iterable[Any], reason: str = "bulk") -> int:
+        """Reopens every archived thread in ``threads`` ahead of a run of
+        edits to them, so none of those edits has to."""
+
+        seen = set()
+        archived = []
+        for thread in threads:
+            if thread is None or thread.id in seen:
+                continue
+            seen.add(thread.id)
+            if self.is_archived(thread):
+                archived.append(thread)
+
+        if not archived:
+            return 0
+
+        log.info("Core", f"Unarchiving {len(archived)} thread(s) ahead of {reason}...")
+
+        count = 0
+        for thread in archived:
+            await self._pace()
+            count += await self.ensure_open(thread, reason)
+
+        return count
+
+################################################################################
+    async def edit_message(self, message: Message, **kwargs) -> Message:
+        """``message.edit(**kwargs)``, reopening its thread first if needed.
+        Should the thread have been archived without the registry knowing,
+        the edit is retried once after reopening it."""
+
+        await self.ensure_open(message.channel)
+        try:
+            return await message.edit(**kwargs)
+        except HTTPException as ex:
+            if ex.code != THREAD_ARCHIVED:
+                raise
+
+        log.warning("Core", f"Thread {message.channel.id} was archived unexpectedly - reopening.")
+        self._current(message.channel).archived = True
+        await self.ensure_open(message.channel, "retry")
+
+        return await message.edit(**kwargs)
+
+################################################################################
+    async def edit_thread(self, thread: Thread, **kwargs) -> Thread:
+        """``thread.edit(**kwargs)``, unarchiving it in the same request."""
+
+        if self.is_archived(thread):
+            kwargs.setdefault("archived", False)
+            metrics.inc("thread_unarchives_total", reason="thread_edit", result="ok")
+
+        thread = await self._current(thread).edit(**kwargs)
+        self.track(thread)
+
+        return thread
+
+################################################################################
+    def _post_threads(self) -> Iterator[Optional[Thread]]:
+
+        guild = self._guild
+        for profile in guild.profile_manager.profiles:
+            yield getattr(profile.post_message, "channel", None)
+        for venue in guild.venue_manager.venues:
+            yield getattr(venue.post_message, "channel", None)
+        for posting in guild.jobs_manager.all_postings:
+            yield getattr(posting.post_message, "channel", None)
+
+################################################################################
+    async def keep_alive(self) -> int:
+        """Reopens the threads holding the guild's profile, venue and job
+        posts that have archived since the last pass."""
+
+        return await self.ensure_open_many(self._post_threads(), "keep-alive")
+
+################################################################################
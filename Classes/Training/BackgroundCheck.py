@@ -7,7 +7,6 @@ from discord import Interaction, Embed, EmbedField, Message, User
 
 from Assets import BotEmojis
 from UI.Common import ConfirmCancelView
-from UI.Guild import BGCheckApprovalView
 from UI.Training import (
     BGCheckNamesModal,
     BGCheckMenuView,
@@ -92,10 +91,6 @@ class BackgroundCheck:
         self._prev_exp = data[8]
         
         self._post_msg = await parent.guild.get_or_fetch_message(data[9])
-        if self._post_msg is not None:
-            view = BGCheckApprovalView(self)
-            await self.post_message.edit(view=view)
-            parent.bot.add_view(view, message_id=self._post_msg.id)
             
         self._submitted = data[10]
         self._approved_at = data[11]
@@ -321,7 +321,7 @@ class GroupTraining:
     def delete(self) -> None:
         
         self._mgr.bot.database.delete.group_training(self)
-        self._mgr.groups.remove(self)
+        self._mgr._deregister_group(self)
         
 ################################################################################
     def get_signup_by_user(self, user: TUser) -> Optional[GroupTrainingSignup]:
@@ -622,7 +622,7 @@ class GroupTraining:
             await interaction.respond(embed=error, ephemeral=True)
             return
 
-        if self.post_message is not None and await self._update_post_components():
+        if await self._mgr.guild.edits.flush(self.post_message, self._update_post_components):
             confirm = U.make_embed(
                 title="Group Training Updated",
                 description="The group training has been updated."
@@ -657,7 +657,6 @@ class GroupTraining:
             return
 
         post_view = GroupTrainingPickupView(self)
-        self.bot.add_view(post_view)
 
         channel = self._mgr.guild.channel_manager.group_training_channel
 
@@ -711,7 +710,6 @@ class GroupTraining:
 
         try:
             view = GroupTrainingPickupView(self)
-            self.bot.add_view(view, message_id=self.post_message.id)
             await self.post_message.edit(embed=self.status(), view=view)
         except NotFound as ex:
             log.error(
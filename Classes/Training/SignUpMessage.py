@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Tuple, Any, List
+import asyncio
+from typing import TYPE_CHECKING, Optional, Tuple, Any, List, Dict
 
 from discord import (
     Message,
@@ -15,10 +16,10 @@ from discord import (
 
 from UI.Common import ConfirmCancelView
 from UI.Training import TrainerMessageButtonView, TrainerSignUpSelectView, AcquireTraineeView
-from Utilities import Utilities as U, log
+from Utilities import Utilities as U, log, EntityChange
 
 if TYPE_CHECKING:
-    from Classes import StaffPartyBot, TrainingManager, PositionManager
+    from Classes import StaffPartyBot, TrainingManager, PositionManager, Training, TUser, EntityEvent
 ################################################################################
 
 __all__ = ("SignUpMessage",)
@@ -30,7 +31,11 @@ class SignUpMessage:
         "_manager",
         "_channel",
         "_message",
+        "_buckets",
+        "_pending_edit",
     )
+    
+    EDIT_DELAY = 3  # seconds
 
 ################################################################################
     def __init__(self, mgr: TrainingManager):
@@ -39,6 +44,13 @@ class SignUpMessage:
 
         self._channel: Optional[TextChannel] = None
         self._message: Optional[Message] = None
+        
+        # Position ID -> {Training ID -> pre-rendered board line}
+        self._buckets: Dict[str, Dict[str, str]] = {}
+        self._pending_edit: Optional[asyncio.Task] = None
+        
+        mgr.guild.events.subscribe("training", self._on_training_event)
+        mgr.guild.events.subscribe("tuser", self._on_tuser_event)
 
 ################################################################################
     async def load(self, data: Tuple[Any, ...]) -> None:
@@ -46,6 +58,8 @@ class SignUpMessage:
         guild_id = data[0]
         channel_id = data[1]
         message_id = data[2]
+        
+        self.rebuild_buckets()
 
         if channel_id is None:
             return
@@ -132,32 +146,72 @@ class SignUpMessage:
 ################################################################################
     def available_trainee_fields(self) -> List[EmbedField]:
 
-        position_dict = { 
-            p.name: [] 
-            for p in self._manager.guild.position_manager.positions 
-        }
-
-        for training in self._manager.unmatched_trainings:
-            if not training.trainee.on_hiatus and len(training.trainee.availability) != 0:
-                position_dict[training.position.name].append(training)
-
         fields = []
-        for position_name, trainings in position_dict.items():
-            value = ""
-            if len(trainings) == 0:
-                value = "`No trainees available.`\n"
-            else:
-                for t in trainings:
-                    dc = (
-                        "" if not t.trainee.data_centers 
-                        else f" - *({'/'.join([dc.abbreviation for dc in t.trainee.data_centers])})*"
-                    )
-                    value += f"`{t.trainee.name}`{dc} - {t.trainee.user.mention}\n"
-
-            fields.append(EmbedField(name=position_name, value=value, inline=False))
+        for position in self.position_manager.positions:
+            lines = self._buckets.get(position.id)
+            value = "".join(lines.values()) if lines else "`No trainees available.`\n"
+            fields.append(EmbedField(name=position.name, value=value, inline=False))
 
         return fields
 
+################################################################################
+    @staticmethod
+    def _render_line(training: Training) -> Optional[str]:
+        
+        trainee = training.trainee
+        if training.trainer is not None or trainee.on_hiatus or not trainee.availability:
+            return
+        
+        dc = (
+            "" if not trainee.data_centers
+            else f" - *({'/'.join([dc.abbreviation for dc in trainee.data_centers])})*"
+        )
+        return f"`{trainee.name}`{dc} - {trainee.user.mention}\n"
+    
+################################################################################
+    def rebuild_buckets(self) -> None:
+        
+        self._buckets = {}
+        self._manager.guild.events.replay("training", self._on_training_event)
+            
+################################################################################
+    def refresh_training(self, training: Training) -> None:
+        
+        bucket = self._buckets.setdefault(training.position.id, {})
+        line = self._render_line(training)
+        
+        if line is None:
+            bucket.pop(training.id, None)
+        else:
+            bucket[training.id] = line
+            
+################################################################################
+    def refresh_trainee(self, tuser: TUser) -> None:
+        
+        for training in tuser.trainings_as_trainee:
+            self.refresh_training(training)
+            
+################################################################################
+    def _on_training_event(self, event: EntityEvent) -> None:
+        
+        if event.change == EntityChange.Deleted:
+            self.drop_training(event.entity)
+        else:
+            self.refresh_training(event.entity)
+            
+################################################################################
+    def _on_tuser_event(self, event: EntityEvent) -> None:
+        
+        if event.change == EntityChange.Updated:
+            self.refresh_trainee(event.entity)
+            
+################################################################################
+    def drop_training(self, training: Training) -> None:
+        
+        bucket = self._buckets.get(training.position.id)
+        if bucket is not None:
+            bucket.pop(training.id, None)
+
 ################################################################################
     async def post(self, interaction: Interaction, channel: TextChannel) -> None:
         
@@ -176,6 +230,7 @@ class SignUpMessage:
             log.info("Training", f"SignupMessage already exists, deleting.")
             await self._message.delete()
 
+        self._cancel_pending_edit()
         view = TrainerMessageButtonView(self)
     
         self._message = await self._channel.send(embed=self.status(), view=view)
@@ -199,6 +254,45 @@ class SignUpMessage:
         if self._channel is None or self._message is None:
             return
         
+        # Bursts of signups/matches collapse into a single edit once the
+        # delay has elapsed.
+        if self._pending_edit is not None and not self._pending_edit.done():
+            return
+        
+        self._pending_edit = asyncio.create_task(self._delayed_flush())
+        
+################################################################################
+    async def _delayed_flush(self) -> None:
+        
+        await asyncio.sleep(self.EDIT_DELAY)
+        
+        # Clear the handle before editing so changes made while the edit is
+        # in flight schedule a fresh one.
+        self._pending_edit = None
+        try:
+            await self.flush()
+        except NotFound:
+            log.warning("Training", "SignupMessage no longer exists; it will need to be posted again.")
+            self._message = None
+        except HTTPException as ex:
+            log.error("Training", f"Failed to update SignupMessage components: {ex}")
+        
+################################################################################
+    def _cancel_pending_edit(self) -> None:
+        
+        if self._pending_edit is not None and not self._pending_edit.done():
+            if self._pending_edit is not asyncio.current_task():
+                self._pending_edit.cancel()
+        self._pending_edit = None
+        
+################################################################################
+    async def flush(self) -> None:
+        
+        if self._channel is None or self._message is None:
+            return
+        
+        self._cancel_pending_edit()
+        
         log.info(
             "Training",
             (
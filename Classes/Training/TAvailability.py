@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from datetime import time, datetime, timedelta
+from datetime import time
 from typing import TYPE_CHECKING, List, Type, TypeVar, Any, Tuple, Dict
 
 from Classes.Common import Availability
-from Utilities import Utilities as U, Weekday
+from Utilities import Weekday, time_tables
 
 if TYPE_CHECKING:
     from Classes import TUser
@@ -70,34 +70,27 @@ class TAvailability(Availability):
     @staticmethod
     def combine_availability(user1: TUser, user2: TUser) -> Dict[Weekday, List[Tuple[time, time]]]:
 
-        def time_difference(start: time, end: time) -> timedelta:
-            """Calculate the difference between two time objects, considering the end time might be midnight."""
-            # If end time is midnight, treat it as 24 hours (end of the day)
-            if end == time(0, 0):  # time(0, 0) represents midnight
-                end = time(23, 59)  # Adjust to one minute before midnight for calculation
-                return datetime.combine(datetime.today(), end) - datetime.combine(datetime.today(), start) + timedelta(minutes=1)
-            else:
-                return datetime.combine(datetime.today(), end) - datetime.combine(datetime.today(), start)
+        def day_end(a: TAvailability) -> int:
+            # An end time of midnight means the end of the day.
+            return a.end_minute if a.end_time != time(0, 0) else a.start_minute - a.start_minute % 1440 + 1440
 
         common_availability = {}
-        # Extract and map availabilities by day for easier comparison
-        user1_avail_by_day = {a.day: (a.start_time, a.end_time) for a in user1.availability}
-        user2_avail_by_day = {a.day: (a.start_time, a.end_time) for a in user2.availability}
-    
-        # Iterate through the availability of the first user
-        for day, time_range_user1 in user1_avail_by_day.items():
-            # Check if the second user has availability on the same day
-            if day in user2_avail_by_day:
-                time_range_user2 = user2_avail_by_day[day]
-                # Calculate the overlap between the two users' time ranges
-                start_max = max(time_range_user1[0], time_range_user2[0])
-                end_min = min(time_range_user1[1], time_range_user2[1])
+        # Map availabilities by day for easier comparison
+        user1_avail_by_day = {a.day: a for a in user1.availability}
+        user2_avail_by_day = {a.day: a for a in user2.availability}
     
-                # Check if there's at least an hour overlap
-                if time_difference(start_max, end_min) >= timedelta(hours=1):
-                    if day not in common_availability:
-                        common_availability[day] = []
-                    common_availability[day].append((start_max, end_min))
+        for day, a in user1_avail_by_day.items():
+            b = user2_avail_by_day.get(day)
+            if b is None:
+                continue
+
+            # Overlap in minutes of the week; at least an hour counts.
+            start_max = max(a.start_minute, b.start_minute)
+            end_min = min(day_end(a), day_end(b))
+            if end_min - start_max >= 60:
+                common_availability.setdefault(day, []).append(
+                    (time_tables.to_slot(start_max)[1], time_tables.to_slot(end_min)[1])
+                )
     
         return common_availability
 
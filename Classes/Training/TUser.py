@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from datetime import datetime, time
-from typing import TYPE_CHECKING, List, Optional, Type, TypeVar, Any, Dict, Tuple, Union
+from functools import partial
+from typing import TYPE_CHECKING, List, Optional, Type, TypeVar, Any, Dict, Tuple, Union, FrozenSet
 
 import pytz
 from discord import User, Embed, EmbedField, Interaction, SelectOption, Member, Forbidden
@@ -28,7 +29,8 @@ from Utilities import (
     Weekday,
     RoleType,
     DTOperations,
-    PayAlreadyRequestedError
+    PayAlreadyRequestedError,
+    time_tables
 )
 from .BackgroundCheck import BackgroundCheck
 from .Qualification import Qualification
@@ -47,7 +49,8 @@ if TYPE_CHECKING:
         JobPosting,
         Profile,
         Venue,
-        GroupTraining
+        GroupTraining,
+        DepartureBatch
     )
 ################################################################################
 
@@ -69,6 +72,9 @@ class TUser:
         "_bg_check",
         "_mutes",
         "_pay_requested",
+        "_quals_sorted",
+        "_avail_sorted",
+        "_qual_ids",
     )
 
 ################################################################################
@@ -96,6 +102,8 @@ class TUser:
         self._mutes: List[Venue] = mutes or []
         
         self._pay_requested = False
+        self._invalidate_qualifications()
+        self._invalidate_availability()
 
 ################################################################################
     @classmethod
@@ -119,6 +127,10 @@ class TUser:
         self._mutes = []
         
         self._pay_requested = False
+        self._invalidate_qualifications()
+        self._invalidate_availability()
+        
+        manager.guild.events.created("tuser", self, user.id)
 
         return self
 
@@ -145,6 +157,8 @@ class TUser:
         ] if tuser[2] is not None else []
         
         self._pay_requested = False
+        self._invalidate_qualifications()
+        self._invalidate_availability()
 
         return self
 
@@ -220,14 +234,30 @@ class TUser:
     @property
     def qualifications(self) -> List[Qualification]:
 
-        self._qualifications.sort(key=lambda q: q.position.name)
+        if not self._quals_sorted:
+            self._qualifications.sort(key=lambda q: q.position.name)
+            self._quals_sorted = True
         return self._qualifications
 
+################################################################################
+    @property
+    def qualified_position_ids(self) -> FrozenSet[str]:
+        
+        if self._qual_ids is None:
+            self._qual_ids = frozenset(q.position.id for q in self._qualifications)
+        return self._qual_ids
+    
+################################################################################
+    def _invalidate_qualifications(self) -> None:
+        
+        self._quals_sorted = False
+        self._qual_ids = None
+        
 ################################################################################
     @property
     def is_trainer(self) -> bool:
         
-        return len(self.qualifications) > 0
+        return len(self._qualifications) > 0
     
 ################################################################################
     @property
@@ -239,14 +269,21 @@ class TUser:
     @property
     def availability(self) -> List[TAvailability]:
 
-        self._availability.sort(key=lambda a: a.day.value)
+        if not self._avail_sorted:
+            self._availability.sort(key=lambda a: a.day.value)
+            self._avail_sorted = True
         return self._availability
 
+################################################################################
+    def _invalidate_availability(self) -> None:
+        
+        self._avail_sorted = False
+
 ################################################################################
     @property
     def trainings_as_trainee(self) -> List[Training]:
 
-        ret = [t for t in self.training_manager.all_trainings if t.trainee == self]
+        ret = self._manager.get_trainings_by_trainee(self.user_id).copy()
         ret.sort(key=lambda t: t.position.name)
         return ret
 
@@ -254,7 +291,7 @@ class TUser:
     @property
     def trainings_as_trainer(self) -> List[Training]:
         
-        ret = [t for t in self.training_manager.all_trainings if t.trainer == self]
+        ret = self._manager.get_trainings_by_trainer(self.user_id).copy()
         ret.sort(key=lambda t: t.position.name)
         return ret
     
@@ -272,13 +309,19 @@ class TUser:
     @property   
     def unsettled_groups(self) -> List[GroupTraining]:
             
-        return [gt for gt in self._manager.unpaid_groups if gt.trainer == self]
+        return [
+            gt for gt in self._manager.get_groups_by_trainer(self.user_id)
+            if gt.is_complete and not gt.is_paid
+        ]
     
 ################################################################################
     @property
     def unmatched_trainings(self) -> List[Training]:
         
-        return [t for t in self._manager.unmatched_trainings if t.trainee == self]
+        return [
+            t for t in self._manager.get_trainings_by_trainee(self.user_id)
+            if t.trainer is None
+        ]
     
 ################################################################################    
     @property
@@ -319,7 +362,7 @@ class TUser:
 ################################################################################
     def is_qualified(self, position_id: str) -> bool:
         
-        return any(q.position.id == position_id for q in self.qualifications)
+        return position_id in self.qualified_position_ids
     
 ################################################################################
     def admin_status(self) -> Embed:
@@ -487,6 +530,7 @@ class TUser:
     async def set_name(self, interaction: Interaction) -> None:
 
         await self._details.set_name(interaction)
+        await self._refresh_signup_board()
 
 ################################################################################
     async def set_notes(self, interaction: Interaction) -> None:
@@ -497,6 +541,13 @@ class TUser:
     async def set_data_centers(self, interaction: Interaction) -> None:
 
         await self._details.set_data_centers(interaction)
+        await self._refresh_signup_board()
+        
+################################################################################
+    async def _refresh_signup_board(self) -> None:
+        
+        # The board's lines were refreshed by the update event.
+        await self._manager.signup_message.update_components()
         
 ################################################################################
     async def set_availability(self, interaction: Interaction) -> None:
@@ -512,14 +563,17 @@ class TUser:
 
         tz, weekday, start_time, end_time = result
 
-        for i, a in enumerate(self.availability):
-            if a.day == weekday:
-                self._availability.pop(i).delete()
+        for a in [a for a in self._availability if a.day == weekday]:
+            self._availability.remove(a)
+            a.delete()
 
         if start_time is not None:
             availability = TAvailability.new(self, weekday, start_time, end_time)
             self._availability.append(availability)
+            
+        self._invalidate_availability()
 
+        await self._refresh_signup_board()
         await self._manager.notify_of_availability_change(self)
         
         log.info("Training", f"Availability setup complete for {weekday.proper_name}.")
@@ -549,7 +603,7 @@ class TUser:
         base_options = self.position_manager.select_options()
         options = [
             o for o in base_options
-            if o.value not in [q.position.id for q in self._qualifications]
+            if o.value not in self.qualified_position_ids
         ]
 
         view = AddQualificationView(interaction.user, options)
@@ -572,6 +626,8 @@ class TUser:
         for position in positions:
             qualification = Qualification.new(self.training_manager, self.user, position, level)
             self._qualifications.append(qualification)
+            
+        self._invalidate_qualifications()
 
 ################################################################################
     async def modify_qualification(self, interaction: Interaction) -> None:
@@ -694,6 +750,8 @@ class TUser:
             qualification.delete()
             self._qualifications.remove(qualification)
             
+        self._invalidate_qualifications()
+            
         log.info("Training", "Qualification removal complete.")
 
 ################################################################################
@@ -829,8 +887,8 @@ class TUser:
             for t in times:
                 value += (
                     f"* **{a.proper_name}:** "
-                    f"{U.format_dt(U.time_to_datetime(t[0]), 't')} - "
-                    f"{U.format_dt(U.time_to_datetime(t[1]), 't')}\n"
+                    f"{time_tables.slot_timestamp(a, t[0])} - "
+                    f"{time_tables.slot_timestamp(a, t[1])}\n"
                 )
                 
         url_value = ""
@@ -876,8 +934,8 @@ class TUser:
             for t in times:
                 value += (
                     f"* **{a.proper_name}:** "
-                    f"{U.format_dt(U.time_to_datetime(t[0]), 't')} - "
-                    f"{U.format_dt(U.time_to_datetime(t[1]), 't')}\n"
+                    f"{time_tables.slot_timestamp(a, t[0])} - "
+                    f"{time_tables.slot_timestamp(a, t[1])}\n"
                 )
 
         url_value = ""
@@ -1055,7 +1113,7 @@ class TUser:
             )
         )
         
-        await self.training_manager.signup_message.update_components()
+        await self._refresh_signup_board()
         await self.guild.log.tuser_hiatus(self)
         
 ################################################################################
@@ -1428,23 +1486,33 @@ class TUser:
             await self.training_manager.get_training(training_id).set_trainer(None)
 
 ################################################################################
-    async def on_server_leave(self) -> Tuple[int, int]:
+    def on_server_leave(self, batch: DepartureBatch) -> Tuple[int, int]:
         
         modified = 0
         deleted = 0
         
         for t in self.trainings_as_trainer:
-            await t.set_trainer(None)
+            t._reassign(None)
+            batch.defer(f"training {t.id}", partial(t._notify_reassigned, self, None))
             modified += 1
             
         for t in self.trainings_as_trainee:
-            await self.training_manager.remove_training(t.id)
+            t.delete()
             deleted += 1
             
         for gt in self.unsettled_groups:
-            await self._manager._delete_group_training(gt)
+            gt.delete()
+            batch.defer(f"group training {gt.id}", partial(self._manager._announce_group_canceled, gt))
             deleted += 1
             
+        if modified or deleted:
+            # One edit covers every training the batch touched.
+            batch.defer(
+                "training signup message",
+                self._manager.signup_message.update_components,
+                key=self._manager.signup_message
+            )
+            
         log.info(
             "Training",
             (
@@ -156,13 +156,21 @@ class Training:
     def delete(self) -> None:
 
         self.bot.database.delete.training(self)
-        self.manager._trainings.remove(self)
+        self.manager._deregister_training(self)
+        self.manager.guild.events.deleted("training", self)
 
 ################################################################################
     def update(self) -> None:
 
         self.bot.database.update.training(self)
+        self.manager.guild.events.updated("training", self)
 
+################################################################################
+    def _assign_trainer(self, trainer: Optional[TUser]) -> None:
+        
+        self.manager._reassign_trainer(self, self._trainer, trainer)
+        self._trainer = trainer
+        
 ################################################################################
     async def set_trainer(self, trainer: Optional[TUser], send_confirmation: bool = True) -> None:
         
@@ -173,10 +181,32 @@ class Training:
 
         prev_trainer = self.trainer
         
+        self._reassign(trainer)
+        await self._notify_reassigned(prev_trainer, trainer, send_confirmation)
+        
+        log.info(
+            "Training",
+            (
+                f"Trainer for {self._trainee.name} has been set to "
+                f"{trainer.name if trainer else None}."
+            )
+        )
+        
+################################################################################
+    def _reassign(self, trainer: Optional[TUser]) -> None:
+        
         self.reset()
-        self._trainer = trainer
+        self._assign_trainer(trainer)
         self.update()
         
+################################################################################
+    async def _notify_reassigned(
+        self,
+        prev_trainer: Optional[TUser],
+        trainer: Optional[TUser],
+        send_confirmation: bool = True
+    ) -> None:
+        
         if trainer is None:
             confirm = U.make_embed(
                 title="Training Updated",
@@ -196,8 +226,8 @@ class Training:
                     f"Your training for `{self._position.name}` has been\n"
                     f"updated with a new trainer.\n\n"
                     
-                    f"Your trainer is now `{self._trainer.name}` "
-                    f"({self._trainer.user.mention})!\n\n"
+                    f"Your trainer is now `{trainer.name}` "
+                    f"({trainer.user.mention})!\n\n"
                     
                     f"{closing}\n"
                     f"{U.draw_line(text=closing)}\n"
@@ -219,14 +249,6 @@ class Training:
             
         await self.manager.signup_message.update_components()
         
-        log.info(
-            "Training",
-            (
-                f"Trainer for {self._trainee.name} has been set to "
-                f"{trainer.name if trainer else None}."
-            )
-        )
-        
 ################################################################################
     def status_page(self, owner: User) -> Page:
         
@@ -414,7 +436,7 @@ class Training:
 ################################################################################
     def reset(self) -> None:
         
-        self._trainer = None
+        self._assign_trainer(None)
         self._overrides = {}
         
         self.update()
@@ -46,7 +46,7 @@ from .TUser import TUser
 from .Training import Training
 
 if TYPE_CHECKING:
-    from Classes import StaffPartyBot, GuildData, Position
+    from Classes import StaffPartyBot, GuildData, Position, DepartureBatch
 ################################################################################
 
 __all__ = ("TrainingManager",)
@@ -60,6 +60,10 @@ class TrainingManager:
         "_trainings",
         "_message",
         "_groups",
+        "_tuser_index",
+        "_trainee_index",
+        "_trainer_index",
+        "_group_index",
     )
 
 ################################################################################
@@ -71,37 +75,45 @@ class TrainingManager:
         self._trainings: List[Training] = []
         self._groups: List[GroupTraining] = []
         
+        # Reverse indexes keyed by user ID so per-user views don't have to
+        # scan the whole guild's training lists.
+        self._tuser_index: Dict[int, TUser] = {}
+        self._trainee_index: Dict[int, List[Training]] = defaultdict(list)
+        self._trainer_index: Dict[int, List[Training]] = defaultdict(list)
+        self._group_index: Dict[int, List[GroupTraining]] = defaultdict(list)
+        
         self._message: SignUpMessage = SignUpMessage(self)
 
 ################################################################################
     async def _load_all(self, data: Dict[str, Any]) -> None:
 
         payload = self._parse_data(data)
+        users = await self.guild.resolve_many(
+            "user", [record["tuser"][0] for record in payload["tusers"].values()]
+        )
 
         for _, record in payload["tusers"].items():
-            try:
-                user = await self.bot.fetch_user(record["tuser"][0])
-            except NotFound:
+            user = users.get(record["tuser"][0])
+            if user is None:
                 continue
                 
             tuser = await TUser.load(self, user, record)
             self._tusers.append(tuser)
+            self._tuser_index[tuser.user_id] = tuser
                 
         overrides = payload["overrides"]
         trainings = data["trainings"]
         for t in trainings:
             training = Training.load(self[t[2]], t, overrides.get(t[0], []))
             if training is not None:
-                self._trainings.append(training)
+                self._register_training(training)
                 
+        self.guild.events.load("tuser", self._tusers, key=lambda t: t.user_id)
+        self.guild.events.load("training", self._trainings)
         await self._message.load(payload["signup_message"])
         
-        self._groups = [
-            await GroupTraining.load(self, g) 
-            for g in data["group_trainings"]
-        ]
-        for g in self._groups:
-            await g._update_post_components()
+        for g in data["group_trainings"]:
+            self._register_group(await GroupTraining.load(self, g))
 
 ################################################################################
     @staticmethod    
@@ -150,15 +162,16 @@ class TrainingManager:
         return {
             "tusers": tusers,
             "overrides": overrides,
-            "signup_message": (bot_config[0], bot_config[2], bot_config[3]),
+            # Not loaded when reloading a single entity.
+            "signup_message": (
+                (bot_config[0], bot_config[2], bot_config[3]) if bot_config else None
+            ),
         }
         
 ################################################################################    
     def __getitem__(self, user_id: int) -> Optional[TUser]:
 
-        for t in self._tusers:
-            if t.user_id == user_id:
-                return t
+        return self._tuser_index.get(user_id)
     
 ################################################################################
     @property
@@ -214,10 +227,141 @@ class TrainingManager:
         
         return self._guild.guild_id
     
+################################################################################
+    def _register_training(self, training: Training) -> None:
+        
+        self._trainings.append(training)
+        self._trainee_index[training.trainee.user_id].append(training)
+        if training.trainer is not None:
+            self._trainer_index[training.trainer.user_id].append(training)
+            
+################################################################################
+    def _deregister_training(self, training: Training) -> None:
+        
+        self._trainings.remove(training)
+        self._drop_from_index(self._trainee_index, training.trainee.user_id, training)
+        if training.trainer is not None:
+            self._drop_from_index(self._trainer_index, training.trainer.user_id, training)
+            
+################################################################################
+    def _reassign_trainer(
+        self, 
+        training: Training, 
+        prev_trainer: Optional[TUser], 
+        new_trainer: Optional[TUser]
+    ) -> None:
+        
+        if prev_trainer is not None:
+            self._drop_from_index(self._trainer_index, prev_trainer.user_id, training)
+        if new_trainer is not None:
+            self._trainer_index[new_trainer.user_id].append(training)
+            
+################################################################################
+    def _register_group(self, group: GroupTraining) -> None:
+        
+        self._groups.append(group)
+        if group.trainer is not None:
+            self._group_index[group.trainer.user_id].append(group)
+            
+################################################################################
+    def _deregister_group(self, group: GroupTraining) -> None:
+        
+        self._groups.remove(group)
+        if group.trainer is not None:
+            self._drop_from_index(self._group_index, group.trainer.user_id, group)
+            
+################################################################################
+    @staticmethod
+    def _drop_from_index(index: Dict[int, List[Any]], user_id: int, item: Any) -> None:
+        
+        bucket = index.get(user_id)
+        if not bucket:
+            return
+        
+        for i, entry in enumerate(bucket):
+            if entry is item:
+                bucket.pop(i)
+                break
+        
+        if not bucket:
+            del index[user_id]
+            
+################################################################################
+    async def reload_tuser(self, user_id: str, data: Dict[str, Any]) -> None:
+        """Brings a trainee/trainer in line with the database after another
+        process changed them."""
+
+        user_id = int(user_id)
+        current = self[user_id]
+        record = self._parse_data(data)["tusers"].get(user_id)
+
+        if record is None:
+            if current is not None:
+                self._tusers.remove(current)
+                self._tuser_index.pop(user_id, None)
+                self.guild.events.deleted("tuser", current, user_id, remote=True)
+            return
+
+        user = current.user if current is not None else await self.guild.get_or_fetch_user(user_id)
+        if user is None:
+            return
+
+        fresh = await TUser.load(self, user, record)
+        if current is None:
+            self._tusers.append(fresh)
+            self._tuser_index[user_id] = fresh
+            self.guild.events.created("tuser", fresh, user_id, remote=True)
+        else:
+            # Only ever set in memory.
+            fresh._pay_requested = current._pay_requested
+            self.guild.events.refresh("tuser", current, fresh, user_id)
+
+################################################################################
+    async def reload_training(self, training_id: str, data: Dict[str, Any]) -> None:
+        """Brings a training in line with the database after another process
+        changed it."""
+
+        current = self.get_training(training_id)
+        row = next((t for t in data["trainings"] if t[0] == training_id), None)
+        trainee = self[row[2]] if row is not None else None
+
+        if trainee is None:
+            if current is not None:
+                self._deregister_training(current)
+                self.guild.events.deleted("training", current, remote=True)
+            return
+
+        overrides = self._parse_data(data)["overrides"]
+        fresh = Training.load(trainee, row, overrides.get(training_id, []))
+        if current is None:
+            self._register_training(fresh)
+            self.guild.events.created("training", fresh, remote=True)
+            return
+
+        prev_trainer = current.trainer
+        self.guild.events.refresh("training", current, fresh)
+        if current.trainer is not prev_trainer:
+            self._reassign_trainer(current, prev_trainer, current.trainer)
+
+################################################################################
+    def get_trainings_by_trainee(self, user_id: int) -> List[Training]:
+        
+        return self._trainee_index.get(user_id, [])
+    
+################################################################################
+    def get_trainings_by_trainer(self, user_id: int) -> List[Training]:
+        
+        return self._trainer_index.get(user_id, [])
+    
+################################################################################
+    def get_groups_by_trainer(self, user_id: int) -> List[GroupTraining]:
+        
+        return self._group_index.get(user_id, [])
+    
 ################################################################################
     def get_unpaid_groups_by_trainer(self, trainer: TUser) -> List[GroupTraining]:
         
-        return [g for g in self._groups if g.trainer == trainer and not g.is_paid]
+        return [g for g in self.get_groups_by_trainer(trainer.user_id) if not g.is_paid]
     
 ################################################################################
     async def _add_tuser(self, interaction: Interaction, user: User) -> bool:
@@ -241,6 +385,7 @@ class TrainingManager:
 
         tuser = TUser.new(self, user)
         self._tusers.append(tuser)
+        self._tuser_index[tuser.user_id] = tuser
         
         confirm = U.make_embed(
             title="User Added",
@@ -279,7 +424,8 @@ class TrainingManager:
             f"Adding training {training.id} to the system. (Trainee: {training.trainee.name})"
         )
 
-        self._trainings.append(training)
+        self._register_training(training)
+        self.guild.events.created("training", training)
         
         await self._message.update_components()
         await self._guild.log.training_signup(training)
@@ -306,7 +452,7 @@ class TrainingManager:
 ################################################################################
     def get_qualified_trainers(self, position_id: str) -> List[TUser]:
         
-        return [t for t in self._tusers if t.is_qualified(position_id)]
+        return [t for t in self._tusers if position_id in t.qualified_position_ids]
 
 ################################################################################
     async def remove_training(self, training_id: str) -> None:
@@ -517,32 +663,7 @@ class TrainingManager:
         tags: List[VenueForumTag]
     ) -> List[Tuple[str, float]]:
 
-        venue_scores = {}
-    
-        for venue in self.guild.venue_manager.venues:
-            if venue.post_url is None or venue.rp_level is None:
-                continue
-                
-            score = 0
-            
-            rp_score = 50 - 10 * abs(rp_level.value - venue.rp_level.value)
-            score += rp_score
-            
-            if nsfw_pref == venue.nsfw:
-                score += 30
-                
-            matching_tags = set(
-                [t.proper_name.lower() for t in tags]).intersection(
-                set([v.tag_text.lower() for v in venue.tags])
-            )
-            tag_score = (len(matching_tags) / len(tags)) * 20 if tags else 0
-            score += tag_score
-    
-            venue_scores[venue.id] = score
-    
-        # Sort venues by score, if more than 5, then slice the first 5
-        max_results = 5 if len(venue_scores) >= 5 else len(venue_scores)    
-        return sorted(venue_scores.items(), key=lambda x: x[1], reverse=True)[:max_results]
+        return self.guild.venue_manager.matcher.top_matches(rp_level, nsfw_pref, tags)
     
 ################################################################################
     @staticmethod
@@ -565,6 +686,7 @@ class TrainingManager:
         if tuser is None:
             tuser = TUser.new(self, interaction.user)
             self._tusers.append(tuser)
+            self._tuser_index[tuser.user_id] = tuser
 
         await tuser.start_bg_check(interaction)
 
@@ -603,12 +725,9 @@ class TrainingManager:
         
         unpaid_trainings = [
             t 
-            for t in self._trainings 
-            if (
-                t.is_complete 
-                and not t.trainer_paid 
-                and t.trainer is not None
-            )
+            for trainings in self._trainer_index.values()
+            for t in trainings
+            if t.is_complete and not t.trainer_paid
         ]
         unpaid_trainings.sort(key=lambda t: t.trainer.name)
         
@@ -744,13 +863,13 @@ class TrainingManager:
         await tuser.manage_trainings(interaction)
 
 ################################################################################
-    async def on_member_leave(self, member: Member) -> Tuple[int, int]:
+    def on_member_leave(self, member: Member, batch: DepartureBatch) -> Tuple[int, int]:
 
         tuser = self[member.id]
         if tuser is None:
             return 0, 0
         
-        return await tuser.on_server_leave()
+        return tuser.on_server_leave(batch)
 
 ################################################################################
     async def group_training_menu(self, interaction: Interaction) -> None:
@@ -770,8 +889,8 @@ class TrainingManager:
     def get_group_trainings_by_trainer(self, trainer: TUser) -> List[GroupTraining]:
 
         return [
-            g for g in self._groups 
-            if g.trainer == trainer and not g.is_completed
+            g for g in self.get_groups_by_trainer(trainer.user_id)
+            if not g.is_completed
         ]
 
 ################################################################################
@@ -840,7 +959,7 @@ class TrainingManager:
         )
         
         group = GroupTraining.new(self, trainer, positions)
-        self._groups.append(group)
+        self._register_group(group)
 
         await self.guild.log.group_training_created(group)
         await group.menu(interaction)
@@ -978,6 +1097,12 @@ class TrainingManager:
 ################################################################################
     async def _delete_group_training(self, group: GroupTraining) -> None:
         
+        await self._announce_group_canceled(group)
+        group.delete()
+
+################################################################################
+    async def _announce_group_canceled(self, group: GroupTraining) -> None:
+        
         notification = U.make_embed(
             title="Group Training Canceled",
             description=(
@@ -995,8 +1120,6 @@ class TrainingManager:
             except NotFound:
                 pass
 
-        group.delete()
-
 ################################################################################
     async def acquire_trainee(self, interaction: Interaction, user: User) -> None:
         
@@ -97,5 +97,6 @@ class UserConfiguration:
     def update(self) -> None:
 
         self._parent.bot.database.update.tuser_config(self)
+        self._parent.guild.events.updated("tuser", self._parent, self._parent.user_id)
 
 ################################################################################
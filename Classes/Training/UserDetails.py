@@ -127,6 +127,7 @@ class UserDetails:
     def update(self) -> None:
         
         self.bot.database.update.tuser_details(self)
+        self._parent.guild.events.updated("tuser", self._parent, self._parent.user_id)
         
 ################################################################################
     async def set_name(self, interaction: Interaction) -> None:
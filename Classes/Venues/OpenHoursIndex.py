@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import calendar
+import math
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta, time
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+import pytz
+
+from Utilities import XIVIntervalType
+
+if TYPE_CHECKING:
+    from Classes import Venue, VenueHours
+################################################################################
+
+__all__ = ("OpenHoursIndex", "VenueOpening")
+
+# (start minute, end minute, venue ID, position in the indexed schedule)
+Segment = Tuple[int, int, str, int]
+
+################################################################################
+class VenueOpening:
+    """One concrete occurrence of a venue's scheduled hours."""
+
+    __slots__ = (
+        "venue",
+        "hours",
+        "start",
+        "end",
+    )
+
+################################################################################
+    def __init__(self, venue: Venue, hours: VenueHours, start: datetime, end: datetime) -> None:
+
+        self.venue: Venue = venue
+        self.hours: VenueHours = hours
+        self.start: datetime = start
+        self.end: datetime = end
+
+################################################################################
+class OpenHoursIndex:
+    """Every guild venue's weekly ``VenueHours`` as intervals on a UTC
+    minute-of-week axis, sorted by start, so "open now" and "open in the
+    next N hours" are a bisect plus a short scan instead of a call to the
+    FFXIV Venues API.
+
+    Each interval is stored three times, a week apart, so queries near the
+    end of the week see hours that wrap into the next one. Monthly hours
+    ("2nd Friday") are indexed weekly and filtered on the concrete date;
+    every-X-weeks hours have no stored start week, so they're treated as
+    weekly."""
+
+    __slots__ = (
+        "_segments",
+        "_by_venue",
+        "_venues",
+        "_schedules",
+        "_max_length",
+    )
+
+    WEEK = 7 * 24 * 60  # minutes
+    COPIES = 3
+
+################################################################################
+    def __init__(self) -> None:
+
+        self._reset()
+
+################################################################################
+    def _reset(self) -> None:
+
+        self._segments: List[Segment] = []
+        self._by_venue: Dict[str, List[Segment]] = {}
+        self._venues: Dict[str, Venue] = {}
+        # The schedule as it was indexed; segments point into it.
+        self._schedules: Dict[str, List[VenueHours]] = {}
+        # Longest interval indexed, which bounds how far back a query has to
+        # look for something still open.
+        self._max_length: int = 0
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._segments) // self.COPIES
+
+################################################################################
+    @staticmethod
+    def _utc_minutes(t: time, day: int) -> int:
+
+        minutes = day * 24 * 60 + t.hour * 60 + t.minute
+        if t.tzinfo is not None:
+            # pytz zones need a date to know their offset; this week's will do.
+            ref = datetime.combine(datetime.now(pytz.utc).date(), t.replace(tzinfo=None))
+            offset = t.tzinfo.utcoffset(ref)
+            if offset is not None:
+                minutes -= int(offset.total_seconds() // 60)
+
+        return minutes
+
+################################################################################
+    def _segments_for(self, venue_id: str, schedule: List[VenueHours]) -> List[Segment]:
+
+        ret = []
+        for i, hours in enumerate(schedule):
+            if hours.open_time is None or hours.close_time is None:
+                continue
+
+            start = self._utc_minutes(hours.open_time, hours.day.value)
+            length = (self._utc_minutes(hours.close_time, hours.day.value) - start) % (24 * 60)
+            # Open and close at the same time means open all day.
+            length = length or 24 * 60
+            start %= self.WEEK
+
+            ret.extend(
+                (start + n * self.WEEK, start + n * self.WEEK + length, venue_id, i)
+                for n in range(self.COPIES)
+            )
+
+        return ret
+
+################################################################################
+    def rebuild(self, venues: Iterable[Venue]) -> None:
+
+        self._reset()
+        for venue in venues:
+            self._add(venue, sort=False)
+
+        self._segments.sort()
+
+################################################################################
+    def refresh(self, venue: Venue) -> None:
+        """Re-indexes ``venue`` after its schedule (or anything else) changed."""
+
+        self.remove(venue.id)
+        self._add(venue)
+
+################################################################################
+    def _add(self, venue: Venue, sort: bool = True) -> None:
+
+        schedule = list(venue.schedule)
+        segments = self._segments_for(venue.id, schedule)
+        if not segments:
+            return
+
+        self._venues[venue.id] = venue
+        self._schedules[venue.id] = schedule
+
+        self._by_venue[venue.id] = segments
+        add = insort if sort else list.append
+        for segment in segments:
+            add(self._segments, segment)
+            self._max_length = max(self._max_length, segment[1] - segment[0])
+
+################################################################################
+    def remove(self, venue_id: str) -> None:
+
+        self._venues.pop(venue_id, None)
+        self._schedules.pop(venue_id, None)
+        for segment in self._by_venue.pop(venue_id, []):
+            i = bisect_left(self._segments, segment)
+            if i < len(self._segments) and self._segments[i] == segment:
+                del self._segments[i]
+
+################################################################################
+    @classmethod
+    def _week_start(cls, when: datetime) -> datetime:
+
+        when = when.astimezone(pytz.utc) if when.tzinfo else pytz.utc.localize(when)
+        monday = when - timedelta(days=when.weekday())
+        return monday.replace(hour=0, minute=0, second=0, microsecond=0)
+
+################################################################################
+    @staticmethod
+    def _recurs_on(hours: VenueHours, start: datetime) -> bool:
+
+        if hours.interval_type != XIVIntervalType.EveryXthDayOfTheMonth or not hours.interval_arg:
+            return True
+
+        # Xth weekday of the month, or counted from the end when negative.
+        arg = hours.interval_arg
+        if arg > 0:
+            return (start.day - 1) // 7 + 1 == arg
+
+        last_day = calendar.monthrange(start.year, start.month)[1]
+        return (last_day - start.day) // 7 + 1 == -arg
+
+################################################################################
+    def between(self, start: datetime, end: datetime) -> List[VenueOpening]:
+        """Openings that overlap ``[start, end)``, by opening time. The window
+        can be up to a week long."""
+
+        base = self._week_start(start)
+        start = start.astimezone(pytz.utc) if start.tzinfo else pytz.utc.localize(start)
+        end = end.astimezone(pytz.utc) if end.tzinfo else pytz.utc.localize(end)
+
+        # Query in the middle copy so both neighbours are covered.
+        lo = math.floor((start - base).total_seconds() / 60) + self.WEEK
+        hi = min(math.ceil((end - base).total_seconds() / 60) + self.WEEK, lo + self.WEEK)
+
+        ret = []
+        i = bisect_left(self._segments, (lo - self._max_length,))
+        while i < len(self._segments) and self._segments[i][0] < hi:
+            seg_start, seg_end, venue_id, n = self._segments[i]
+            i += 1
+            if seg_end <= lo:
+                continue
+
+            venue = self._venues[venue_id]
+            hours = self._schedules[venue_id][n]
+            opens = base + timedelta(minutes=seg_start - self.WEEK)
+            if self._recurs_on(hours, opens):
+                ret.append(
+                    VenueOpening(venue, hours, opens, opens + timedelta(minutes=seg_end - seg_start))
+                )
+
+        return ret
+
+################################################################################
+    def open_at(self, when: Optional[datetime] = None) -> List[VenueOpening]:
+
+        when = when or datetime.now(pytz.utc)
+        return self.between(when, when + timedelta(minutes=1))
+
+################################################################################
+    def open_within(self, hours: float, start: Optional[datetime] = None) -> List[VenueOpening]:
+        """Venues open now or opening in the next ``hours``."""
+
+        start = start or datetime.now(pytz.utc)
+        return self.between(start, start + timedelta(hours=hours))
+
+################################################################################
+    def is_open_between(self, venue: Venue, start: datetime, end: datetime) -> Optional[bool]:
+        """Whether ``venue`` is scheduled to be open at some point in
+        ``[start, end)``; None if it has no hours to go by."""
+
+        if venue.id not in self._by_venue:
+            return None
+
+        return any(o.venue is venue for o in self.between(start, end))
+
+################################################################################
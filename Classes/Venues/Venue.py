@@ -37,6 +37,7 @@ from Utilities import (
     VenueChannelNotSetError,
     VenueImportNotFoundError,
     VenueProfileNotCompleteError,
+    XIVIntervalType,
 )
 from .VenueAtAGlance import VenueAtAGlance
 from .VenueHours import VenueHours
@@ -116,7 +117,10 @@ class Venue:
     def new(cls: Type[V], mgr: VenueManager, name: str) -> V:
         
         new_id = mgr.bot.database.insert.venue(mgr.guild_id, name)
-        return cls(mgr, new_id, name)
+        self = cls(mgr, new_id, name)
+        mgr.guild.events.created("venue", self)
+        
+        return self
         
 ################################################################################    
     @classmethod
@@ -145,12 +149,12 @@ class Venue:
         
         self._mutes = [
             m for m in
-            [await mgr.bot.get_or_fetch_user(user_id) for user_id in venue[11]]
+            [await mgr.guild.get_or_fetch_user(user_id) for user_id in venue[11]]
             if m is not None
         ] if venue[11] else []
         self._users = [
             u for u in
-            [await mgr.bot.get_or_fetch_user(user_id) for user_id in venue[2]]
+            [await mgr.guild.get_or_fetch_user(user_id) for user_id in venue[2]]
             if u is not None
         ] if venue[2] else []
         
@@ -221,6 +225,7 @@ class Venue:
 
         self._name = value
         self.update()
+        self.guild.jobs_manager.refresh_names(self)
 
 ################################################################################
     @property
@@ -417,6 +422,12 @@ class Venue:
 
         return self._post_msg.jump_url
 
+################################################################################
+    @property
+    def post_message(self) -> Optional[Message]:
+
+        return self._post_msg
+
 ################################################################################
     @property
     def muted_users(self) -> List[User]:
@@ -595,19 +606,42 @@ class Venue:
         self._users = [u for u in self._users if u.id != user.id]
         self.update()
         
+################################################################################
+    def to_itinerary_string(self) -> str:
+        
+        return f"{self.name}::{self.location.to_itinerary_string()}"
+    
 ################################################################################
     def update(self) -> None:
         
         self.bot.database.update.venue(self)
+        self.guild.events.updated("venue", self)
         
 ################################################################################
     async def delete(self) -> None:
         
         log.info("Venues", f"Deleting venue {self.name} ({self.id})")
     
+        await self._delete_channel()
+        await self.guild.jobs_manager.delete_all_by_venue(self)
+        self._remove()
+        
+        log.info("Venues", f"Venue {self.name} ({self.id}) has been deleted.")
+        
+################################################################################
+    def _remove(self) -> None:
+        
+        self._mgr._venues.remove(self)
+        self.bot.database.delete.venue(self)
+        self.guild.events.deleted("venue", self)
+        
+################################################################################
+    async def _delete_channel(self) -> None:
+        
         if self._post_msg is not None:
             try:
                 await self._post_msg.channel.delete()
+                self._mgr.guild.threads.remove(self._post_msg.channel.id)
             except NotFound:
                 pass
             except Exception as ex:
@@ -619,13 +653,6 @@ class Venue:
                     )
                 )
         
-        await self.guild.jobs_manager.delete_all_by_venue(self)
-        
-        self._mgr._venues.remove(self)
-        self.bot.database.delete.venue(self)
-        
-        log.info("Venues", f"Venue {self.name} ({self.id}) has been deleted.")
-        
 ################################################################################
     async def update_from_xiv_venue(self, interaction: Interaction, venue: Optional[XIVVenue] = None) -> None:
         
@@ -928,8 +955,12 @@ class Venue:
         for s in self.schedule:
             if s.day == weekday:
                 s.delete()
+        self._schedule = [s for s in self._schedule if s.day != weekday]
                 
-        self._schedule.append(VenueHours.new(self, weekday, open_time, close_time))
+        self._schedule.append(
+            VenueHours.new(self, weekday, open_time, close_time, XIVIntervalType.EveryXWeeks, 1)
+        )
+        self.guild.events.updated("venue", self)
 
 ################################################################################
     async def post(self, interaction: Interaction, channel: Optional[ForumChannel], rp_bypass: bool = False) -> None:
@@ -959,17 +990,16 @@ class Venue:
             await interaction.respond(embed=error, ephemeral=True)
             return
         
-        # Find threads with a matching name
-        target_threads = [t for t in channel.threads if t.name.lower() == self.name.lower()]
-        thread = target_threads[0] if target_threads else None
+        # Find a thread with a matching name, archived or not
+        thread = await self._mgr.guild.threads.find(channel, self.name)
         
-        # Prepare the persistent view
         view = VenuePostingMuteView(self)
-        self.bot.add_view(view)
     
         # If there's a thread, update it and clear bot messages if _post_msg is None
         if thread:
-            await thread.edit(name=self.name, applied_tags=self.thread_tags)
+            thread = await self._mgr.guild.threads.edit_thread(
+                thread, name=self.name, applied_tags=self.thread_tags
+            )
             # If _post_msg is None, assume we might need to clear old messages from the bot
             if self._post_msg is None:
                 async for msg in thread.history():
@@ -978,8 +1008,11 @@ class Venue:
     
         # Attempt to edit the existing message if it exists
         if self._post_msg is not None:
+            self._mgr.guild.edits.cancel(self._post_msg)
             try:
-                await self._post_msg.edit(embed=self.status(post=True), view=view)
+                await self._mgr.guild.threads.edit_message(
+                    self._post_msg, embed=self.status(post=True), view=view
+                )
             except NotFound:
                 self._post_msg = None  # Reset if the message was not found
             except Exception as ex:
@@ -999,6 +1032,7 @@ class Venue:
                     name=self.name, embed=self.status(post=True),
                     applied_tags=self.thread_tags, view=view
                 )
+                self._mgr.guild.threads.track(thread)
             # Grab the message we just posted
             try:
                 self._post_msg = await thread.fetch_message(thread.last_message_id)
@@ -1111,7 +1145,7 @@ class Venue:
         await interaction.respond(embed=confirm, ephemeral=True)
 
 ################################################################################
-    async def _update_post_components(self, addl_attempt: bool = False) -> None:
+    async def _update_post_components(self) -> None:
         
         if self.post_url is None:
             return
@@ -1122,31 +1156,22 @@ class Venue:
         )
 
         view = VenuePostingMuteView(self)
-        self.bot.add_view(view, message_id=self._post_msg.id)
 
         try:
-            await self._post_msg.edit(view=view)
+            await self._mgr.guild.threads.edit_message(self._post_msg, view=view)
         except NotFound:
             self._post_msg = None
             self.update()
         except HTTPException as ex:
-            if ex.code != 50083 and not addl_attempt:
-                log.critical(
-                    "Venues",
-                    (
-                        f"Failed to update post components for venue {self.name} "
-                        f"({self.id}).\nError: {ex}"
-                    
-                    )
-                )
-            log.warning(
+            log.critical(
                 "Venues",
-                "Thread was archived for exceeding 30 day limit - attempting to revive."
+                (
+                    f"Failed to update post components for venue {self.name} "
+                    f"({self.id}).\nError: {ex}"
+                )
             )
-            await self._post_msg.channel.send("Hey Ur Cute", delete_after=0.1)
-            await self._update_post_components(addl_attempt=True)
-            
-        log.info("Venues", "Post components updated successfully.")
+        else:
+            log.info("Venues", "Post components updated successfully.")
 
 ################################################################################
     async def notify_of_interest(self, interaction) -> None:
@@ -79,6 +79,7 @@ class VenueAtAGlance:
     def update(self) -> None:
         
         self.bot.database.update.venue_aag(self)
+        self._parent.guild.events.updated("venue", self._parent)
         
 ################################################################################
     @property
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import time
 from typing import TYPE_CHECKING, Any, Type, TypeVar, Tuple
 
-from Utilities import Utilities as U, Weekday
+from Utilities import Weekday, time_tables
 
 if TYPE_CHECKING:
     from Classes import StaffPartyBot, VenueURLs
@@ -108,13 +108,13 @@ class VenueAvailability:
     @property
     def start_timestamp(self) -> str:
 
-        return U.format_dt(U.time_to_datetime(self._open), "t")
+        return time_tables.slot_timestamp(self._weekday, self._open)
 
 ################################################################################
     @property
     def end_timestamp(self) -> str:
 
-        return U.format_dt(U.time_to_datetime(self._close), "t")
+        return time_tables.slot_timestamp(self._weekday, self._close)
 
 ################################################################################
     def delete(self) -> None:
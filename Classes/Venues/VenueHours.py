@@ -4,7 +4,7 @@ import pytz
 from datetime import time
 from typing import TYPE_CHECKING, TypeVar, Any, Tuple, Type
 
-from Utilities import Utilities as U, Weekday, XIVIntervalType
+from Utilities import Weekday, XIVIntervalType, time_tables
 
 if TYPE_CHECKING:
     from Classes import Venue, XIVScheduleComponent
@@ -115,13 +115,13 @@ class VenueHours:
     @property
     def open_ts(self) -> str: 
         
-        return U.format_dt(U.time_to_datetime(self.open_time), "t")
+        return time_tables.slot_timestamp(self._day, self.open_time)
     
 ################################################################################
     @property
     def close_ts(self) -> str:
         
-        return U.format_dt(U.time_to_datetime(self.close_time), "t")
+        return time_tables.slot_timestamp(self._day, self.close_time)
     
 ################################################################################
     def update(self) -> None:
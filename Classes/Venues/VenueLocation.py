@@ -185,6 +185,7 @@ class VenueLocation:
     def update(self) -> None:
         
         self.bot.database.update.venue_location(self)
+        self._parent.guild.events.updated("venue", self._parent)
 
 ################################################################################
     def format(self) -> str:
@@ -213,6 +214,23 @@ class VenueLocation:
         
         return ret
 
+################################################################################
+    def to_itinerary_string(self) -> str:
+        
+        # Same shape as XIVLocation's, so local and API reports match.
+        world = self.world.proper_name if self.world else "?"
+        zone = self.zone.proper_name if self.zone else "?"
+        
+        ret = f"{world}-{zone}-W{self.ward}"
+        if self.plot:
+            ret += f"-P{self.plot}"
+        if self.apartment:
+            ret += f"-APT{self.apartment}"
+        if self.room:
+            ret += f"-R{self.room}"
+            
+        return ret
+
 ################################################################################
     def update_from_xiv_venue(self, xiv: XIVLocation) -> None:
         
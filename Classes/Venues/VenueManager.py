@@ -17,12 +17,16 @@ from Utilities import (
     CannotRemoveUserError,
     VenueImportNotFoundError,
     VenueImportError,
+    EntityChange,
 )
+from Classes.Common import NameIndex, UserIndex
+from .OpenHoursIndex import OpenHoursIndex
 from .Venue import Venue
+from .VenueMatcher import VenueMatcher
 from .VenueTag import VenueTag
 
 if TYPE_CHECKING:
-    from Classes import GuildData, StaffPartyBot
+    from Classes import GuildData, StaffPartyBot, DepartureBatch, EntityEvent
 ################################################################################
 
 __all__ = ("VenueManager",)
@@ -34,6 +38,10 @@ class VenueManager:
         "_guild",
         "_venues",
         "_tags",
+        "_matcher",
+        "_names",
+        "_user_index",
+        "_open_hours",
         "__etiquette_file",
     )
     
@@ -53,17 +61,85 @@ class VenueManager:
         
         self._venues: List[Venue] = []
         self._tags: List[VenueTag] = []
+        self._matcher: VenueMatcher = VenueMatcher()
+        self._names: NameIndex[Venue] = NameIndex()
+        self._user_index: UserIndex[Venue] = UserIndex()
+        self._open_hours: OpenHoursIndex = OpenHoursIndex()
         self.__etiquette_file: Optional[File] = None
         
+        guild.events.subscribe("venue", self._on_venue_event)
+        
 ################################################################################
     async def _load_all(self, data: Dict[str, Any]) -> None:
 
+        await self._guild.resolve_many(
+            "user",
+            [
+                user_id
+                for vdata in data["venues"]
+                for user_id in (vdata["venue"][2] or []) + (vdata["venue"][11] or [])
+            ]
+        )
+        
         for vdata in data["venues"]:
             self._venues.append(await Venue.load(self, vdata))
             
-        for venue in self._venues:
-            await venue._update_post_components()
+        self._guild.events.load("venue", self._venues)
+        self.rebuild_indexes()
         
+################################################################################
+    def rebuild_indexes(self) -> None:
+        
+        self._matcher.rebuild([])
+        self._names.rebuild([])
+        self._user_index.rebuild([])
+        self._open_hours.rebuild([])
+        
+        self._guild.events.replay("venue", self._on_venue_event)
+        
+################################################################################
+    def _on_venue_event(self, event: EntityEvent) -> None:
+        
+        venue: Venue = event.entity
+        if event.change == EntityChange.Deleted:
+            self._matcher.remove(venue.id)
+            self._names.remove(venue.id)
+            self._user_index.remove(venue.id)
+            self._open_hours.remove(venue.id)
+            return
+        
+        if event.changed("_name"):
+            self._names.refresh(venue.id, venue.name, venue)
+        if event.changed("_users"):
+            self._user_index.refresh(
+                venue.id, [u.id for u in venue.authorized_users if u is not None], venue
+            )
+        if event.changed("_schedule"):
+            self._open_hours.refresh(venue)
+        if event.changed("_post_msg", "_aag._level", "_aag._nsfw", "_aag._tags"):
+            self._matcher.refresh(venue)
+
+################################################################################
+    async def reload(self, venue_id: str, data: Dict[str, Any]) -> None:
+        """Brings a venue in line with the database after another process
+        changed it. ``data`` holds just that venue's rows, if it still exists."""
+
+        current = self[venue_id]
+        vdata = next((v for v in data["venues"] if v["venue"][0] == venue_id), None)
+
+        if vdata is None:
+            if current is not None:
+                self._venues.remove(current)
+                self._guild.events.deleted("venue", current, remote=True)
+            return
+
+        fresh = await Venue.load(self, vdata)
+        if current is None:
+            self._venues.append(fresh)
+            self._guild.events.created("venue", fresh, remote=True)
+        else:
+            self._guild.events.refresh("venue", current, fresh)
+
 ################################################################################
     def __getitem__(self, venue_id: str) -> Venue:
         
@@ -102,12 +178,34 @@ class VenueManager:
         self._venues.sort(key=lambda x: x.name.lower())
         return self._venues
     
+################################################################################
+    @property
+    def matcher(self) -> VenueMatcher:
+        
+        return self._matcher
+    
+################################################################################
+    @property
+    def names(self) -> NameIndex[Venue]:
+        
+        return self._names
+    
+################################################################################
+    @property
+    def user_index(self) -> UserIndex[Venue]:
+        
+        return self._user_index
+    
+################################################################################
+    @property
+    def open_hours(self) -> OpenHoursIndex:
+        
+        return self._open_hours
+    
 ################################################################################
     def get_venue(self, name: str) -> Optional[Venue]:
         
-        for venue in self._venues:
-            if venue.name.lower() == name.lower():
-                return venue
+        return self._names.get(name)
     
 ################################################################################
     async def admin_import(self, interaction: Interaction, name: str, user: User) -> None:
@@ -179,11 +277,11 @@ class VenueManager:
             return
 
         xiv_venue = results[0]
-        venue = Venue.new(self, xiv_venue.name)
-        await venue.update_from_xiv_venue(interaction, xiv_venue)
-        self._venues.append(venue)
-
-        await self.guild.log.venue_created(venue)
+        # One creation event for the finished venue, not one per field.
+        with self._guild.events.batch():
+            venue = Venue.new(self, xiv_venue.name)
+            await venue.update_from_xiv_venue(interaction, xiv_venue)
+            self._venues.append(venue)
 
         log.info(
             "Venues",
@@ -262,7 +360,6 @@ class VenueManager:
             )
         )
         await interaction.followup.send(embed=confirm, ephemeral=True)
-        await self.guild.log.venue_user_added(venue, user)
 
 ################################################################################
     async def venue_menu(self, interaction: Interaction, name: str, admin: bool = False) -> None:
@@ -469,18 +566,19 @@ class VenueManager:
             await interaction.respond(embed=error, ephemeral=True)
             return
         
-        venue = Venue.new(self, name)
-        venue.add_user(interaction.user)
-        self._venues.append(venue)
-        
-        if user1 is not None:
-            venue.add_user(user1)
-        if user1 is not None:
-            venue.add_user(user1)
-        if user2 is not None:
-            venue.add_user(user2)
-        if user3 is not None:
-            venue.add_user(user3)
+        with self._guild.events.batch():
+            venue = Venue.new(self, name)
+            venue.add_user(interaction.user)
+            self._venues.append(venue)
+            
+            if user1 is not None:
+                venue.add_user(user1)
+            if user1 is not None:
+                venue.add_user(user1)
+            if user2 is not None:
+                venue.add_user(user2)
+            if user3 is not None:
+                venue.add_user(user3)
 
         confirm = U.make_embed(
             title="Venue Submitted",
@@ -493,7 +591,6 @@ class VenueManager:
         )
 
         await interaction.respond(embed=confirm, ephemeral=True)
-        await self.guild.log.venue_created(venue)
     
 ################################################################################
     async def remove_user(self, interaction: Interaction, name: str, user: User) -> None:
@@ -516,7 +613,6 @@ class VenueManager:
             )
         )
         await interaction.respond(embed=confirm, ephemeral=True)
-        await self.guild.log.venue_user_removed(venue, user)
         
 ################################################################################
     @staticmethod
@@ -660,11 +756,11 @@ class VenueManager:
             return
         
         xiv_venue = results[0]
-        venue = Venue.new(self, xiv_venue.name)
-        await venue.update_from_xiv_venue(interaction, xiv_venue)
-        self._venues.append(venue)
-        
-        await self.guild.log.venue_created(venue)
+        # One creation event for the finished venue, not one per field.
+        with self._guild.events.batch():
+            venue = Venue.new(self, xiv_venue.name)
+            await venue.update_from_xiv_venue(interaction, xiv_venue)
+            self._venues.append(venue)
         
         log.info(
             "Venues",
@@ -697,33 +793,32 @@ class VenueManager:
 ################################################################################
     def get_venues_by_user(self, user_id: int) -> List[Venue]:
         
-        return [
-            v for v in self.venues 
-            if user_id in [u.id for u in v.authorized_users]
-        ]
+        return sorted(self._user_index[user_id], key=lambda v: v.name.lower())
 
 ################################################################################
-    async def on_member_leave(self, member: Member) -> bool:
+    def on_member_leave(self, member: Member, batch: DepartureBatch) -> bool:
         """Returns True if a venue was deleted as a result of the member leaving."""
         
-        for v in self.venues:
-            if member in v.authorized_users:
-                print(v.name)
-                flag = False
-                for u in v.authorized_users:
-                    print(u.name, u.id)
-                    if self.guild.parent.get_member(u.id) is not None:
-                        print("Member exists")
-                        flag = True
-                        break
-
-                if not flag:
-                    print("No members present")
-                    await v.delete()
-                    return True
-                print("Members present")
+        deleted = False
+        for v in self._user_index[member.id]:
+            # Only delete venues nobody left in the server can manage.
+            if any(
+                self.guild.parent.get_member(u.id) is not None
+                for u in v.authorized_users
+                if u is not None and u.id != member.id
+            ):
+                continue
+            
+            log.info(
+                "Venues",
+                f"No managers of venue {v.name} ({v.id}) remain in the server. Deleting..."
+            )
+            self.guild.jobs_manager.remove_all_by_venue(v, batch)
+            v._remove()
+            batch.defer(f"venue {v.id}", v._delete_channel)
+            deleted = True
         
-        return False
+        return deleted
 
 ################################################################################
     async def venue_etiquette(self, interaction: Interaction) -> None:
@@ -783,12 +878,13 @@ class VenueManager:
             log.debug("Venues", "User cancelled bulk update.")
             return
         
-        msg = await interaction.followup.send("Please wait...")
+        msg = await interaction.followup.send("Fetching venues from the FFXIV Venues API...")
         payload = await self.bot.veni_client.get_all_venues()
         
         payload_ids = [v.id for v in payload]
         venue_ids = { v.id: v._xiv_id for v in self.venues }
         
+        deleted = 0
         for _id, venue_id in venue_ids.items():
             if venue_id not in payload_ids:
                 log.info(
@@ -797,31 +893,38 @@ class VenueManager:
                 )
                 if venue := self[_id]:
                     await venue.delete()
-        
-        count = 0
-        for venue in self.venues:
-            for vdata in payload:
-                if venue.name.lower() == vdata.name.lower():
-                    await venue.update_from_xiv_venue(interaction, vdata)
-                    await venue._update_post_components()
-                    count += 1
-                    break
+                    deleted += 1
         
         await msg.delete()
         
-        confirm = U.make_embed(
-            title="Bulk Update Complete",
-            description=(
-                f"Successfully updated **[{count}]** venues.\n"
-                f"Deleted **[{len(venue_ids) - count}]** venues."
-            )
+        by_name = {}
+        for vdata in payload:
+            by_name.setdefault(NameIndex.normalize(vdata.name), vdata)
+        
+        async def update(venue: Venue) -> None:
+            with self._guild.events.batch():
+                await venue.update_from_xiv_venue(interaction, by_name[NameIndex.normalize(venue.name)])
+            await venue._update_post_components()
+        
+        venues = [v for v in self.venues if NameIndex.normalize(v.name) in by_name]
+        await self.guild.threads.ensure_open_many(
+            v.post_message.channel for v in venues if v.post_message is not None
+        )
+        result = await self.guild.bulk.run(
+            interaction, "venues", "venues",
+            venues,
+            update,
+            lambda v: v.name
         )
+        
+        confirm = result.summary("venues")
+        confirm.description += f"\nDeleted **[{deleted}]** venues."
         await interaction.respond(embed=confirm)
         
         log.info(
             "Venues",
-            f"Bulk update completed. [{count}] venues updated, "
-            f"[{len(venue_ids) - count}] venues deleted."
+            f"Bulk update completed. [{result.updated}] venues updated, "
+            f"[{deleted}] venues deleted."
         )
         
 ################################################################################
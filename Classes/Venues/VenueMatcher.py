@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from Utilities import NSFWPreference, RPLevel, VenueForumTag
+
+if TYPE_CHECKING:
+    from Classes import Venue
+################################################################################
+
+__all__ = ("VenueMatcher", "MatchWeights")
+
+################################################################################
+class MatchWeights:
+    """Point values used when scoring venues for internship matching."""
+
+    __slots__ = (
+        "rp",
+        "rp_step",
+        "nsfw",
+        "tags",
+    )
+
+################################################################################
+    def __init__(
+        self,
+        rp: float = 50,
+        rp_step: float = 10,
+        nsfw: float = 30,
+        tags: float = 20
+    ) -> None:
+
+        self.rp: float = rp
+        self.rp_step: float = rp_step
+        self.nsfw: float = nsfw
+        self.tags: float = tags
+
+################################################################################
+class VenueMatcher:
+    """A feature matrix (RP level, NSFW flag, tag bits) over a guild's
+    matchable venues, refreshed whenever a venue is saved."""
+
+    __slots__ = (
+        "_weights",
+        "_ids",
+        "_rows",
+        "_levels",
+        "_nsfw",
+        "_tags",
+    )
+
+    TAG_COLUMNS: Dict[str, int] = {
+        t.proper_name.lower(): i for i, t in enumerate(VenueForumTag)
+    }
+    INITIAL_CAPACITY = 64
+
+################################################################################
+    def __init__(self, weights: Optional[MatchWeights] = None) -> None:
+
+        self._weights: MatchWeights = weights or MatchWeights()
+        self._reset(self.INITIAL_CAPACITY)
+
+################################################################################
+    def _reset(self, capacity: int) -> None:
+
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+
+        self._levels: np.ndarray = np.zeros(capacity, dtype=np.int16)
+        self._nsfw: np.ndarray = np.zeros(capacity, dtype=bool)
+        self._tags: np.ndarray = np.zeros((capacity, len(self.TAG_COLUMNS)), dtype=bool)
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._ids)
+
+################################################################################
+    @property
+    def weights(self) -> MatchWeights:
+
+        return self._weights
+
+    @weights.setter
+    def weights(self, value: MatchWeights) -> None:
+
+        self._weights = value
+
+################################################################################
+    def rebuild(self, venues: List[Venue]) -> None:
+
+        self._reset(max(self.INITIAL_CAPACITY, len(venues)))
+        for venue in venues:
+            self.refresh(venue)
+
+################################################################################
+    def refresh(self, venue: Venue) -> None:
+
+        if venue.post_url is None or venue.rp_level is None:
+            self.remove(venue.id)
+            return
+
+        row = self._rows.get(venue.id)
+        if row is None:
+            row = len(self._ids)
+            if row >= self._levels.shape[0]:
+                self._grow()
+            self._rows[venue.id] = row
+            self._ids.append(venue.id)
+
+        self._levels[row] = venue.rp_level.value
+        self._nsfw[row] = bool(venue.nsfw)
+        self._tags[row] = False
+        for tag in venue.tags:
+            col = self.TAG_COLUMNS.get(tag.tag_text.lower())
+            if col is not None:
+                self._tags[row, col] = True
+
+################################################################################
+    def remove(self, venue_id: str) -> None:
+
+        row = self._rows.pop(venue_id, None)
+        if row is None:
+            return
+
+        # Move the last row into the vacated slot to keep the matrix dense.
+        last = len(self._ids) - 1
+        if row != last:
+            moved_id = self._ids[last]
+            self._ids[row] = moved_id
+            self._rows[moved_id] = row
+            self._levels[row] = self._levels[last]
+            self._nsfw[row] = self._nsfw[last]
+            self._tags[row] = self._tags[last]
+
+        self._ids.pop()
+
+################################################################################
+    def _grow(self) -> None:
+
+        capacity = self._levels.shape[0] * 2
+
+        self._levels = np.resize(self._levels, capacity)
+        self._nsfw = np.resize(self._nsfw, capacity)
+        self._tags = np.resize(self._tags, (capacity, len(self.TAG_COLUMNS)))
+
+################################################################################
+    def scores(
+        self,
+        rp_level: RPLevel,
+        nsfw_pref: NSFWPreference,
+        tags: List[VenueForumTag]
+    ) -> np.ndarray:
+
+        n = len(self._ids)
+        w = self._weights
+
+        distance = np.abs(self._levels[:n] - rp_level.value).astype(np.float64)
+        scores = w.rp - w.rp_step * distance
+        scores += w.nsfw * (self._nsfw[:n] == (nsfw_pref is NSFWPreference.NSFW))
+
+        if tags:
+            cols = sorted({self.TAG_COLUMNS[t.proper_name.lower()] for t in tags})
+            scores += w.tags * self._tags[:n, cols].sum(axis=1) / len(tags)
+
+        return scores
+
+################################################################################
+    def top_matches(
+        self,
+        rp_level: RPLevel,
+        nsfw_pref: NSFWPreference,
+        tags: List[VenueForumTag],
+        limit: int = 5
+    ) -> List[Tuple[str, float]]:
+
+        n = len(self._ids)
+        if n == 0 or limit <= 0:
+            return []
+
+        scores = self.scores(rp_level, nsfw_pref, tags)
+
+        k = min(limit, n)
+        if k < n:
+            idx = np.argpartition(-scores, k - 1)[:k]
+        else:
+            idx = np.arange(n)
+        idx = idx[np.argsort(-scores[idx], kind="stable")]
+
+        return [(self._ids[i], float(scores[i])) for i in idx]
+
+################################################################################
@@ -5,7 +5,8 @@ from typing import TYPE_CHECKING, Optional, Type, TypeVar, Any, Dict
 from discord import Interaction, NotFound
 
 from UI.Venues import VenueDiscordURLModal, VenueWebsiteURLModal, VenueApplicationURLModal
-from Utilities import Utilities as U, FroggeColor, log
+from Classes.ImagePipeline import ImageTooLarge
+from Utilities import Utilities as U, FroggeColor, ImageTooLargeError, attachment_urls, log
 
 if TYPE_CHECKING:
     from Classes import Venue, StaffPartyBot, XIVVenue
@@ -54,7 +55,7 @@ class VenueURLs:
 ################################################################################    
     def __getitem__(self, item: str) -> Optional[str]:
         
-        return getattr(self, f"_{item}_url")
+        return attachment_urls.fresh(getattr(self, f"_{item}_url"))
         
 ################################################################################
     def __setitem__(self, key: str, value: Optional[str]):
@@ -84,6 +85,7 @@ class VenueURLs:
     def update(self) -> None:
         
         self.bot.database.update.venue_urls(self)
+        self._parent.guild.events.updated("venue", self._parent)
 
 ################################################################################
     def update_from_xiv_venue(self, venue: XIVVenue) -> None:
@@ -203,8 +205,17 @@ class VenueURLs:
             return
         
         if message.content.lower() != "cancel":
-            self._logo_url = await self.bot.dump_image(message.attachments[0])
-            self.update()
+            try:
+                # Only ever shown as an embed thumbnail.
+                self._logo_url = await self.bot.dump_image(
+                    message.attachments[0], self.bot.image_pipeline.THUMBNAIL_SIZE
+                )
+            except ImageTooLarge:
+                log.warning("Venues", "User uploaded a logo over the size limit.")
+                error = ImageTooLargeError(self.bot.image_pipeline.MAX_BYTES // (1024 * 1024))
+                await interaction.respond(embed=error, ephemeral=True)
+            else:
+                self.update()
         else:
             log.debug("Venues", "User cancelled logo selection.")
 
@@ -1,11 +1,13 @@
 from .Internship import Internship
 from .InternshipManager import InternshipManager
+from .OpenHoursIndex import OpenHoursIndex, VenueOpening
 from .Venue import Venue
 from .VenueAtAGlance import VenueAtAGlance
 from .VenueAvailability import VenueAvailability
 from .VenueHours import VenueHours
 from .VenueLocation import VenueLocation
 from .VenueManager import VenueManager
+from .VenueMatcher import VenueMatcher, MatchWeights
 from .VenueTag import VenueTag
 from .VenueURLs import VenueURLs
 ################################################################################
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from flask import Flask, request, abort, url_for
-
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
+    from flask import Flask
+    
     from Classes import StaffPartyBot
 ################################################################################
 
@@ -23,16 +23,25 @@ class FroggeHookManager:
 
         self._state: StaffPartyBot = bot
         
-        self.__app__: Flask = Flask(__name__)
-        self.add_routes()
+        # Built on first use - the server's off and Flask is slow to import.
+        self.__app__: Optional[Flask] = None
 
 ################################################################################
     def get_app(self) -> Flask:
         
+        if self.__app__ is None:
+            from flask import Flask
+            
+            self.__app__ = Flask(__name__)
+            self.add_routes()
+        
         return self.__app__
     
 ################################################################################
     def add_routes(self):
+        
+        from flask import request
+        
         @self.__app__.route("/", methods=["POST"])
         def home():
             print(request.data)
@@ -41,9 +50,12 @@ class FroggeHookManager:
 ################################################################################
     def run(self):
         
-        with self.__app__.test_request_context():
+        from flask import url_for
+        
+        app = self.get_app()
+        with app.test_request_context():
             print(url_for('home', _external=True))
-        self.__app__.run(debug=True, port=5000)
+        app.run(debug=True, port=5000)
         
 ################################################################################
         
\ No newline at end of file
@@ -58,7 +58,7 @@ class XIVLocation:
         )
 
 ################################################################################
-    def to_itinerary_string(self) -> None:
+    def to_itinerary_string(self) -> str:
         
         ret = f"{self.world}-{self.district}-W{self.ward}"
         if self.plot:
@@ -67,5 +67,7 @@ class XIVLocation:
             ret += f"-APT{self.apartment}"
         if self.room:
             ret += f"-R{self.room}"
+            
+        return ret
 
 ################################################################################
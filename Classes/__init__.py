@@ -11,13 +11,23 @@ if TYPE_CHECKING:
     from .XIVVenues import *
     
     # Modules
-    from .Bot import StaffPartyBot
+    from .AttachmentRefresher import AttachmentRefresher
+    from .BulkExecutor import BulkExecutor, BulkResult
+    from .Bot import ShardedStaffPartyBot, StaffPartyBot
+    from .ChangeFeed import ChangeFeed
     from .ChannelManager import ChannelManager
+    from .ComponentRouter import ComponentRouter
+    from .DepartureQueue import Departure, DepartureBatch, DepartureQueue
+    from .EditCoalescer import EditCoalescer
+    from .EventBus import EntityEvent, EventBus
+    from .Resolver import Resolver
     from .GuildData import GuildData
     from .GuildManager import GuildManager
     from .HelpMessage import HelpMessage
+    from .ImagePipeline import ImagePipeline, ImageTooLarge
     from .Logger import Logger
     from .RoleManager import RoleManager
+    from .ThreadRegistry import ForumThreads, ThreadRegistry
     from .Webhooks import FroggeHookManager
 ################################################################################
     
\ No newline at end of file
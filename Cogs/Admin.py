@@ -8,6 +8,8 @@ from discord import (
     SlashCommandOptionType,
 )
 
+from Utilities import venue_names
+
 if TYPE_CHECKING:
     from Classes.Bot import StaffPartyBot
 ################################################################################
@@ -100,7 +102,8 @@ class Admin(Cog):
             SlashCommandOptionType.string,
             name="venue",
             description="The name of the venue.",
-            required=True
+            required=True,
+            autocomplete=venue_names
         ),
         user: Option(
             SlashCommandOptionType.user,
@@ -125,7 +128,8 @@ class Admin(Cog):
             SlashCommandOptionType.string,
             name="venue",
             description="The name of the venue.",
-            required=True
+            required=True,
+            autocomplete=venue_names
         ),
         user: Option(
             SlashCommandOptionType.user,
@@ -150,7 +154,8 @@ class Admin(Cog):
             SlashCommandOptionType.string,
             name="name",
             description="The name of the venue.",
-            required=True
+            required=True,
+            autocomplete=venue_names
         )
     ) -> None:
 
@@ -169,7 +174,8 @@ class Admin(Cog):
             SlashCommandOptionType.string,
             name="name",
             description="The name of the venue to remove.",
-            required=True
+            required=True,
+            autocomplete=venue_names
         )
     ) -> None:
 
@@ -324,8 +330,15 @@ class Admin(Cog):
         ),
     ) -> None:
 
+        # The member cache only holds tracked users unless the guild's chunked.
+        if ctx.guild.chunked:
+            members = ctx.guild.members
+        else:
+            await ctx.defer()
+            members = await ctx.guild.fetch_members(limit=None).flatten()
+        
         await self.bot.report_manager.roles_report(
-            ctx.interaction, ctx.guild.members,
+            ctx.interaction, members,
             [r for r in [r1, r2, r3, r4, r5, r6, r7, r8, r9] if r]
         )
                           
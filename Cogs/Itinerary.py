@@ -52,12 +52,19 @@ class Itinerary(Cog):
                 OptionChoice(name="Oceanan", value="OC"),
                 OptionChoice(name="Japan", value="JP"),
             ]
+        ),
+        local: Option(
+            SlashCommandOptionType.boolean,
+            name="local_only",
+            description="Only this server's venues, from their saved hours.",
+            required=False,
+            default=False
         )
     ) -> None:
 
         guild = self.bot[ctx.guild_id]
         await guild.itinerary_manager.compile_itinerary(
-            ctx.interaction, hours, region or None
+            ctx.interaction, hours, region or None, local
         )
         
 ################################################################################
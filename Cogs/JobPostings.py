@@ -9,6 +9,8 @@ from discord import (
     guild_only
 )
 
+from Utilities import job_postings, venue_names
+
 if TYPE_CHECKING:
     from Classes import StaffPartyBot
 ################################################################################
@@ -39,7 +41,8 @@ class JobPostings(Cog):
             SlashCommandOptionType.string,
             name="venue",
             description="The venue for which the job is being posted.",
-            required=True
+            required=True,
+            autocomplete=venue_names
         )
     ) -> None:
 
@@ -59,7 +62,8 @@ class JobPostings(Cog):
             SlashCommandOptionType.string,
             name="post_id",
             description="The ID of the job posting to check or modify.",
-            required=True
+            required=True,
+            autocomplete=job_postings
         )
     ) -> None:
 
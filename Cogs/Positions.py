@@ -10,6 +10,8 @@ from discord import (
     guild_only,
 )
 
+from Utilities import position_names
+
 if TYPE_CHECKING:
     from Classes.Bot import StaffPartyBot
 ################################################################################
@@ -60,7 +62,8 @@ class Positions(Cog):
             type=SlashCommandOptionType.string,
             name="position",
             description="The position to view.",
-            required=True
+            required=True,
+            autocomplete=position_names
         )
     ) -> None:
 
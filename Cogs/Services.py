@@ -9,6 +9,8 @@ from discord import (
     guild_only,
 )
 
+from Utilities import service_names
+
 if TYPE_CHECKING:
     from Classes import StaffPartyBot
 ################################################################################
@@ -58,7 +60,8 @@ class Services(Cog):
             SlashCommandOptionType.string,
             name="name",
             description="The name of the service to check.",
-            required=True
+            required=True,
+            autocomplete=service_names
         )
     ) -> None:
 
@@ -10,6 +10,8 @@ from discord import (
     guild_only,
 )
 
+from Utilities import venue_names
+
 if TYPE_CHECKING:
     from Classes import StaffPartyBot
 ################################################################################
@@ -40,7 +42,8 @@ class Venues(Cog):
             SlashCommandOptionType.string,
             name="name",
             description="The name of the venue.",
-            required=True
+            required=True,
+            autocomplete=venue_names
         )
     ) -> None:
 
@@ -80,7 +83,8 @@ class Venues(Cog):
             SlashCommandOptionType.string,
             name="venue_name",
             description="The name of the venue to mute the user for.",
-            required=True
+            required=True,
+            autocomplete=venue_names
         ),
         user: Option(
             SlashCommandOptionType.user,
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from discord import Cog
+import os
+
+from discord import Cog, Interaction
 from typing import TYPE_CHECKING
 from discord.ext import tasks
 
+from Utilities import log, metrics, process_index
+
 if TYPE_CHECKING:
     from Classes import StaffPartyBot
 ################################################################################
@@ -24,6 +28,24 @@ class Internal(Cog):
         self.cull_job_postings.start()
         # self.training_reminder.start()
         
+        metrics.install_rate_limit_hook()
+        metrics.install_rest_hook(self.bot.http)
+        if not self.sample_loop_lag.is_running():
+            self.sample_loop_lag.start()
+        if not self.log_metrics.is_running():
+            self.log_metrics.start()
+        if not self.refresh_attachment_urls.is_running():
+            self.refresh_attachment_urls.start()
+        if not self.keep_threads_open.is_running():
+            self.keep_threads_open.start()
+        if self.bot.trims_member_cache and not self.trim_member_cache.is_running():
+            self.trim_member_cache.start()
+        if port := os.getenv("METRICS_PORT"):
+            # One port per process when sharded across several.
+            port = int(port) + process_index()
+            await metrics.start_server(port)
+            print(f"Metrics available on 127.0.0.1:{port}/metrics")
+        
         print("TrainingBot Online!")
 
 ################################################################################
@@ -44,6 +66,68 @@ class Internal(Cog):
 
         await self.bot[member.guild.id].on_member_leave(member)
         
+################################################################################
+    @Cog.listener("on_thread_create")
+    async def on_thread_create(self, thread) -> None:
+
+        if (guild := self.bot[thread.guild.id]) is not None:
+            guild.threads.refresh(thread)
+        
+################################################################################
+    @Cog.listener("on_raw_thread_update")
+    async def on_raw_thread_update(self, payload) -> None:
+
+        # Raw, so archive changes to threads no longer in pycord's cache arrive.
+        guild = self.bot[payload.guild_id]
+        if guild is not None and payload.thread is not None:
+            guild.threads.refresh(payload.thread)
+        
+################################################################################
+    @Cog.listener("on_raw_thread_delete")
+    async def on_raw_thread_delete(self, payload) -> None:
+
+        if (guild := self.bot[payload.guild_id]) is not None:
+            guild.threads.remove(payload.thread_id)
+        
+################################################################################
+    @Cog.listener("on_interaction")
+    async def on_interaction(self, interaction: Interaction) -> None:
+
+        # Buttons on venue/profile/job/group training/BG check posts.
+        await self.bot.component_router.dispatch(interaction)
+        
+################################################################################
+    @tasks.loop(seconds=5)
+    async def sample_loop_lag(self) -> None:
+
+        await metrics.sample_loop_lag()
+        
+################################################################################
+    @tasks.loop(minutes=15)
+    async def log_metrics(self) -> None:
+
+        log.info("Metrics", metrics.summary())
+        
+################################################################################
+    @tasks.loop(hours=1)
+    async def refresh_attachment_urls(self) -> None:
+
+        await self.bot.attachment_refresher.refresh()
+        
+################################################################################
+    @tasks.loop(hours=1)
+    async def keep_threads_open(self) -> None:
+
+        for f in self.bot.guild_manager.fguilds:
+            await f.threads.keep_alive()
+        
+################################################################################
+    @tasks.loop(minutes=30)
+    async def trim_member_cache(self) -> None:
+
+        for f in self.bot.guild_manager.fguilds:
+            f.trim_member_cache()
+        
 ################################################################################
     @tasks.loop(minutes=30)
     async def cull_job_postings(self) -> None:
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from discord    import Interaction, Member, User
-from discord.ui import View
+from discord.ui import Item, View
 from typing     import TYPE_CHECKING, Any, Optional, Union
 
+from Utilities.Metrics import metrics
+
 if TYPE_CHECKING:
     pass
 ################################################################################
@@ -40,6 +42,13 @@ class FroggeView(View):
 
         return False
 
+################################################################################
+    async def _scheduled_task(self, item: Item, interaction: Interaction) -> None:
+
+        # Each component callback runs in a task of its own, started here.
+        with metrics.component(type(self).__name__):
+            await super()._scheduled_task(item, interaction)
+
 ################################################################################
     async def on_timeout(self) -> None:
 
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from discord.ui import Button
+################################################################################
+
+__all__ = ("RoutedButton",)
+
+################################################################################
+class RoutedButton(Button):
+    """A button on a long-lived post. Presses are handled by the bot's
+    ComponentRouter using the ``custom_id``, so it never joins the ViewStore."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+################################################################################
+    def is_dispatchable(self) -> bool:
+
+        return False
+
+################################################################################
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from discord.ui import View, Item
+################################################################################
+
+__all__ = ("RoutedView",)
+
+################################################################################
+class RoutedView(View):
+    """Component layout for a long-lived post. Holds no entity state and is
+    never kept alive by the ViewStore; see ComponentRouter."""
+
+    def __init__(self, *items: Item):
+
+        super().__init__(*items, timeout=None)
+
+################################################################################
+    def is_finished(self) -> bool:
+
+        # Reporting "finished" keeps edits and responses from storing us.
+        return True
+
+################################################################################
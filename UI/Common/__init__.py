@@ -6,6 +6,8 @@ from .FroggeButton import FroggeButton
 from .FroggeModal import FroggeModal
 from .FroggeView import FroggeView
 from .Frogginator import Frogginator
+from .RoutedButton import RoutedButton
+from .RoutedView import RoutedView
 from .TimezoneSelectView import TimezoneSelectView
 from .YesNoView import YesNoView
 ################################################################################
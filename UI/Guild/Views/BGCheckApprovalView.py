@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from discord import ButtonStyle, Interaction
-from discord.ui import Button, View
+from discord import ButtonStyle
+
+from UI.Common import RoutedButton, RoutedView
 
 if TYPE_CHECKING:
     from Classes import BackgroundCheck
@@ -12,33 +13,16 @@ if TYPE_CHECKING:
 __all__ = ("BGCheckApprovalView",)
 
 ################################################################################
-class BGCheckApprovalView(View):
+class BGCheckApprovalView(RoutedView):
 
     def __init__(self, bg_check: BackgroundCheck):
         
-        super().__init__(timeout=None)
-        
-        self.bg_check: BackgroundCheck = bg_check
-        
-        button_list = [ApproveButton(bg_check.user_id)] if not bg_check.approved else []
-        for btn in button_list:
-            if not self.bg_check.approved:
-                self.add_item(btn)
-
-################################################################################
-    @staticmethod
-    async def edit_message_helper(interaction: Interaction, *args, **kwargs) -> None:
-    
-        try:
-            await interaction.message.edit(*args, **kwargs)
-        except:
-            try:
-                await interaction.edit_original_response(*args, **kwargs)
-            except:
-                print("Edit Message Helper FAILED")
+        super().__init__(
+            *([ApproveButton(bg_check.user_id)] if not bg_check.approved else [])
+        )
 
 ################################################################################
-class ApproveButton(Button):
+class ApproveButton(RoutedButton):
     
     def __init__(self, user_id: int):
         
@@ -50,9 +34,4 @@ class ApproveButton(Button):
             custom_id=f"approve_bg_check_{user_id}"
         )
         
-    async def callback(self, interaction):
-        await self.view.bg_check.approve(interaction.user)
-        await self.view.edit_message_helper(interaction, view=None)
-        self.view.stop()
-        
 ################################################################################
@@ -2,11 +2,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, List
 
-from discord import User, ButtonStyle
-from discord.ui import Button, View
+from discord import ButtonStyle
 
 from Assets import BotEmojis
-from UI.Common import CloseMessageButton
+from UI.Common import RoutedButton, RoutedView
 
 if TYPE_CHECKING:
     from Classes import JobPosting
@@ -15,27 +14,22 @@ if TYPE_CHECKING:
 __all__ = ("JobPostingPickupView",)
 
 ################################################################################
-class JobPostingPickupView(View):
+class JobPostingPickupView(RoutedView):
 
     def __init__(self, posting: JobPosting):
         
-        super().__init__(timeout=None)
-        
-        self.posting: JobPosting = posting
-        
-        button_list: List[Button] = (
+        button_list: List[RoutedButton] = (
             [AcceptButton(posting.id)] if posting.candidate is None 
             else []
         )
         button_list.append(RejectButton(posting.id))
-        if self.posting.candidate is not None:
-            button_list.append(CancelButton(posting))
+        if posting.candidate is not None:
+            button_list.append(CancelButton(posting.id))
         
-        for btn in button_list:
-            self.add_item(btn)
+        super().__init__(*button_list)
     
 ################################################################################
-class AcceptButton(Button):
+class AcceptButton(RoutedButton):
     
     def __init__(self, posting_id: str):
         
@@ -48,11 +42,8 @@ class AcceptButton(Button):
             custom_id=f"{posting_id}_accept"
         )
         
-    async def callback(self, interaction):
-        await self.view.posting.candidate_accept(interaction)       
-        
 ################################################################################
-class RejectButton(Button):
+class RejectButton(RoutedButton):
     
     def __init__(self, posting_id: str):
         
@@ -65,13 +56,10 @@ class RejectButton(Button):
             custom_id=f"{posting_id}_reject"
         )
         
-    async def callback(self, interaction):
-        await self.view.posting.reject(interaction)
-        
 ################################################################################
-class CancelButton(Button):
+class CancelButton(RoutedButton):
     
-    def __init__(self, posting: JobPosting):
+    def __init__(self, posting_id: str):
         
         super().__init__(
             style=ButtonStyle.secondary,
@@ -79,15 +67,7 @@ class CancelButton(Button):
             disabled=False,
             row=0,
             emoji=BotEmojis.Cross,
-            custom_id=f"{posting.id}_cancel"
+            custom_id=f"{posting_id}_cancel"
         )
         
-        self.user: User = posting.candidate.user
-        
-    async def callback(self, interaction):
-        if interaction.user == self.user:
-            await self.view.posting.cancel(interaction)
-        
 ################################################################################
-        
-        
\ No newline at end of file
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING
 
-from discord import Interaction, ButtonStyle
-from discord.ui import View
+from discord import ButtonStyle
 
-from UI.Common import FroggeButton
+from UI.Common import RoutedButton, RoutedView
 
 if TYPE_CHECKING:
     from Classes import Profile
@@ -14,17 +13,14 @@ if TYPE_CHECKING:
 __all__ = ("ProfileUserMuteView",)
 
 ################################################################################        
-class ProfileUserMuteView(View):
+class ProfileUserMuteView(RoutedView):
 
     def __init__(self, profile: Profile):
 
-        super().__init__(timeout=None)
-
-        self.profile: Profile = profile
-        self.add_item(MuteUserButton(self.profile.id))
+        super().__init__(MuteUserButton(profile.id))
 
 ################################################################################        
-class MuteUserButton(FroggeButton):
+class MuteUserButton(RoutedButton):
 
     def __init__(self, _id: str) -> None:
 
@@ -36,7 +32,4 @@ class MuteUserButton(FroggeButton):
             custom_id=f"mute_user_{_id}"
         )
 
-    async def callback(self, interaction: Interaction) -> None:
-        await self.view.profile.venue_mute(interaction)
-
 ################################################################################
@@ -1,14 +1,10 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING
 
-from discord import Interaction, User, ButtonStyle
-from discord.ui import View
+from discord import ButtonStyle
 
-from Assets import BotEmojis
-from UI.Common import FroggeView, CloseMessageButton, FroggeButton
-from Utilities import edit_message_helper
+from UI.Common import RoutedButton, RoutedView
 
 if TYPE_CHECKING:
     from Classes import GroupTraining
@@ -17,24 +13,17 @@ if TYPE_CHECKING:
 __all__ = ("GroupTrainingPickupView",)
 
 ################################################################################
-class GroupTrainingPickupView(View):
+class GroupTrainingPickupView(RoutedView):
 
     def __init__(self, training: GroupTraining) -> None:
 
-        super().__init__(timeout=None)
-
-        self.group: GroupTraining = training
-
-        button_list = [
-            AcceptButton(self.group.id),
-            TentativeButton(self.group.id),
-        ]
-        
-        for btn in button_list:
-            self.add_item(btn)
+        super().__init__(
+            AcceptButton(training.id),
+            TentativeButton(training.id),
+        )
 
 ################################################################################
-class AcceptButton(FroggeButton):
+class AcceptButton(RoutedButton):
 
     def __init__(self, group_id: str) -> None:
 
@@ -46,12 +35,8 @@ class AcceptButton(FroggeButton):
             custom_id=f"{group_id}_accept"
         )
 
-    async def callback(self, interaction: Interaction) -> None:
-        await self.view.group.signup(interaction)
-        await edit_message_helper(interaction, embed=self.view.group.status())
-
 ################################################################################
-class TentativeButton(FroggeButton):
+class TentativeButton(RoutedButton):
 
     def __init__(self, group_id: str) -> None:
 
@@ -63,8 +48,4 @@ class TentativeButton(FroggeButton):
             custom_id=f"{group_id}_tentative"
         )
 
-    async def callback(self, interaction: Interaction) -> None:
-        await self.view.group.tentative_signup(interaction)
-        await edit_message_helper(interaction, embed=self.view.group.status())
-
 ################################################################################
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from discord import Interaction, ButtonStyle
-from discord.ui import Button, View
+from discord import ButtonStyle
 
 from Assets import BotEmojis
+from UI.Common import RoutedButton, RoutedView
 
 if TYPE_CHECKING:
     from Classes import Venue
@@ -14,17 +14,14 @@ if TYPE_CHECKING:
 __all__ = ("VenuePostingMuteView",)
 
 ################################################################################
-class VenuePostingMuteView(View):
+class VenuePostingMuteView(RoutedView):
 
     def __init__(self,  venue: Venue):
         
-        super().__init__(timeout=None)
-        
-        self.venue: Venue = venue
-        self.add_item(VenueMuteButton(self.venue.id))
+        super().__init__(VenueMuteButton(venue.id))
         
 ################################################################################
-class VenueMuteButton(Button):
+class VenueMuteButton(RoutedButton):
     
     def __init__(self, venue_id: str):
                                    
@@ -36,14 +33,5 @@ class VenueMuteButton(Button):
             emoji=BotEmojis.Mute,
             custom_id=f"venue_mute_{venue_id}"
         )
-        
-    async def callback(self, interaction: Interaction):
-        venue: Venue = self.view.venue
-        tuser = venue.guild.training_manager[interaction.user.id]
-        if tuser is None:
-            await interaction.edit()
-            return
-        
-        await tuser.mute_venue(interaction, venue)
     
 ################################################################################
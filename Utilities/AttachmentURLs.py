@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+################################################################################
+
+__all__ = ("attachment_urls", )
+
+CDN_HOSTS = ("cdn.discordapp.com", "media.discordapp.net")
+
+################################################################################
+class _AttachmentURLCache:
+    """The freshest known URL for every Discord attachment the bot has stored.
+
+    Attachment URLs carry an expiring signature (``ex``/``is``/``hm`` query
+    parameters). Entities keep whatever URL they were given; their getters
+    pass it through ``fresh()`` so embeds always get the newest signature the
+    refresher has obtained. Anything that isn't a CDN attachment URL passes
+    through unchanged."""
+
+    def __init__(self):
+
+        # Attachment path -> (freshest URL, expiry as a unix timestamp).
+        self._urls: Dict[str, Tuple[str, int]] = {}
+
+################################################################################
+    @staticmethod
+    def _parse(url: Optional[str]) -> Optional[Tuple[str, int]]:
+
+        if not url:
+            return None
+
+        parts = urlsplit(url)
+        if parts.hostname not in CDN_HOSTS or not parts.path.startswith("/attachments/"):
+            return None
+
+        # Unsigned (pre-2024) URLs no longer load at all, so count them as
+        # already expired.
+        expires = parse_qs(parts.query).get("ex")
+        try:
+            return parts.path, int(expires[0], 16) if expires else 0
+        except ValueError:
+            return parts.path, 0
+
+################################################################################
+    def track(self, url: Optional[str]) -> None:
+
+        if (parsed := self._parse(url)) is None:
+            return
+
+        path, expires = parsed
+        current = self._urls.get(path)
+        if current is None or expires > current[1]:
+            self._urls[path] = (url, expires)
+
+################################################################################
+    def fresh(self, url: Optional[str]) -> Optional[str]:
+
+        if (parsed := self._parse(url)) is None:
+            return url
+
+        current = self._urls.get(parsed[0])
+        return current[0] if current is not None and current[1] > parsed[1] else url
+
+################################################################################
+    def expiry(self, url: Optional[str]) -> Optional[int]:
+        """When ``url`` (or the freshest known URL for the same attachment)
+        expires, as a unix timestamp. None if it isn't an attachment URL."""
+
+        if (parsed := self._parse(url)) is None:
+            return None
+
+        current = self._urls.get(parsed[0])
+        return max(parsed[1], current[1]) if current is not None else parsed[1]
+
+################################################################################
+    def expiring(self, within: float) -> List[str]:
+        """The freshest URL of every attachment expiring in the next
+        ``within`` seconds."""
+
+        cutoff = time.time() + within
+        return [url for url, expires in self._urls.values() if expires < cutoff]
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._urls)
+
+################################################################################
+
+attachment_urls = _AttachmentURLCache()
+
+################################################################################
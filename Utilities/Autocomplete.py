@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import Callable, List, Union
+
+from discord import AutocompleteContext, OptionChoice
+
+from .Metrics import metrics
+################################################################################
+
+__all__ = (
+    "venue_names",
+    "position_names",
+    "service_names",
+    "job_postings",
+)
+
+################################################################################
+def _complete(
+    kind: str,
+    ctx: AutocompleteContext,
+    choices: Callable[..., List[Union[str, OptionChoice]]]
+) -> List[Union[str, OptionChoice]]:
+
+    # Guild data isn't there until on_ready has loaded it.
+    guild = ctx.bot[ctx.interaction.guild_id]
+    if guild is None:
+        return []
+
+    with metrics.timer("autocomplete_seconds", kind=kind):
+        return choices(guild, ctx.value or "")
+
+################################################################################
+async def venue_names(ctx: AutocompleteContext) -> List[str]:
+
+    return _complete(
+        "venue", ctx,
+        lambda g, q: [v.name for v in g.venue_manager.names.search(q)]
+    )
+
+################################################################################
+async def position_names(ctx: AutocompleteContext) -> List[str]:
+
+    return _complete(
+        "position", ctx,
+        lambda g, q: [p.name for p in g.position_manager.names.search(q)]
+    )
+
+################################################################################
+async def service_names(ctx: AutocompleteContext) -> List[str]:
+
+    return _complete(
+        "service", ctx,
+        lambda g, q: [s.name for s in g.service_manager.names.search(q)]
+    )
+
+################################################################################
+async def job_postings(ctx: AutocompleteContext) -> List[OptionChoice]:
+
+    # Shows "Venue - Position (ID)" but submits the posting ID.
+    return _complete(
+        "job_posting", ctx,
+        lambda g, q: [
+            OptionChoice(name=p.label[:100], value=p.id)
+            for p in g.jobs_manager.names.search(q)
+        ]
+    )
+
+################################################################################
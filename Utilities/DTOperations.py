@@ -4,6 +4,7 @@ from discord import Interaction
 from datetime import datetime, time
 from typing import Optional, Tuple
 from .Enums import Timezone, Weekday
+from .TimeTables import time_tables
 from .Utilities import Utilities
 from UI.Guild import TZWeekdaySelectView, TimeSelectView
 from .Errors import DateTimeFormatError, DateTimeMismatchError, DateTimeBeforeNowError, TimeRangeError
@@ -252,15 +253,8 @@ class DTOperations:
             await interaction.respond(embed=error, ephemeral=True)
             return
         else:
-            start_dt = Utilities.TIMEZONE_OFFSETS[timezone].localize(
-                datetime(
-                    raw_start.year,
-                    raw_start.month,
-                    raw_start.day,
-                    raw_start.hour,
-                    raw_start.minute
-                )
-            )
+            # Wall-clock times in ``timezone``, which is returned alongside.
+            start_time = time(raw_start.hour, raw_start.minute)
     
         try:
             raw_end = datetime.strptime(modal.value[1], "%I:%M %p")
@@ -269,17 +263,9 @@ class DTOperations:
             await interaction.respond(embed=error, ephemeral=True)
             return
         else:
-            end_dt = Utilities.TIMEZONE_OFFSETS[timezone].localize(
-                datetime(
-                    raw_end.year,
-                    raw_end.month,
-                    raw_end.day,
-                    raw_end.hour,
-                    raw_end.minute
-                )
-            )
+            end_time = time(raw_end.hour, raw_end.minute)
     
-        return timezone, start_dt.time(), end_dt.time()
+        return timezone, start_time, end_time
     
 ################################################################################
     @staticmethod
@@ -341,34 +327,11 @@ class DTOperations:
 
         end_time = view.value
             
-        today = datetime.now().date()
-        py_tz = Utilities.TIMEZONE_OFFSETS[tz]
-        utc_tz = Utilities.TIMEZONE_OFFSETS[Timezone.GMT]
-        
-        start_dt = utc_tz.normalize(
-            py_tz.localize(
-                datetime(
-                    today.year,
-                    today.month,
-                    today.day,
-                    start_time.hour,
-                    start_time.minute
-                )
-            )
-        )
-        end_dt = utc_tz.normalize(
-            py_tz.localize(
-                datetime(
-                    today.year,
-                    today.month,
-                    today.day,
-                    end_time.hour,
-                    end_time.minute
-                )
-            )
-        )
+        # Stored in UTC, on the weekday as picked.
+        _, start_utc = time_tables.to_slot(time_tables.to_utc(tz, weekday, start_time))
+        _, end_utc = time_tables.to_slot(time_tables.to_utc(tz, weekday, end_time))
 
-        return tz, weekday, start_dt.time(), end_dt.time()
+        return tz, weekday, start_utc, end_utc
             
 ################################################################################
     
\ No newline at end of file
@@ -9,13 +9,56 @@ __all__ = ("DatabaseBuilder",)
 class DatabaseBuilder(DBWorkerBranch):
     """A utility class for building and asserting elements of the database."""
 
+    CHANGE_CHANNEL = "entity_changes"
+    # Table -> (entity kind, entity ID column, guild ID column, root/side)
+    CHANGE_TABLES = {
+        "venues": ("venue", "_id", "guild_id", "root"),
+        "venue_locations": ("venue", "venue_id", "", "side"),
+        "venue_aag": ("venue", "venue_id", "", "side"),
+        "venue_urls": ("venue", "venue_id", "", "side"),
+        "venue_hours": ("venue", "venue_id", "guild_id", "side"),
+        "job_postings": ("job_posting", "_id", "guild_id", "root"),
+        "job_hours": ("job_posting", "job_id", "guild_id", "side"),
+        "positions": ("position", "_id", "_guild_id", "root"),
+        "requirements": ("position", "position_id", "guild_id", "side"),
+        "profiles": ("profile", "_id", "guild_id", "root"),
+        "details": ("profile", "_id", "", "side"),
+        "ataglance": ("profile", "_id", "", "side"),
+        "personality": ("profile", "_id", "", "side"),
+        "images": ("profile", "_id", "", "side"),
+        "additional_images": ("profile", "profile_id", "", "side"),
+        "profile_availability": ("profile", "profile_id", "", "side"),
+        "tusers": ("tuser", "user_id", "guild_id", "root"),
+        "tuser_config": ("tuser", "user_id", "guild_id", "side"),
+        "tuser_details": ("tuser", "user_id", "guild_id", "side"),
+        "availability": ("tuser", "user_id", "guild_id", "side"),
+        "qualifications": ("tuser", "user_id", "guild_id", "side"),
+        "bg_checks": ("tuser", "user_id", "guild_id", "side"),
+        "trainings": ("training", "_id", "guild_id", "root"),
+        "requirement_overrides": ("training", "training_id", "guild_id", "side"),
+    }
+
     def build_all(self) -> None:
         
+        self._build_tables()
         self._build_views()
+        self._build_triggers()
         self._build_initial_records()
         
         print("Database lookin' good!")
 
+################################################################################
+    def _build_tables(self) -> None:
+
+        self.execute(
+            "CREATE TABLE IF NOT EXISTS bulk_checkpoints ("
+            "guild_id BIGINT NOT NULL, "
+            "job TEXT NOT NULL, "
+            "entity_id TEXT NOT NULL, "
+            "PRIMARY KEY (guild_id, job, entity_id)"
+            ");"
+        )
+
 ################################################################################
     def _build_initial_records(self) -> None:
 
@@ -133,4 +176,39 @@ class DatabaseBuilder(DBWorkerBranch):
         )
     
 ################################################################################
-    
\ No newline at end of file
+    
+################################################################################
+    def _build_triggers(self) -> None:
+        """Every change to an entity's rows sends a NOTIFY on ``CHANGE_CHANNEL``
+        naming the entity, so other processes can reload it. Changes to an
+        entity's side tables are reported as updates to the entity itself."""
+
+        self.execute(
+            "CREATE OR REPLACE FUNCTION notify_entity_change() RETURNS trigger AS $$ "
+            "DECLARE rec JSONB; "
+            "BEGIN "
+            "IF TG_OP = 'DELETE' THEN rec := to_jsonb(OLD); ELSE rec := to_jsonb(NEW); END IF; "
+            "PERFORM pg_notify("
+            f"'{self.CHANGE_CHANNEL}', "
+            "json_build_object("
+            "'kind', TG_ARGV[0], "
+            "'id', rec ->> TG_ARGV[1], "
+            "'guild', CASE WHEN TG_ARGV[2] <> '' THEN rec ->> TG_ARGV[2] END, "
+            "'op', CASE WHEN TG_ARGV[3] = 'root' THEN TG_OP ELSE 'UPDATE' END"
+            ")::text"
+            "); "
+            "RETURN NULL; "
+            "END; "
+            "$$ LANGUAGE plpgsql;"
+        )
+
+        for table, (kind, id_col, guild_col, role) in self.CHANGE_TABLES.items():
+            self.execute(f"DROP TRIGGER IF EXISTS {table}_notify ON {table};")
+            self.execute(
+                f"CREATE TRIGGER {table}_notify "
+                f"AFTER INSERT OR UPDATE OR DELETE ON {table} "
+                "FOR EACH ROW EXECUTE PROCEDURE "
+                f"notify_entity_change('{kind}', '{id_col}', '{guild_col}', '{role}');"
+            )
+
+################################################################################
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING, Any, Dict, Tuple
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple
 
 import psycopg2
 from dotenv import load_dotenv
 from psycopg2 import OperationalError
 
+from ..Metrics import metrics
+from .Listener import ChangeCallback, DatabaseListener
 from .Worker import DatabaseWorker
 
 if TYPE_CHECKING:
@@ -18,7 +21,14 @@ if TYPE_CHECKING:
     from Classes import StaffPartyBot
 ################################################################################
 
-__all__ = ("Database", )
+__all__ = ("Database", "TransactionFailed")
+
+################################################################################
+class TransactionFailed(Exception):
+    """A statement failed inside ``Database.transaction()`` or
+    ``Database.savepoint()``, and the block's work was rolled back."""
+
+    pass
 
 ################################################################################
 class Database:
@@ -29,6 +39,9 @@ class Database:
         "_connection",
         "_cursor",
         "_worker",
+        "_tx_depth",
+        "_tx_failed",
+        "_listener",
     )
 
 ################################################################################
@@ -40,6 +53,11 @@ class Database:
         self._cursor: cursor = None  # type: ignore
         self._worker: DatabaseWorker = DatabaseWorker(bot)
         
+        self._tx_depth: int = 0
+        self._tx_failed: bool = False
+        
+        self._listener: Optional[DatabaseListener] = None
+        
 ################################################################################        
     def _connect(self) -> None:
 
@@ -79,23 +97,141 @@ class Database:
             self._cursor = None
 
 ################################################################################
-    def execute(self, query: str, *fmt_args: Any) -> None:
-
+    def _ping(self) -> None:
+        
         try:
-            self._cursor.execute("SELECT 1")
+            with metrics.timer("db_ping_seconds"):
+                self._cursor.execute("SELECT 1")
         except:
+            metrics.inc("db_reconnects_total")
             self._connect()
 
+################################################################################
+    def execute(self, query: str, *fmt_args: Any) -> None:
+
+        op = query.lstrip().split(" ", 1)[0].upper()
+        metrics.inc("db_queries_total", op=op, origin=metrics.origin)
+        
+        # Inside a transaction the connection was checked when it began, and
+        # the commit happens once at the end.
+        if not self._tx_depth:
+            self._ping()
+
         load_dotenv()
         
         try:
-            self._cursor.execute(query, fmt_args)
-            self._connection.commit()
+            with metrics.timer("db_query_seconds", op=op):
+                self._cursor.execute(query, fmt_args)
+                if not self._tx_depth:
+                    self._connection.commit()
             if os.getenv("DEBUG") == "True":
                 print(f"Database execution succeeded on query: '{query}', Args: {fmt_args}")
         except:
+            metrics.inc("db_query_failures_total", op=op)
+            if self._tx_depth:
+                self._tx_failed = True
             print(f"Database execution failed on query: '{query}', Args: {fmt_args}")
 
+################################################################################
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Runs every ``execute()`` in the block as one transaction, committed
+        at the end, or rolled back if a statement failed or the block raised.
+        A failed statement raises ``TransactionFailed`` once it's rolled back,
+        so the caller can tell a commit from a rollback.
+        
+        The connection is shared by the whole bot, so the block must not
+        await anything - another task's statements would join it. Nested
+        blocks join the outermost one."""
+        
+        if self._tx_depth:
+            self._tx_depth += 1
+            try:
+                yield
+            finally:
+                self._tx_depth -= 1
+            return
+        
+        self._ping()
+        self._tx_depth = 1
+        self._tx_failed = False
+        
+        try:
+            yield
+        except BaseException:
+            self._connection.rollback()
+            metrics.inc("db_transactions_total", result="rolled_back")
+            raise
+        else:
+            if self._tx_failed:
+                self._connection.rollback()
+                metrics.inc("db_transactions_total", result="rolled_back")
+                print("Database transaction rolled back after a failed statement.")
+                raise TransactionFailed("A statement failed; the transaction was rolled back.")
+            else:
+                self._connection.commit()
+                metrics.inc("db_transactions_total", result="committed")
+        finally:
+            self._tx_depth = 0
+            self._tx_failed = False
+
+################################################################################
+    @contextmanager
+    def savepoint(self) -> Iterator[None]:
+        """Runs the block under a savepoint of the current transaction. If a
+        statement in it fails or it raises, only the block's statements are
+        undone (``TransactionFailed`` is raised for a failed statement) and
+        the transaction carries on. Outside a transaction it is one."""
+
+        if not self._tx_depth:
+            with self.transaction():
+                yield
+            return
+
+        name = f"sp_{self._tx_depth}"
+        outer_failed, self._tx_failed = self._tx_failed, False
+        self._cursor.execute(f"SAVEPOINT {name}")
+        self._tx_depth += 1
+
+        try:
+            yield
+            if self._tx_failed:
+                raise TransactionFailed("A statement failed; the savepoint was rolled back.")
+        except BaseException:
+            self._cursor.execute(f"ROLLBACK TO SAVEPOINT {name}")
+            metrics.inc("db_savepoints_total", result="rolled_back")
+            raise
+        else:
+            self._cursor.execute(f"RELEASE SAVEPOINT {name}")
+            metrics.inc("db_savepoints_total", result="released")
+        finally:
+            self._tx_depth -= 1
+            self._tx_failed = outer_failed
+
+################################################################################
+    @property
+    def backend_pid(self) -> Optional[int]:
+        """The server process behind this connection, which is what change
+        notifications caused by our own statements are tagged with."""
+        
+        try:
+            return self._connection.get_backend_pid()
+        except (AttributeError, OperationalError):
+            return None
+
+################################################################################
+    def listen(self, callback: ChangeCallback) -> None:
+        """Starts passing other processes' entity changes to ``callback``."""
+        
+        if self._listener is None:
+            self._listener = DatabaseListener(callback, lambda: self.backend_pid)
+            self._listener.start()
+
+################################################################################
+    def load_entity(self, kind: str, entity_id: str, guild_id: Optional[int] = None) -> Dict[str, Any]:
+        
+        return self._worker.load_entity(kind, entity_id, guild_id)
+
 ################################################################################
     def fetchall(self) -> Tuple[Tuple[Any, ...]]:
 
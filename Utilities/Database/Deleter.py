@@ -119,6 +119,14 @@ class DatabaseDeleter(DBWorkerBranch):
             signup.id
         )
         
+################################################################################
+    def _delete_bulk_checkpoint(self, guild_id: int, job: str) -> None:
+        
+        self.execute(
+            "DELETE FROM bulk_checkpoints WHERE guild_id = %s AND job = %s;",
+            guild_id, job
+        )
+        
 ################################################################################
 
     requirement             = _delete_requirement
@@ -134,6 +142,7 @@ class DatabaseDeleter(DBWorkerBranch):
     sp_availability         = _delete_service_profile_availability
     group_training          = delete_group_training
     group_training_signup   = delete_group_training_signup
+    bulk_checkpoint         = _delete_bulk_checkpoint
     
 ################################################################################
     
\ No newline at end of file
@@ -311,6 +311,16 @@ class DatabaseInserter(DBWorkerBranch):
         
         return new_id
         
+################################################################################
+    def _add_bulk_checkpoint(self, guild_id: int, job: str, entity_ids: List[str]) -> None:
+        
+        self.execute(
+            "INSERT INTO bulk_checkpoints (guild_id, job, entity_id) VALUES " +
+            ", ".join(["(%s, %s, %s)"] * len(entity_ids)) +
+            " ON CONFLICT DO NOTHING;",
+            *(arg for entity_id in entity_ids for arg in (guild_id, job, entity_id))
+        )
+        
 ################################################################################
 
     position                = _add_position
@@ -332,6 +342,7 @@ class DatabaseInserter(DBWorkerBranch):
     sp_availability         = _add_service_availability
     group_training          = _add_group_training
     group_training_signup   = _add_group_training_signup
+    bulk_checkpoint         = _add_bulk_checkpoint
     
 ################################################################################
     
\ No newline at end of file
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+import psycopg2
+from dotenv import load_dotenv
+from psycopg2 import OperationalError
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
+from ..FroggeLog import log
+from ..Metrics import metrics
+from .Builder import DatabaseBuilder
+
+if TYPE_CHECKING:
+    from psycopg2.extensions import connection
+################################################################################
+
+__all__ = ("DatabaseListener", )
+
+ChangeCallback = Callable[[Dict[str, Any]], None]
+
+################################################################################
+class DatabaseListener:
+    """LISTENs for the entity change notifications sent by the triggers made
+    in ``DatabaseBuilder._build_triggers``, on a connection of its own, and
+    hands each one to a callback.
+
+    The connection is watched with ``loop.add_reader`` rather than polled,
+    so it costs nothing while the database is quiet. Changes made through
+    this process's own connection are dropped - the in-memory state is
+    already the source of them."""
+
+    __slots__ = (
+        "_callback",
+        "_own_pid",
+        "_connection",
+        "_retry_task",
+    )
+
+    RETRY_DELAY = 10  # seconds
+
+################################################################################
+    def __init__(self, callback: ChangeCallback, own_pid: Callable[[], Optional[int]]) -> None:
+
+        self._callback: ChangeCallback = callback
+        self._own_pid: Callable[[], Optional[int]] = own_pid
+
+        self._connection: Optional[connection] = None
+        self._retry_task: Optional[asyncio.Task] = None
+
+################################################################################
+    @property
+    def listening(self) -> bool:
+
+        return self._connection is not None
+
+################################################################################
+    def start(self) -> None:
+
+        load_dotenv()
+
+        try:
+            if os.getenv("DEBUG") == "True":
+                self._connection = psycopg2.connect(os.getenv("DATABASE_URL"))
+            else:
+                self._connection = psycopg2.connect(
+                    os.getenv("HEROKU_POSTGRESQL_NAVY_URL"), sslmode="require"
+                )
+            self._connection.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+            with self._connection.cursor() as cur:
+                cur.execute(f"LISTEN {DatabaseBuilder.CHANGE_CHANNEL};")
+        except OperationalError as ex:
+            log.error("Core", f"Couldn't start the database change listener: {ex}")
+            self._close()
+            self._retry_later()
+            return
+
+        asyncio.get_running_loop().add_reader(self._connection.fileno(), self._on_readable)
+        log.info("Core", f"Listening for database changes on '{DatabaseBuilder.CHANGE_CHANNEL}'.")
+
+################################################################################
+    def stop(self) -> None:
+
+        if self._retry_task is not None:
+            self._retry_task.cancel()
+            self._retry_task = None
+
+        self._close()
+
+################################################################################
+    def _close(self) -> None:
+
+        if self._connection is None:
+            return
+
+        try:
+            asyncio.get_running_loop().remove_reader(self._connection.fileno())
+        except (RuntimeError, ValueError, OperationalError):
+            pass
+
+        try:
+            self._connection.close()
+        except OperationalError:
+            pass
+        finally:
+            self._connection = None
+
+################################################################################
+    def _retry_later(self) -> None:
+
+        if self._retry_task is None:
+            self._retry_task = asyncio.create_task(self._retry())
+
+################################################################################
+    async def _retry(self) -> None:
+
+        await asyncio.sleep(self.RETRY_DELAY)
+        self._retry_task = None
+        metrics.inc("db_listener_reconnects_total")
+
+        self.start()
+
+################################################################################
+    def _on_readable(self) -> None:
+
+        try:
+            self._connection.poll()
+        except OperationalError as ex:
+            # Whatever changed while we were gone is lost; the next change to
+            # each entity brings it back in line.
+            log.warning("Core", f"Database change listener lost its connection: {ex}")
+            self._close()
+            self._retry_later()
+            return
+
+        own_pid = self._own_pid()
+        while self._connection.notifies:
+            note = self._connection.notifies.pop(0)
+            if note.pid == own_pid:
+                metrics.inc("db_notifications_total", result="own")
+                continue
+
+            try:
+                change = json.loads(note.payload)
+            except ValueError:
+                log.warning("Core", f"Unreadable change notification: {note.payload!r}")
+                metrics.inc("db_notifications_total", result="invalid")
+                continue
+
+            metrics.inc("db_notifications_total", result="received")
+            self._callback(change)
+
+################################################################################
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 from .Branch import DBWorkerBranch
 
@@ -14,6 +14,17 @@ __all__ = ("DatabaseLoader",)
 class DatabaseLoader(DBWorkerBranch):
     """A utility class for loading data from the database."""
 
+    # Everything ``load_all`` returns.
+    KEYS = (
+        "bot_config", "positions", "requirements", "tusers", "availability",
+        "qualifications", "trainings", "requirement_overrides", "profiles",
+        "additional_images", "venues", "venue_hours", "job_postings", "hours",
+        "bg_checks", "roles", "channels", "profile_availability",
+        "service_configs", "service_profiles", "services", "sp_availability",
+        "sp_images", "group_trainings", "group_training_signups",
+        "bulk_checkpoints",
+    )
+
     def load_all(self) -> Dict[str, Any]:
         """Performs all sub-loaders and returns a dictionary of their results."""
 
@@ -43,6 +54,7 @@ class DatabaseLoader(DBWorkerBranch):
             "sp_images" : self._load_sp_images(),
             "group_trainings": self._load_group_trainings(),
             "group_training_signups": self._load_group_training_signups(),
+            "bulk_checkpoints": self._load_bulk_checkpoints(),
         }
 
 ################################################################################
@@ -195,4 +207,54 @@ class DatabaseLoader(DBWorkerBranch):
         self.execute("SELECT * FROM group_training_signups;")
         return self.fetchall()
     
+################################################################################
+    def _load_bulk_checkpoints(self) -> Tuple[Tuple[Any, ...], ...]:
+        
+        self.execute("SELECT * FROM bulk_checkpoints;")
+        return self.fetchall()
+    
+################################################################################
+    def load_entity(self, kind: str, entity_id: str, guild_id: Optional[int] = None) -> Dict[str, Any]:
+        """The rows ``load_all`` would return for one entity (every other key
+        empty), for reloading it after another process changed it."""
+
+        ret: Dict[str, Any] = {key: () for key in self.KEYS}
+
+        def select(key: str, query: str, *args: Any) -> None:
+            self.execute(query, *args)
+            ret[key] = self.fetchall()
+
+        if kind == "venue":
+            select("venues", "SELECT * FROM venue_master WHERE _id = %s;", entity_id)
+            select("venue_hours", "SELECT * FROM venue_hours WHERE venue_id = %s;", entity_id)
+        elif kind == "job_posting":
+            select("job_postings", "SELECT * FROM job_postings WHERE _id = %s;", entity_id)
+            select("hours", "SELECT * FROM job_hours WHERE job_id = %s;", entity_id)
+        elif kind == "position":
+            select("positions", "SELECT * FROM positions WHERE _id = %s;", entity_id)
+            select("requirements", "SELECT * FROM requirements WHERE position_id = %s;", entity_id)
+        elif kind == "profile":
+            select("profiles", "SELECT * FROM profile_master WHERE _id = %s;", entity_id)
+            select("additional_images", "SELECT * FROM additional_images WHERE profile_id = %s;", entity_id)
+            select("profile_availability", "SELECT * FROM profile_availability WHERE profile_id = %s;", entity_id)
+        elif kind == "tuser":
+            # One user can be registered in several guilds.
+            where = "user_id = %s" + (" AND guild_id = %s" if guild_id else "")
+            args = (int(entity_id), guild_id) if guild_id else (int(entity_id),)
+            select("tusers", f"SELECT * FROM tuser_master WHERE {where};", *args)
+            select("availability", f"SELECT * FROM availability WHERE {where};", *args)
+            select("qualifications", f"SELECT * FROM qualifications WHERE {where};", *args)
+            select("bg_checks", f"SELECT * FROM bg_checks WHERE {where};", *args)
+        elif kind == "training":
+            select("trainings", "SELECT * FROM trainings WHERE _id = %s;", entity_id)
+            select(
+                "requirement_overrides",
+                "SELECT * FROM requirement_overrides WHERE training_id = %s;",
+                entity_id
+            )
+        else:
+            raise ValueError(f"Unknown entity kind: {kind}")
+
+        return ret
+
 ################################################################################
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
 from .Branch import DBWorkerBranch
 
@@ -394,8 +394,37 @@ class DatabaseUpdater(DBWorkerBranch):
             signup.level.value, signup.id
         )
         
+################################################################################
+    def _update_attachment_urls(self, refreshed: Dict[str, str]) -> None:
+        """Swaps every stored copy of each old URL for its refreshed one, in
+        a single round trip."""
+        
+        # (table, column) pairs that hold dumped image URLs.
+        columns = (
+            ("images", "thumbnail"),
+            ("images", "main_image"),
+            ("additional_images", "url"),
+            ("service_profiles", "thumbnail"),
+            ("service_profiles", "main_image"),
+            ("venue_urls", "logo_url"),
+            ("venue_urls", "banner_url"),
+        )
+        
+        values = ", ".join(["(%s, %s)"] * len(refreshed))
+        args = [url for pair in refreshed.items() for url in pair]
+        
+        self.execute(
+            " ".join(
+                f"UPDATE {table} t SET {column} = v.new "
+                f"FROM (VALUES {values}) AS v(old, new) WHERE t.{column} = v.old;"
+                for table, column in columns
+            ),
+            *(args * len(columns))
+        )
+        
 ################################################################################
     
+    attachment_urls         = _update_attachment_urls
     log_channel             = _update_log_channel
     position                = _update_position
     requirement             = _update_requirement
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from .Builder import DatabaseBuilder
 from .Deleter import DatabaseDeleter
@@ -52,4 +52,9 @@ class DatabaseWorker:
 
         return self._loader.load_all()
 
+################################################################################
+    def load_entity(self, kind: str, entity_id: str, guild_id: Optional[int] = None) -> Dict[str, Any]:
+
+        return self._loader.load_entity(kind, entity_id, guild_id)
+
 ################################################################################
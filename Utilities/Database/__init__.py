@@ -1,2 +1,2 @@
-from .Database import Database
+from .Database import Database, TransactionFailed
 ################################################################################
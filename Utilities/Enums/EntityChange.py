@@ -0,0 +1,9 @@
+from ._Enum import FroggeEnum
+################################################################################
+class EntityChange(FroggeEnum):
+
+    Created = 1
+    Updated = 2
+    Deleted = 3
+    
+################################################################################
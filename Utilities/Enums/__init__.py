@@ -4,6 +4,7 @@ from .SignupLevel import SignupLevel
 from .MentionableType import MentionableType
 from .Clan import Clan
 from .DataCenter import DataCenter
+from .EntityChange import EntityChange
 from .GameWorld import GameWorld
 from .Gender import Gender
 from .GlobalDataCenter import GlobalDataCenter
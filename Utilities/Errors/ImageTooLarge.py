@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from ._Error import ErrorMessage
+################################################################################
+
+__all__ = ("ImageTooLargeError",)
+
+################################################################################
+class ImageTooLargeError(ErrorMessage):
+
+    def __init__(self, max_mb: int):
+        super().__init__(
+            title="Image Too Large!",
+            message=f"That image is bigger than the {max_mb} MB I can accept.",
+            solution="Please shrink or compress the image, then try again."
+        )
+
+################################################################################
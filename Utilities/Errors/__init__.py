@@ -12,6 +12,7 @@ from .ExceedsMaxLength import ExceedsMaxLengthError
 from .ExperienceExists import ExperienceExistsError
 from .GroupTrainingNotComplete import GroupTrainingNotCompleteError
 from .HeightInput import HeightInputError
+from .ImageTooLarge import ImageTooLargeError
 from .IneligibleForJob import IneligibleForJobError
 from .InsufficientPermissions import InsufficientPermissionsError
 from .InvalidColor import InvalidColorError
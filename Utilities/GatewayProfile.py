@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import os
+from typing import Any, Dict, Optional
+
+from discord import Intents, MemberCacheFlags
+################################################################################
+
+__all__ = (
+    "gateway_options",
+    "GATEWAY_PROFILES",
+)
+
+GATEWAY_PROFILES = ("lean", "full")
+
+################################################################################
+def _full() -> Dict[str, Any]:
+    """Everything on and everyone cached - the behaviour before profiles."""
+
+    return {
+        "intents": Intents.all(),
+        "trim_member_cache": False,
+    }
+
+################################################################################
+def _lean(message_cache: int) -> Dict[str, Any]:
+    """Only the events the bot handles, and only tracked members cached."""
+
+    intents = Intents.none()
+    intents.guilds = True
+    # Join/leave events and on-demand member requests.
+    intents.members = True
+    # The venue logo upload waits for the user's next message.
+    intents.guild_messages = True
+    intents.message_content = True
+    intents.emojis_and_stickers = True
+
+    return {
+        "intents": intents,
+        # Nobody is chunked on connect. Tracked users are requested in bulk
+        # as each guild loads; everyone else is fetched when needed.
+        "chunk_guilds_at_startup": False,
+        "member_cache_flags": MemberCacheFlags(joined=True, interaction=True, voice=False),
+        # Post messages are resolved by URL and held by the resolver, so this
+        # only needs to cover messages awaited with wait_for().
+        "max_messages": message_cache,
+        "trim_member_cache": True,
+    }
+
+################################################################################
+def gateway_options(profile: Optional[str] = None) -> Dict[str, Any]:
+    """Keyword arguments for ``StaffPartyBot`` for the given profile, or the
+    one named by ``GATEWAY_PROFILE`` (default ``lean``). ``MESSAGE_CACHE``
+    sets the lean profile's message cache size."""
+
+    profile = (profile or os.getenv("GATEWAY_PROFILE") or "lean").lower()
+
+    if profile == "full":
+        return _full()
+    elif profile == "lean":
+        return _lean(int(os.getenv("MESSAGE_CACHE", 200)))
+
+    raise ValueError(
+        f"Unknown gateway profile '{profile}'. Expected one of: {', '.join(GATEWAY_PROFILES)}."
+    )
+
+################################################################################
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+from aiohttp import web
+
+if TYPE_CHECKING:
+    from discord.http import HTTPClient
+################################################################################
+
+__all__ = ("metrics", )
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# The command or component whose work the current task is doing.
+_origin: ContextVar[str] = ContextVar("metrics_origin", default="none")
+
+################################################################################
+class _Timing:
+
+    __slots__ = (
+        "count",
+        "total",
+        "max",
+        "buckets",
+    )
+
+    BOUNDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+################################################################################
+    def __init__(self) -> None:
+
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+        self.buckets: List[int] = [0] * len(self.BOUNDS)
+
+################################################################################
+    def observe(self, value: float) -> None:
+
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+        for i, bound in enumerate(self.BOUNDS):
+            if value <= bound:
+                self.buckets[i] += 1
+                break
+
+################################################################################
+class _RateLimitHandler(logging.Handler):
+    """Picks pycord's 429 warnings off the ``discord.http`` logger."""
+
+    def __init__(self, owner: _FroggeMetrics):
+
+        super().__init__(logging.WARNING)
+        self._owner: _FroggeMetrics = owner
+
+################################################################################
+    def emit(self, record: logging.LogRecord) -> None:
+
+        if not isinstance(record.msg, str) or not record.args:
+            return
+
+        if record.msg.startswith("We are being rate limited"):
+            retry_after, bucket = record.args[0], record.args[1]
+            origin = self._owner.origin
+            self._owner.inc("rest_ratelimit_hits_total", bucket=str(bucket).split(":")[0], origin=origin)
+            self._owner.observe("rest_ratelimit_wait_seconds", float(retry_after), origin=origin)
+        elif record.msg.startswith("Global rate limit"):
+            self._owner.inc("rest_ratelimit_global_total")
+
+################################################################################
+class _FroggeMetrics:
+    """Process-wide counters and timings, exported in Prometheus text format
+    and summarised periodically to the log."""
+
+    PREFIX = "spb_"
+
+################################################################################
+    def __init__(self):
+
+        self._counters: Dict[Tuple[str, LabelKey], float] = {}
+        self._timings: Dict[Tuple[str, LabelKey], _Timing] = {}
+        self._gauges: Dict[Tuple[str, LabelKey], float] = {}
+
+        self._rl_handler: Optional[_RateLimitHandler] = None
+        self._runner: Optional[web.AppRunner] = None
+
+################################################################################
+    @staticmethod
+    def _key(name: str, labels: Dict[str, str]) -> Tuple[str, LabelKey]:
+
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+################################################################################
+    def reset(self) -> None:
+
+        self._counters.clear()
+        self._timings.clear()
+        self._gauges.clear()
+
+################################################################################
+    def inc(self, name: str, amount: float = 1, **labels: str) -> None:
+
+        key = self._key(name, labels)
+        self._counters[key] = self._counters.get(key, 0) + amount
+
+################################################################################
+    def set(self, name: str, value: float, **labels: str) -> None:
+
+        self._gauges[self._key(name, labels)] = value
+
+################################################################################
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+
+        key = self._key(name, labels)
+        timing = self._timings.get(key)
+        if timing is None:
+            timing = self._timings[key] = _Timing()
+
+        timing.observe(seconds)
+
+################################################################################
+    @contextmanager
+    def timer(self, name: str, **labels: str) -> Iterator[None]:
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+################################################################################
+    @property
+    def origin(self) -> str:
+        """The command or component the current task is working for, as set
+        by ``attribute()`` - "none" for background work."""
+
+        return _origin.get()
+
+################################################################################
+    @contextmanager
+    def attribute(self, origin: str) -> Iterator[None]:
+        """Labels the DB statements, REST calls, rate-limit waits and lookups
+        made inside the block (and by tasks it starts) with ``origin``."""
+
+        token = _origin.set(origin)
+        try:
+            yield
+        finally:
+            _origin.reset(token)
+
+################################################################################
+    @contextmanager
+    def component(self, name: str) -> Iterator[None]:
+        """Times and attributes a component callback."""
+
+        status = "ok"
+        start = time.perf_counter()
+        try:
+            with self.attribute(name):
+                yield
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            self.inc("components_total", component=name, status=status)
+            self.observe("component_seconds", time.perf_counter() - start, component=name)
+
+################################################################################
+    def install_rest_hook(self, http: HTTPClient) -> None:
+        """Counts and times every REST request ``http`` makes, by method and
+        origin."""
+
+        original = http.request
+        if getattr(original, "_metered", False):
+            return
+
+        async def request(route: Any, **kwargs: Any) -> Any:
+            labels = {"method": route.method, "origin": self.origin}
+            self.inc("rest_requests_total", **labels)
+            with self.timer("rest_request_seconds", **labels):
+                return await original(route, **kwargs)
+
+        request._metered = True  # type: ignore
+        http.request = request  # type: ignore
+
+################################################################################
+    def install_rate_limit_hook(self) -> None:
+
+        if self._rl_handler is not None:
+            return
+
+        self._rl_handler = _RateLimitHandler(self)
+        logging.getLogger("discord.http").addHandler(self._rl_handler)
+
+################################################################################
+    async def sample_loop_lag(self, interval: float = 0.25) -> float:
+
+        # How late the loop wakes us up is how long other callbacks held it.
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lag = max(0.0, time.perf_counter() - start - interval)
+
+        self.observe("event_loop_lag_seconds", lag)
+        self.set("event_loop_lag_last_seconds", lag)
+
+        return lag
+
+################################################################################
+    @staticmethod
+    def _fmt_labels(labels: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+
+        pairs = list(labels) + ([extra] if extra else [])
+        if not pairs:
+            return ""
+
+        return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+################################################################################
+    def render(self) -> str:
+
+        lines: List[str] = []
+
+        for kind, source in (("counter", self._counters), ("gauge", self._gauges)):
+            seen = set()
+            for (name, labels), value in sorted(source.items()):
+                full = self.PREFIX + name
+                if full not in seen:
+                    lines.append(f"# TYPE {full} {kind}")
+                    seen.add(full)
+                lines.append(f"{full}{self._fmt_labels(labels)} {value}")
+
+        seen = set()
+        for (name, labels), timing in sorted(self._timings.items(), key=lambda i: i[0]):
+            full = self.PREFIX + name
+            if full not in seen:
+                lines.append(f"# TYPE {full} histogram")
+                seen.add(full)
+
+            running = 0
+            for bound, count in zip(_Timing.BOUNDS, timing.buckets):
+                running += count
+                lines.append(
+                    f"{full}_bucket{self._fmt_labels(labels, ('le', str(bound)))} {running}"
+                )
+            lines.append(
+                f"{full}_bucket{self._fmt_labels(labels, ('le', '+Inf'))} {timing.count}"
+            )
+            lines.append(f"{full}_sum{self._fmt_labels(labels)} {timing.total}")
+            lines.append(f"{full}_count{self._fmt_labels(labels)} {timing.count}")
+
+        return "\n".join(lines) + "\n"
+
+################################################################################
+    def summary(self, limit: int = 10) -> str:
+
+        lines = ["Metrics summary:"]
+
+        totals: Dict[str, float] = {}
+        for (name, _), value in self._counters.items():
+            totals[name] = totals.get(name, 0) + value
+        for name, value in sorted(totals.items()):
+            lines.append(f"  {name}: {value:g}")
+
+        slowest = sorted(
+            self._timings.items(),
+            key=lambda i: i[1].total / i[1].count if i[1].count else 0,
+            reverse=True
+        )[:limit]
+        for (name, labels), t in slowest:
+            label_str = ", ".join(f"{k}={v}" for k, v in labels)
+            lines.append(
+                f"  {name}[{label_str}]: n={t.count} "
+                f"avg={t.total / t.count * 1000:.1f}ms max={t.max * 1000:.1f}ms"
+            )
+
+        return "\n".join(lines)
+
+################################################################################
+    async def start_server(self, port: int, host: str = "127.0.0.1") -> None:
+
+        if self._runner is not None:
+            return
+
+        async def handler(_: web.Request) -> web.Response:
+            return web.Response(text=self.render(), content_type="text/plain")
+
+        app = web.Application()
+        app.router.add_get("/metrics", handler)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+
+################################################################################
+
+metrics = _FroggeMetrics()
+
+################################################################################
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import os
+import re
+from typing import Any, Dict, Optional
+################################################################################
+
+__all__ = (
+    "shard_options",
+    "process_index",
+    "process_count",
+)
+
+################################################################################
+def process_index() -> int:
+    """This process's place among the bot's processes, from ``PROCESS_INDEX``
+    or else Heroku's ``DYNO`` (``worker.3`` is index 2). 0 when neither is
+    set."""
+
+    if (index := os.getenv("PROCESS_INDEX")) is not None:
+        return int(index)
+
+    if match := re.fullmatch(r"\w+\.(\d+)", os.getenv("DYNO", "")):
+        return int(match.group(1)) - 1
+
+    return 0
+
+################################################################################
+def process_count() -> int:
+    """How many processes the bot runs as (``PROCESS_COUNT``, default 1)."""
+
+    return int(os.getenv("PROCESS_COUNT", 1))
+
+################################################################################
+def shard_options() -> Optional[Dict[str, Any]]:
+    """Keyword arguments for ``ShardedStaffPartyBot`` when ``SHARDING`` is on,
+    or None to run unsharded.
+
+    Shards are dealt out round-robin, so process *i* of *n* runs shards *i*,
+    *i + n*, *i + 2n*... of ``SHARD_COUNT`` (default: one per process). A
+    single process with no ``SHARD_COUNT`` lets Discord pick the count. Only
+    the first process syncs application commands."""
+
+    if os.getenv("SHARDING") != "True":
+        return None
+
+    index, count = process_index(), process_count()
+    if not 0 <= index < count:
+        raise ValueError(f"Process index {index} is out of range for {count} process(es).")
+
+    shards = os.getenv("SHARD_COUNT")
+    if shards is None and count == 1:
+        return {}
+
+    shards = int(shards or count)
+    if shards < count:
+        raise ValueError(f"SHARD_COUNT ({shards}) can't be less than PROCESS_COUNT ({count}).")
+
+    return {
+        "shard_count": shards,
+        "shard_ids": list(range(index, shards, count)),
+        "auto_sync_commands": index == 0,
+    }
+
+################################################################################
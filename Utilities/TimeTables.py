@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import time as _time
+from bisect import bisect_right
+from datetime import datetime, time, timedelta, tzinfo
+from typing import Dict, List, Optional, Tuple, Union
+
+import pytz
+
+from .Enums import Timezone, Weekday
+from .Utilities import Utilities, TimestampStyle
+################################################################################
+
+__all__ = ("time_tables", )
+
+DAY = 24 * 60  # minutes
+WEEK = 7 * DAY
+
+################################################################################
+class _TimeTables:
+    """UTC offsets for every ``Timezone`` over the current week, and the
+    Discord timestamps for slots in it.
+
+    Weekly slots (availability, venue hours) are minute-of-week integers
+    counted from Monday 00:00 UTC. Each zone's table lists the minutes at
+    which its offset changes this week, so DST is right on the day it
+    switches, and converting a local slot is a bisect instead of a pytz
+    ``localize``/``normalize``. Timestamp strings are memoized per slot and
+    style. Everything is rebuilt lazily once the week rolls over."""
+
+    def __init__(self):
+
+        self._week_start: Optional[datetime] = None
+        # Unix time the next week starts at.
+        self._rollover: float = 0.0
+        # Timezone -> [(UTC minute of week the offset starts at, offset in minutes)]
+        self._offsets: Dict[Timezone, List[Tuple[int, int]]] = {}
+        self._stamps: Dict[Tuple[int, str], str] = {}
+        # The pytz zones the UI attaches to times, back to their Timezone.
+        self._zones: Dict[str, Timezone] = {
+            str(zone): tz for tz, zone in Utilities.TIMEZONE_OFFSETS.items()
+        }
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._stamps)
+
+################################################################################
+    @property
+    def week_start(self) -> datetime:
+        """Monday 00:00 UTC of the current week."""
+
+        if _time.time() >= self._rollover:
+            now = datetime.now(pytz.utc)
+            self._week_start = (now - timedelta(days=now.weekday())).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+            self._rollover = (self._week_start + timedelta(weeks=1)).timestamp()
+            self._offsets.clear()
+            self._stamps.clear()
+
+        return self._week_start
+
+################################################################################
+    @staticmethod
+    def minute_of_week(day: Union[Weekday, int], t: time) -> int:
+        """``t`` on ``day`` as it reads, ignoring any tzinfo."""
+
+        day = day.value if isinstance(day, Weekday) else day
+        return day * DAY + t.hour * 60 + t.minute
+
+################################################################################
+    @staticmethod
+    def to_slot(minute: int) -> Tuple[Weekday, time]:
+
+        minute %= WEEK
+        return Weekday(minute // DAY), time(minute % DAY // 60, minute % 60)
+
+################################################################################
+    def _build(self, tz: Timezone) -> List[Tuple[int, int]]:
+
+        zone = Utilities.TIMEZONE_OFFSETS[tz]
+        start = self.week_start
+
+        def offset(minute: int) -> int:
+            dt = (start + timedelta(minutes=minute)).astimezone(zone)
+            return int(dt.utcoffset().total_seconds() // 60)
+
+        # A week and a day, so local slots late on Sunday east of UTC still
+        # land inside the table. Changes fall on the hour or half hour in
+        # every zone we offer; probe hourly, then find the exact minute.
+        table = [(-DAY, offset(-DAY))]
+        for hour in range(-23, (WEEK + DAY) // 60 + 1):
+            minute = hour * 60
+            if (current := offset(minute)) != table[-1][1]:
+                lo, hi = minute - 60, minute
+                while hi - lo > 1:
+                    mid = (lo + hi) // 2
+                    if offset(mid) == current:
+                        hi = mid
+                    else:
+                        lo = mid
+                table.append((hi, current))
+
+        return table
+
+################################################################################
+    def _table(self, tz: Timezone) -> List[Tuple[int, int]]:
+
+        self.week_start  # Drops last week's tables.
+        table = self._offsets.get(tz)
+        if table is None:
+            table = self._offsets[tz] = self._build(tz)
+
+        return table
+
+################################################################################
+    def utc_offset(self, tz: Timezone, utc_minute: int) -> int:
+        """``tz``'s offset from UTC, in minutes, at a UTC minute of this week."""
+
+        table = self._table(tz)
+        return table[max(bisect_right(table, (utc_minute, float("inf"))) - 1, 0)][1]
+
+################################################################################
+    def to_utc(self, tz: Timezone, day: Union[Weekday, int], t: time) -> int:
+        """The UTC minute of week for ``t`` on ``day`` in ``tz``."""
+
+        local = self.minute_of_week(day, t)
+        # Local minus the offset in force at that instant; the offset is
+        # looked up at the standard-time guess first, as pytz does.
+        offset = self.utc_offset(tz, local - self.utc_offset(tz, local))
+
+        return local - offset
+
+################################################################################
+    def utc_minute(self, day: Union[Weekday, int], t: time) -> int:
+        """Like ``minute_of_week``, but a ``t`` carrying a zone is converted
+        to UTC first."""
+
+        if t.tzinfo is None:
+            return self.minute_of_week(day, t)
+
+        tz = self._zones.get(str(t.tzinfo))
+        if tz is not None:
+            return self.to_utc(tz, day, t.replace(tzinfo=None))
+
+        return self._to_utc_slow(t.tzinfo, day, t)
+
+################################################################################
+    def _to_utc_slow(self, zone: tzinfo, day: Union[Weekday, int], t: time) -> int:
+
+        local = self.minute_of_week(day, t)
+        offset = zone.utcoffset(
+            (self.week_start + timedelta(minutes=local)).replace(tzinfo=None)
+        )
+
+        return local - int(offset.total_seconds() // 60) if offset is not None else local
+
+################################################################################
+    def timestamp(self, minute: int, style: TimestampStyle = "t") -> str:
+        """The Discord timestamp for a UTC minute of this week."""
+
+        week_start = self.week_start
+        key = (minute % WEEK, style)
+        stamp = self._stamps.get(key)
+        if stamp is None:
+            stamp = self._stamps[key] = Utilities.format_dt(
+                week_start + timedelta(minutes=key[0]), style
+            )
+
+        return stamp
+
+################################################################################
+    def slot_timestamp(self, day: Union[Weekday, int], t: time, style: TimestampStyle = "t") -> str:
+
+        return self.timestamp(self.utc_minute(day, t), style)
+
+################################################################################
+
+time_tables = _TimeTables()
+
+################################################################################
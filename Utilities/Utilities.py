@@ -6,7 +6,6 @@ from datetime import datetime, time, timezone
 from typing import Any, List, Optional, Tuple, Union, Literal
 
 import pytz
-import requests
 from discord import Colour, Embed, EmbedField, NotFound, Interaction
 from discord.abc import Mentionable
 from dotenv import load_dotenv
@@ -452,6 +451,8 @@ class Utilities:
         
         load_dotenv()
         
+        import requests
+        
         key = os.getenv("CUTTLY_API_KEY")
         r = requests.get("https://cutt.ly/api/api.php?key={}&short={}".format(key, long_url))
         
@@ -3,11 +3,17 @@ from .Enums import *
 from .Errors import *
 
 # Modules
+from .AttachmentURLs import attachment_urls
+from .Autocomplete import *
 from .Colors import FroggeColor
 from .DTOperations import DTOperations
 from .FroggeLog import log
+from .GatewayProfile import *
 from .Helpers import *
 from .LogColors import LOG_COLORS
+from .Metrics import metrics
 from .NotSet import NS
+from .Sharding import *
+from .TimeTables import time_tables
 from .Utilities import *
 ################################################################################
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import os
 
-from discord import Intents
 from dotenv import load_dotenv
 
-from Classes.Bot import StaffPartyBot
+from Classes.Bot import StaffPartyBot, ShardedStaffPartyBot
+from Utilities import gateway_options, shard_options
 ################################################################################
 
 load_dotenv()
@@ -17,10 +17,15 @@ if os.getenv("DEBUG") == "True":
 else:
     debug_guilds = None
     
-bot = StaffPartyBot(
+# Sharded across processes when SHARDING is on - see Utilities/Sharding.py.
+sharding = shard_options()
+bot_cls = StaffPartyBot if sharding is None else ShardedStaffPartyBot
+
+bot = bot_cls(
     description="Toot toot, bitches!",
-    intents=Intents.all(),
-    debug_guilds=debug_guilds
+    debug_guilds=debug_guilds,
+    **gateway_options(),
+    **(sharding or {})
 )
 
 ################################################################################